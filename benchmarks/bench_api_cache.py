@@ -0,0 +1,110 @@
+"""Cost of rerunning a page that reads the same API endpoints every time.
+
+Serves a stand-in store with WORKPLANS work plans (2 ms per request) and
+replays RERUNS reruns of a page that reads employees, field_teams, workplans
+and dashboard_metrics (which the stand-in does not have, as on the tracer
+page). Three clients are compared:
+- no cache: every read is a full 200 (or 404)
+- revalidate: TTL 0, so every read is a conditional GET answered with a 304
+- cached: the per-endpoint TTLs, so reads after the first never reach the server
+A PUT through the cached client must be visible on the next read, and a
+cache with a small byte budget must stay under it.
+
+Run from the repository root:
+
+    python benchmarks/bench_api_cache.py
+"""
+import logging
+import sys
+import threading
+import time
+import warnings
+from collections import Counter
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+WORKPLANS = 2_000
+RERUNS = 200
+SERVER_DELAY_SECONDS = 0.002
+PAGE_ENDPOINTS = ("employees", "field_teams", "workplans", "dashboard_metrics")
+SMALL_BUDGET_BYTES = 64 * 1024
+
+
+def main():
+    logging.disable(logging.WARNING)
+    warnings.filterwarnings("ignore")
+    sys.path.insert(0, str(REPO_ROOT))
+    from pmu_tracker.api_cache import ResponseCache
+    from pmu_tracker.api_client import ApiClient, ApiError
+    from pmu_tracker.api_server import MockApiHandler, start_api_server
+    from pmu_tracker.mock_api import MOCK_API_SEED, MockApiStore
+
+    seed = dict(MOCK_API_SEED, workplans=[
+        {"id": i, "title": f"Work plan {i}", "details": "x" * 100, "status": "Not Started", "supervisor_id": i % 50}
+        for i in range(1, WORKPLANS + 1)
+    ])
+    statuses, body_bytes = Counter(), Counter()
+    lock = threading.Lock()
+
+    class CountingHandler(MockApiHandler):
+        def send_response(self, code, message=None):
+            with lock:
+                statuses[code] += 1
+            super().send_response(code, message)
+
+        def send_header(self, keyword, value):
+            if keyword == "Content-Length":
+                with lock:
+                    body_bytes["total"] += int(value)
+            super().send_header(keyword, value)
+
+        def _get(self, endpoint, item_id, params):
+            time.sleep(SERVER_DELAY_SECONDS)
+            super()._get(endpoint, item_id, params)
+
+    server = start_api_server(store=MockApiStore(seed), handler=CountingHandler)
+
+    def rerun(client):
+        for endpoint in PAGE_ENDPOINTS:
+            try:
+                client.get(endpoint)
+            except ApiError:
+                pass
+
+    clients = {
+        "no cache": ApiClient(server.base_url),
+        "revalidate": ApiClient(server.base_url, cache=ResponseCache(ttls={}, default_ttl=0, error_ttl=0)),
+        "cached": ApiClient(server.base_url, cache=ResponseCache()),
+    }
+    print(f"{'client':<10}  {'ms/rerun':>8}  {'200':>5}  {'304':>5}  {'404':>5}  {'KiB sent':>8}")
+    for name, client in clients.items():
+        statuses.clear()
+        body_bytes.clear()
+        start = time.perf_counter()
+        for _ in range(RERUNS):
+            rerun(client)
+        elapsed = (time.perf_counter() - start) / RERUNS
+        print(f"{name:<10}  {elapsed * 1e3:>8.2f}  {statuses[200]:>5}  {statuses[304]:>5}  {statuses[404]:>5}  {body_bytes['total'] / 1024:>8.0f}")
+        if name == "revalidate":
+            assert statuses[200] == 3 and statuses[304] == 3 * (RERUNS - 1), f"expected 304s after the first rerun, got {dict(statuses)}"
+        if name == "cached":
+            assert sum(statuses.values()) == len(PAGE_ENDPOINTS), f"cached reruns reached the server: {dict(statuses)}"
+
+    cached = clients["cached"]
+    cached.put("workplans", {"id": 1, "status": "Completed"})
+    assert cached.get("workplans")["data"][0]["status"] == "Completed", "PUT did not invalidate the cached list"
+
+    small = ApiClient(server.base_url, cache=ResponseCache(max_bytes=SMALL_BUDGET_BYTES))
+    for supervisor_id in range(50):
+        small.get("workplans", {"supervisor_id": supervisor_id})
+    stats = small.cache.stats()
+    print(f"\n{SMALL_BUDGET_BYTES // 1024} KiB budget: {stats['entries']} entries, {stats['bytes'] / 1024:.0f} KiB, {stats['evictions']} evictions")
+    assert stats["bytes"] <= SMALL_BUDGET_BYTES and stats["evictions"] > 0, "byte budget not enforced"
+
+    for client in (*clients.values(), small):
+        client.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Latency of API calls under concurrent load: bare requests.get vs ApiClient.
+
+Starts the local stand-in API server with a small per-request delay and a 503
+on every FAIL_EVERY-th request, then has 1, 8 and 32 threads issue filtered
+GETs. The bare path opens a new connection per call and gives up on the first
+503, the way the app used to call requests.get; ApiClient reuses pooled
+keep-alive connections and retries with backoff, so it must finish the run
+without errors. Finally times the tracer-style read of four endpoints one after
+another against a single get_many batch.
+
+Run from the repository root:
+
+    python benchmarks/bench_api_client.py
+"""
+import itertools
+import logging
+import sys
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CONCURRENCY = (1, 8, 32)
+REQUESTS_PER_THREAD = 50
+SERVER_DELAY_SECONDS = 0.002
+FAIL_EVERY = 25
+BATCH_ENDPOINTS = ("employees", "field_teams", "workplans", "targets")
+BATCHES = 50
+STATUSES = ("Not Started", "In Progress", "Completed")
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def load(call, threads):
+    """Run REQUESTS_PER_THREAD calls on each of ``threads`` threads; (latencies, errors, wall seconds)."""
+    def worker(offset):
+        latencies, errors = [], 0
+        for i in range(REQUESTS_PER_THREAD):
+            start = time.perf_counter()
+            if not call({"status": STATUSES[(offset + i) % len(STATUSES)]}):
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+        return latencies, errors
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(worker, range(threads)))
+    wall = time.perf_counter() - start
+    return [l for latencies, _ in results for l in latencies], sum(errors for _, errors in results), wall
+
+
+def main():
+    logging.disable(logging.WARNING)
+    warnings.filterwarnings("ignore")
+    sys.path.insert(0, str(REPO_ROOT))
+    import requests
+    from pmu_tracker.api_client import API_TIMEOUT, ApiClient, ApiError, create_http_session
+    from pmu_tracker.api_server import MockApiHandler, start_api_server
+
+    counter = itertools.count(1)
+
+    class SlowFlakyHandler(MockApiHandler):
+        def _get(self, endpoint, item_id, params):
+            time.sleep(SERVER_DELAY_SECONDS)
+            if next(counter) % FAIL_EVERY == 0:
+                return self._error(503, "Temporarily unavailable.")
+            super()._get(endpoint, item_id, params)
+
+    server = start_api_server(handler=SlowFlakyHandler)
+    client = ApiClient(server.base_url, session=create_http_session(pool_size=max(CONCURRENCY)))
+
+    def bare_get(params):
+        try:
+            return requests.get(f"{server.base_url}/workplans", params=params, timeout=API_TIMEOUT).ok
+        except requests.RequestException:
+            return False
+
+    def client_get(params):
+        try:
+            return client.get("workplans", params)["status"] == "success"
+        except ApiError:
+            return False
+
+    print(f"{'threads':>7}  {'path':<7}  {'p50 ms':>7}  {'p95 ms':>7}  {'p99 ms':>7}  {'req/s':>7}  {'errors':>6}")
+    for threads in CONCURRENCY:
+        for name, call in (("bare", bare_get), ("pooled", client_get)):
+            latencies, errors, wall = load(call, threads)
+            print(
+                f"{threads:>7}  {name:<7}  {percentile(latencies, 50) * 1e3:>7.2f}  {percentile(latencies, 95) * 1e3:>7.2f}"
+                f"  {percentile(latencies, 99) * 1e3:>7.2f}  {len(latencies) / wall:>7.0f}  {errors:>6}"
+            )
+            if name == "pooled":
+                assert errors == 0, f"pooled client surfaced {errors} errors that retries should have absorbed"
+
+    start = time.perf_counter()
+    for _ in range(BATCHES):
+        sequential = [client.get(endpoint) for endpoint in BATCH_ENDPOINTS]
+    sequential_s = (time.perf_counter() - start) / BATCHES
+    start = time.perf_counter()
+    for _ in range(BATCHES):
+        batched = client.get_many((endpoint, None) for endpoint in BATCH_ENDPOINTS)
+    batched_s = (time.perf_counter() - start) / BATCHES
+    print(f"\n{len(BATCH_ENDPOINTS)} endpoints: sequential {sequential_s * 1e3:.2f} ms, get_many {batched_s * 1e3:.2f} ms")
+    assert [body["data"] for body in batched] == [body["data"] for body in sequential], "batched results differ"
+    assert batched_s < sequential_s, "get_many was not faster than sequential GETs"
+
+    client.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
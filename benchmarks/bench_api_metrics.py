@@ -0,0 +1,64 @@
+"""Overhead of recording API calls, and of summarising the ring buffer.
+
+Records CALLS synthetic calls into an ApiMetrics buffer, with and without the
+JSONL sink, and times the per-endpoint summary and latency histogram the stats
+panel renders over a full buffer. Recording must stay a small fraction of even
+a cache-hit API call, and the sink must write every record.
+
+Run from the repository root:
+
+    python benchmarks/bench_api_metrics.py
+"""
+import logging
+import random
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CALLS = 100_000
+ENDPOINTS = ("employees", "field_teams", "workplans", "targets", "dashboard_metrics")
+RECORD_BUDGET_US = 50
+
+
+def main():
+    logging.disable(logging.WARNING)
+    warnings.filterwarnings("ignore")
+    sys.path.insert(0, str(REPO_ROOT))
+    from pmu_tracker.api_metrics import ApiCallRecord, ApiMetrics, JsonlSink
+
+    rng = random.Random(0)
+    records = [
+        ApiCallRecord(time.time(), "GET", rng.choice(ENDPOINTS), rng.choice((200, 200, 200, 304, 404)),
+                      rng.lognormvariate(1, 1), 0, rng.randrange(100, 5000), rng.choice(("hit", "miss", "revalidated")))
+        for _ in range(CALLS)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "api_calls.jsonl"
+        print(f"{'buffer':<12}  {'us/record':>9}")
+        for name, metrics in (("memory", ApiMetrics()), ("memory+jsonl", ApiMetrics(sink=JsonlSink(str(log_path))))):
+            start = time.perf_counter()
+            for record in records:
+                metrics.record(record)
+            if metrics.sink is not None:
+                metrics.sink.flush()
+            per_record_us = (time.perf_counter() - start) / CALLS * 1e6
+            print(f"{name:<12}  {per_record_us:>9.2f}")
+            assert per_record_us < RECORD_BUDGET_US, f"recording took {per_record_us:.1f} us per call"
+        lines = log_path.read_text(encoding="utf-8").count("\n")
+        assert lines == CALLS, f"sink wrote {lines} of {CALLS} records"
+
+    start = time.perf_counter()
+    stats = metrics.summary()
+    histogram = metrics.latency_histogram()
+    panel_ms = (time.perf_counter() - start) * 1e3
+    print(f"\nstats panel over {len(metrics)} buffered calls: {panel_ms:.2f} ms")
+    print(f"slowest p95: /{stats[0].endpoint} {stats[0].p95_ms:.1f} ms; histogram {sum(histogram.values())} calls")
+    assert sum(s.calls for s in stats) == sum(histogram.values()) == len(metrics)
+
+
+if __name__ == "__main__":
+    main()
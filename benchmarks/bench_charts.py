@@ -0,0 +1,60 @@
+"""Plotly payload size of the live dashboard's daily yield chart.
+
+Builds the chart for 1, 10 and 100 years of daily rollup rows, once as the
+full px.line it used to be and once through time_series_figure(), and
+reports the serialized figure size and build time. The downsampled payload
+must stay the same size once the series passes the point budget.
+
+Run from the repository root:
+
+    python benchmarks/bench_charts.py
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+YEARS = (1, 10, 100)
+
+
+def daily_frame(charts, days, seed=0):
+    rng = charts.np.random.default_rng(seed)
+    return charts.pd.DataFrame({
+        "Date": charts.pd.date_range("2000-01-01", periods=days, freq="D"),
+        "Yield per Cow (L)": 500 + rng.normal(0, 25, days).cumsum(),
+    })
+
+
+def measure(build):
+    start = time.perf_counter()
+    payload = build().to_json()
+    return len(payload), time.perf_counter() - start
+
+
+def main():
+    logging.disable(logging.WARNING)
+    warnings.filterwarnings("ignore")
+    os.chdir(tempfile.mkdtemp(prefix="pmu_bench_"))
+    sys.path.insert(0, str(REPO_ROOT))
+    import plotly.express as px
+    from pmu_tracker import charts
+
+    print(f"{'days':>7}  {'full KB':>8}  {'full s':>7}  {'bounded KB':>10}  {'bounded s':>9}")
+    bounded_sizes = []
+    for years in YEARS:
+        frame = daily_frame(charts, years * 365)
+        full_size, full_elapsed = measure(lambda: px.line(frame, x="Date", y="Yield per Cow (L)", markers=True))
+        size, elapsed = measure(lambda: charts.time_series_figure(frame, "Date", "Yield per Cow (L)", "Daily Total Yield Trend"))
+        if len(frame) > charts.CHART_POINT_BUDGET:
+            bounded_sizes.append(size)
+        print(f"{len(frame):>7}  {full_size / 1024:>8.0f}  {full_elapsed:>7.3f}  {size / 1024:>10.0f}  {elapsed:>9.3f}")
+
+    assert max(bounded_sizes) < 1.1 * min(bounded_sizes), f"downsampled payload grows with history: {bounded_sizes}"
+
+
+if __name__ == "__main__":
+    main()
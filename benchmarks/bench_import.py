@@ -0,0 +1,82 @@
+"""Import cost of the app entry point and of each page module.
+
+Runs ``python -X importtime`` in a fresh interpreter per page: streamlit is
+imported first, then the modules PMU.py needs to show the login screen, then
+the page module, and the cumulative import time of each step is reported
+along with which heavy libraries it pulled in. The entry point and the
+lightweight pages (team chat, settings, email) must not load any of them.
+
+Run from the repository root:
+
+    python benchmarks/bench_import.py
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RUNS = 3
+ENTRY_MODULES = ("pmu_tracker.auth", "pmu_tracker.bootstrap", "pmu_tracker.ui", "pmu_tracker.pages")
+HEAVY_MODULES = ("pandas", "numpy", "plotly.express", "requests", "PIL.Image")
+LIGHT_PAGES = ("chat", "settings", "mail")
+
+
+def import_groups(modules):
+    """Import ``modules`` in order under -X importtime.
+
+    Returns {module: (cumulative seconds, names it imported)}; importtime
+    prints nested imports before the top-level one that triggered them.
+    """
+    code = "; ".join(f"import {module}" for module in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=tempfile.gettempdir(), capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": str(REPO_ROOT)},
+    )
+    groups, pending = {}, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        pending.add(name.strip())
+        if not name.startswith("  ", 1):
+            groups[name.strip()] = (int(cumulative) / 1e6, pending)
+            pending = set()
+    return groups
+
+
+def page_modules():
+    return sorted(path.stem for path in (REPO_ROOT / "pmu_tracker" / "pages").glob("*.py") if path.stem != "__init__")
+
+
+def measure(page):
+    """Best-of-RUNS cost of streamlit, the entry modules and ``page``."""
+    modules = ("streamlit",) + ENTRY_MODULES + (f"pmu_tracker.pages.{page}",)
+    best = None
+    for _ in range(RUNS):
+        groups = import_groups(modules)
+        costs = [groups[module][0] for module in modules]
+        loaded = [set().union(*(groups[module][1] for module in modules[1:-1])), groups[modules[-1]][1]]
+        if best is None or sum(costs) < sum(best[0]):
+            best = (costs, loaded)
+    costs, (entry_loaded, page_loaded) = best
+    return costs[0], sum(costs[1:-1]), costs[-1], entry_loaded, page_loaded
+
+
+def main():
+    print(f"{'page':<16}  {'streamlit ms':>12}  {'entry ms':>8}  {'page ms':>8}  heavy imports")
+    for page in page_modules():
+        streamlit_s, entry_s, page_s, entry_loaded, page_loaded = measure(page)
+        heavy = [module for module in HEAVY_MODULES if module in page_loaded]
+        print(f"{page:<16}  {streamlit_s * 1e3:>12.0f}  {entry_s * 1e3:>8.0f}  {page_s * 1e3:>8.0f}  {', '.join(heavy) or '-'}")
+
+        entry_heavy = [module for module in HEAVY_MODULES if module in entry_loaded]
+        assert not entry_heavy, f"the login screen imports {entry_heavy}"
+        if page in LIGHT_PAGES:
+            assert not heavy, f"pages.{page} imports {heavy}"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Cost of serving the login screen as the employee table grows.
+
+Seeds a scratch database with 100, 1k and 10k employees and times one login
+page render's worth of work: the old path loaded every Employee row to fill
+the email selectbox, the new one searches the cached EmailDirectory by
+prefix. The new path must not issue any query once the directory is built,
+and must stay within a small factor of its 100-employee time.
+
+Run from the repository root:
+
+    python benchmarks/bench_login.py
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+EMPLOYEE_COUNTS = (100, 1_000, 10_000)
+RENDERS = 200
+PREFIX = "employee0004"
+
+
+def seed(SessionLocal, Employee, count):
+    from sqlalchemy import delete, insert
+
+    with SessionLocal() as db:
+        db.execute(delete(Employee))
+        db.execute(insert(Employee), [
+            {"name": f"Employee {i}", "email": f"employee{i:05d}@example.org", "password": "x"}
+            for i in range(count)
+        ])
+        db.commit()
+
+
+def timed(render):
+    start = time.perf_counter()
+    for _ in range(RENDERS):
+        options = render()
+    return (time.perf_counter() - start) / RENDERS, options
+
+
+def main():
+    logging.disable(logging.WARNING)
+    warnings.filterwarnings("ignore")
+    os.chdir(tempfile.mkdtemp(prefix="pmu_bench_"))
+    sys.path.insert(0, str(REPO_ROOT))
+    from pmu_tracker.auth import email_directory
+    from pmu_tracker.bootstrap import create_and_preload_db
+    from pmu_tracker.db import QueryCounter, SessionLocal
+    from pmu_tracker.models import Employee
+
+    create_and_preload_db()
+
+    def legacy_render():
+        with SessionLocal() as db:
+            return [u.email for u in db.query(Employee).all()]
+
+    print(f"{'employees':>9}  {'legacy ms':>9}  {'options':>7}  {'directory ms':>12}  {'options':>7}  {'queries':>7}")
+    baseline = None
+    for count in EMPLOYEE_COUNTS:
+        seed(SessionLocal, Employee, count)
+        email_directory.clear()
+        email_directory()
+        legacy_s, legacy_options = timed(legacy_render)
+        with QueryCounter() as counter:
+            directory_s, options = timed(lambda: email_directory().search(PREFIX))
+        print(f"{count:>9}  {legacy_s * 1e3:>9.2f}  {len(legacy_options):>7}  {directory_s * 1e3:>12.4f}  {len(options):>7}  {counter.count:>7}")
+
+        assert counter.count == 0, f"login render issued {counter.count} queries"
+        baseline = baseline or directory_s
+        assert directory_s < 5 * baseline, f"prefix search slowed from {baseline:.6f}s to {directory_s:.6f}s"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Latency of filtered GETs, PUTs and DELETEs on the mock API store.
+
+Fills the workplans endpoint with 1k, 10k and 100k items and times the same
+mixed workload against the per-session list scans the mock API used to do
+and against MockResource. Both must return the same items in the same
+order.
+
+Run from the repository root:
+
+    python benchmarks/bench_mock_api.py
+"""
+import logging
+import random
+import sys
+import time
+import warnings
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ITEM_COUNTS = (1_000, 10_000, 100_000)
+OPERATIONS = 1_000
+SUPERVISORS = 50
+STATUSES = ("Not Started", "In Progress", "Completed")
+
+
+class LegacyResource:
+    """The list-backed endpoint api_get/api_put/api_delete used to work on."""
+
+    def __init__(self, items):
+        self.items = [dict(item) for item in items]
+
+    def query(self, params):
+        return [item for item in self.items if all(str(item.get(k)) == str(v) for k, v in params.items())]
+
+    def put(self, item_id, data):
+        for item in self.items:
+            if item["id"] == item_id:
+                item.update(data)
+                return item
+        return None
+
+    def delete(self, item_id):
+        initial_len = len(self.items)
+        self.items = [item for item in self.items if item["id"] != item_id]
+        return len(self.items) < initial_len
+
+
+def make_items(count, rng):
+    return [
+        {"id": i, "title": f"Work plan {i}", "status": rng.choice(STATUSES), "supervisor_id": rng.randrange(SUPERVISORS)}
+        for i in range(1, count + 1)
+    ]
+
+
+def make_operations(count, rng):
+    operations = []
+    for _ in range(OPERATIONS):
+        roll = rng.random()
+        if roll < 0.8:
+            operations.append(("get", {"supervisor_id": rng.randrange(SUPERVISORS), "status": rng.choice(STATUSES)}))
+        elif roll < 0.95:
+            operations.append(("put", rng.randrange(1, count + 1), {"status": rng.choice(STATUSES)}))
+        else:
+            operations.append(("delete", rng.randrange(1, count + 1)))
+    return operations
+
+
+def run(resource, operations):
+    results = []
+    start = time.perf_counter()
+    for operation in operations:
+        if operation[0] == "get":
+            results.append([item["id"] for item in resource.query(operation[1])])
+        elif operation[0] == "put":
+            resource.put(operation[1], operation[2])
+        else:
+            resource.delete(operation[1])
+    return time.perf_counter() - start, results
+
+
+def main():
+    logging.disable(logging.WARNING)
+    warnings.filterwarnings("ignore")
+    sys.path.insert(0, str(REPO_ROOT))
+    from pmu_tracker.mock_api import MockResource
+
+    print(f"{'items':>7}  {'legacy ms/op':>12}  {'indexed ms/op':>13}  {'speed-up':>8}")
+    for count in ITEM_COUNTS:
+        rng = random.Random(count)
+        items = make_items(count, rng)
+        operations = make_operations(count, rng)
+        legacy_s, legacy_results = run(LegacyResource(items), operations)
+        indexed_s, indexed_results = run(MockResource(items), operations)
+        assert indexed_results == legacy_results, "indexed store disagrees with the list scan"
+        print(f"{count:>7}  {legacy_s / OPERATIONS * 1e3:>12.3f}  {indexed_s / OPERATIONS * 1e3:>13.3f}  {legacy_s / indexed_s:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Query count and latency of the weekly summary in reports().
+
+Seeds a scratch database with 10k and 100k work plans and targets, then builds
+the summary with the old per-row relationship access and with the joined
+projection that reports() streams through export_report(). The export path
+must issue the same number of SQL statements at every size.
+
+Run from the repository root:
+
+    python benchmarks/bench_reports.py
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+import warnings
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ROW_COUNTS = (10_000, 100_000)
+ROWS_PER_EMPLOYEE = 10
+
+
+def legacy_summary(app, db):
+    """The summary as reports() used to build it, lazy-loading each assignee."""
+    rows = []
+    for wp in db.query(app.WorkPlan).all():
+        rows.append({
+            "Type": "Work Plan",
+            "Item": wp.title,
+            "Description": wp.details,
+            "Deadline": wp.deadline.strftime('%Y-%m-%d'),
+            "Status": wp.status,
+            "Assigned To": wp.supervisor.name if wp.supervisor else "N/A",
+        })
+    for tgt in db.query(app.Target).all():
+        rows.append({
+            "Type": "Target",
+            "Item": tgt.description,
+            "Description": "",
+            "Deadline": tgt.deadline.strftime('%Y-%m-%d'),
+            "Status": tgt.status,
+            "Assigned To": tgt.employee.name if tgt.employee else "N/A",
+        })
+    return len(app.pd.DataFrame(rows))
+
+
+def export_summary(app, db):
+    """The summary as reports() builds it: the joined projection exported as CSV."""
+    export, _, row_count = app.export_report(app.weekly_summary_query(), "CSV")
+    export.close()
+    return row_count
+
+
+def seed(app, rows):
+    from sqlalchemy import delete, insert
+
+    employees = max(1, rows // ROWS_PER_EMPLOYEE)
+    with app.SessionLocal() as db:
+        for model in (app.WorkPlan, app.Target, app.Employee):
+            db.execute(delete(model))
+        db.execute(insert(app.Employee), [
+            {"id": i, "name": f"Employee {i}", "email": f"e{i}@example.org", "password": "x"}
+            for i in range(1, employees + 1)
+        ])
+        start = date(2025, 1, 1)
+        db.execute(insert(app.WorkPlan), [
+            {"title": f"Plan {i}", "details": "details", "deadline": start + timedelta(days=i % 365),
+             "status": "In Progress", "supervisor_id": i % employees + 1}
+            for i in range(rows)
+        ])
+        db.execute(insert(app.Target), [
+            {"description": f"Target {i}", "deadline": start + timedelta(days=i % 365),
+             "status": "Not Started", "employee_id": i % employees + 1}
+            for i in range(rows)
+        ])
+        db.commit()
+
+
+def measure(app, build):
+    with app.SessionLocal() as db, app.QueryCounter() as counter:
+        start = time.perf_counter()
+        produced = build(db)
+        elapsed = time.perf_counter() - start
+    return produced, counter.count, elapsed
+
+
+def main():
+    logging.disable(logging.WARNING)
+    warnings.filterwarnings("ignore")
+    os.chdir(tempfile.mkdtemp(prefix="pmu_bench_"))
+    sys.path.insert(0, str(REPO_ROOT))
+    from pmu_tracker.bootstrap import create_and_preload_db
+    from pmu_tracker.db import QueryCounter, SessionLocal
+    from pmu_tracker.models import Employee, Target, WorkPlan
+    from pmu_tracker.pages import reports
+
+    create_and_preload_db()
+    app = SimpleNamespace(
+        pd=reports.pd, export_report=reports.export_report, weekly_summary_query=reports.weekly_summary_query,
+        SessionLocal=SessionLocal, QueryCounter=QueryCounter,
+        Employee=Employee, WorkPlan=WorkPlan, Target=Target,
+    )
+
+    print(f"{'rows':>8}  {'path':<7}  {'queries':>7}  {'seconds':>8}")
+    export_counts = set()
+    for rows in ROW_COUNTS:
+        seed(app, rows)
+        for name, build in (("legacy", lambda db: legacy_summary(app, db)), ("export", lambda db: export_summary(app, db))):
+            produced, queries, elapsed = measure(app, build)
+            assert produced == 2 * rows, (name, produced)
+            if name == "export":
+                export_counts.add(queries)
+            print(f"{rows:>8}  {name:<7}  {queries:>7}  {elapsed:>8.2f}")
+
+    assert len(export_counts) == 1, f"exported summary query count varies with row count: {export_counts}"
+
+
+if __name__ == "__main__":
+    main()
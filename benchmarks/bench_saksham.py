@@ -0,0 +1,84 @@
+"""Throughput of the SAKSHAM seed requirement calculator on survey batches.
+
+Builds random batches of 1k, 10k and 100k surveys and times
+calculate_seed_requirements() and summarize_seed_requirements() on each,
+against the per-farmer scalar arithmetic the survey form used to run. The
+100k batch must finish in under a second.
+
+Run from the repository root:
+
+    python benchmarks/bench_saksham.py
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+import warnings
+from math import floor
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BATCH_SIZES = (1_000, 10_000, 100_000)
+TIME_BUDGET_SECONDS = 1.0
+
+
+def scalar_requirements(spacing_unit, row_spacing, plant_spacing, acres, mortality):
+    """One farmer's packets, as saksham_dashboard() used to compute them."""
+    if spacing_unit == "cm":
+        row_spacing /= 100
+        plant_spacing /= 100
+    total_plants = (1 / (row_spacing * plant_spacing)) * acres * 4046.86
+    required_packets = floor(total_plants * 0.70 / 5625)
+    effective_germination = 0.70 * (1 - mortality / 100)
+    gaps = total_plants - total_plants * (effective_germination + mortality / 100)
+    gap_packets = floor(gaps / effective_germination / 5625)
+    return required_packets, gap_packets
+
+
+def make_surveys(saksham, rows, seed=0):
+    rng = saksham.np.random.default_rng(seed)
+    return saksham.pd.DataFrame({
+        "farmer_id": [f"F{i:06d}" for i in range(rows)],
+        "state": rng.choice(list(saksham.GERMINATION_RATE_PER_ACRE), rows),
+        "spacing_unit": rng.choice(list(saksham.SPACING_UNITS), rows),
+        "row_spacing": rng.uniform(0.3, 120, rows),
+        "plant_spacing": rng.uniform(0.3, 90, rows),
+        "acres": rng.uniform(0.1, 20, rows),
+        "mortality": rng.uniform(0, 60, rows),
+    })
+
+
+def main():
+    logging.disable(logging.WARNING)
+    warnings.filterwarnings("ignore")
+    os.chdir(tempfile.mkdtemp(prefix="pmu_bench_"))
+    sys.path.insert(0, str(REPO_ROOT))
+    from pmu_tracker.pages import saksham
+
+    print(f"{'rows':>8}  {'scalar s':>9}  {'vector s':>9}  {'packets':>10}")
+    for rows in BATCH_SIZES:
+        surveys = make_surveys(saksham, rows)
+
+        start = time.perf_counter()
+        expected = [
+            scalar_requirements(*values)
+            for values in surveys[["spacing_unit", "row_spacing", "plant_spacing", "acres", "mortality"]].itertuples(index=False)
+        ]
+        scalar_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = saksham.calculate_seed_requirements(surveys)
+        summary = saksham.summarize_seed_requirements(results)
+        vector_elapsed = time.perf_counter() - start
+
+        assert results["required_packets"].astype(int).tolist() == [packets for packets, _ in expected]
+        assert results["gap_packets"].astype(int).tolist() == [gaps for _, gaps in expected]
+        packets = int(summary["required_packets"].sum())
+        print(f"{rows:>8}  {scalar_elapsed:>9.3f}  {vector_elapsed:>9.3f}  {packets:>10,}")
+
+    assert vector_elapsed < TIME_BUDGET_SECONDS, f"{BATCH_SIZES[-1]} surveys took {vector_elapsed:.2f}s"
+
+
+if __name__ == "__main__":
+    main()
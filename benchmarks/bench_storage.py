@@ -0,0 +1,131 @@
+"""Throughput of the pooled SQLite storage layer under concurrent sessions.
+
+Simulates N Streamlit sessions hitting the team chat and kanban board at the
+same time (mostly reads, one write in five) and compares the pooled WAL
+engines in pmu_tracker with the previous open-a-connection-per-call approach.
+
+Run from the repository root:
+
+    python benchmarks/bench_storage.py
+"""
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SESSION_COUNTS = (10, 50, 100)
+OPS_PER_SESSION = 50
+WRITE_EVERY = 5
+
+KANBAN_DDL = """
+    CREATE TABLE IF NOT EXISTS kanban (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        status TEXT NOT NULL,
+        task TEXT NOT NULL
+    )
+"""
+CHAT_DDL = """
+    CREATE TABLE IF NOT EXISTS chat (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user TEXT NOT NULL,
+        message TEXT NOT NULL,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+class LegacyStorage:
+    """The per-call sqlite3.connect() access pattern the app used before."""
+
+    def __init__(self, kanban_db, chat_db):
+        self.kanban_db = kanban_db
+        self.chat_db = chat_db
+
+    def get_kanban_board(self):
+        conn = sqlite3.connect(self.kanban_db)
+        conn.execute(KANBAN_DDL)
+        conn.commit()
+        rows = conn.execute("SELECT status, task FROM kanban").fetchall()
+        conn.close()
+        return rows
+
+    def get_team_chat(self):
+        conn = sqlite3.connect(self.chat_db)
+        conn.execute(CHAT_DDL)
+        conn.commit()
+        rows = conn.execute("SELECT user, message, timestamp FROM chat ORDER BY timestamp ASC LIMIT 50").fetchall()
+        conn.close()
+        return rows
+
+    def add_chat_message(self, user, message):
+        conn = sqlite3.connect(self.chat_db)
+        conn.execute("INSERT INTO chat (user, message) VALUES (?, ?)", (user, message))
+        conn.commit()
+        conn.close()
+
+
+def simulate_session(storage, session_id):
+    reads = writes = errors = 0
+    for i in range(OPS_PER_SESSION):
+        try:
+            if i % WRITE_EVERY == 0:
+                storage.add_chat_message(f"user{session_id}", f"message {i}")
+                writes += 1
+            else:
+                storage.get_team_chat()
+                storage.get_kanban_board()
+                reads += 1
+        except sqlite3.OperationalError:
+            errors += 1
+        except Exception as e:  # SQLAlchemy wraps the sqlite3 error
+            if "locked" not in str(e):
+                raise
+            errors += 1
+    return reads, writes, errors
+
+
+def run(storage, sessions):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as executor:
+        results = list(executor.map(lambda n: simulate_session(storage, n), range(sessions)))
+    elapsed = time.perf_counter() - start
+    reads = sum(r for r, _, _ in results)
+    writes = sum(w for _, w, _ in results)
+    errors = sum(e for _, _, e in results)
+    return reads / elapsed, writes / elapsed, errors
+
+
+def main():
+    logging.disable(logging.WARNING)
+    warnings.filterwarnings("ignore")
+    workdir = tempfile.mkdtemp(prefix="pmu_bench_")
+    os.chdir(workdir)
+    sys.path.insert(0, str(REPO_ROOT))
+    from pmu_tracker.bootstrap import create_and_preload_db
+    from pmu_tracker.pages.chat import add_chat_message, get_team_chat
+    from pmu_tracker.pages.dashboard import get_kanban_board
+
+    create_and_preload_db()
+    pooled = SimpleNamespace(get_kanban_board=get_kanban_board, get_team_chat=get_team_chat, add_chat_message=add_chat_message)
+    legacy = LegacyStorage(os.path.join(workdir, "legacy_kanban.db"), os.path.join(workdir, "legacy_chat.db"))
+    get_team_chat()
+    get_kanban_board()
+
+    print(f"{'sessions':>8}  {'layer':<8}  {'reads/s':>10}  {'writes/s':>10}  {'locked':>6}")
+    for sessions in SESSION_COUNTS:
+        for name, storage in (("legacy", legacy), ("pooled", pooled)):
+            reads, writes, errors = run(storage, sessions)
+            print(f"{sessions:>8}  {name:<8}  {reads:>10.0f}  {writes:>10.0f}  {errors:>6}")
+            if name == "pooled":
+                assert errors == 0, f"pooled layer hit {errors} 'database is locked' errors"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""PMU Tracker: the Streamlit app's database layer, shared helpers and pages.
+
+PMU.py is the entry point. It imports only what the login screen needs and
+loads a page's module the first time that page is opened (see
+pmu_tracker.pages), so pandas, Plotly and friends are paid for by the pages
+that use them rather than on every cold start.
+"""
@@ -0,0 +1,145 @@
+"""Conditional-request response cache for API GETs."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+
+# --- API Response Cache ---
+# ApiClient keeps GET bodies here together with their ETag/Last-Modified. An
+# entry younger than its endpoint's TTL is served without touching the
+# network; an older one is revalidated with If-None-Match/If-Modified-Since,
+# and a 304 renews it for another TTL. A 404 is remembered for at most
+# API_CACHE_ERROR_TTL_SECONDS, so a page asking for an endpoint the backend
+# does not have is not re-sent every rerun. Entries are evicted least recently
+# used once the cached bodies exceed API_CACHE_MAX_BYTES, and any POST, PUT or
+# DELETE to an endpoint drops all of that endpoint's entries. Cached bodies
+# are shared between callers and must not be modified.
+API_CACHE_TTLS = {
+    "employees": 300,
+    "field_teams": 30,
+    "workplans": 30,
+    "targets": 30,
+}
+API_CACHE_DEFAULT_TTL_SECONDS = 30
+API_CACHE_ERROR_TTL_SECONDS = 30
+API_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+CacheKey = Tuple[str, Any, Tuple[Tuple[str, str], ...]]
+
+def cache_key(endpoint: str, item_id=None, params: Optional[Dict[str, Any]] = None) -> CacheKey:
+    """Parameters are compared as strings, as the API itself compares them."""
+    return endpoint, item_id, tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+
+class CachedResponse:
+    """One cached GET: the success body, or the status and message of a 404."""
+
+    __slots__ = ("body", "error", "etag", "last_modified", "size", "expires_at")
+
+    def __init__(self, body: Optional[Dict[str, Any]], error: Optional[Tuple[int, str]], etag: Optional[str],
+                 last_modified: Optional[str], size: int, expires_at: float):
+        self.body = body
+        self.error = error
+        self.etag = etag
+        self.last_modified = last_modified
+        self.size = size
+        self.expires_at = expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+class ResponseCache:
+    """Thread-safe LRU of GET responses under a byte budget, with per-endpoint TTLs."""
+
+    def __init__(self, max_bytes: int = API_CACHE_MAX_BYTES, ttls: Optional[Dict[str, float]] = None,
+                 default_ttl: float = API_CACHE_DEFAULT_TTL_SECONDS, error_ttl: float = API_CACHE_ERROR_TTL_SECONDS):
+        self.max_bytes = max_bytes
+        self.ttls = dict(API_CACHE_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.error_ttl = error_ttl
+        self.bytes = 0
+        self.hits = self.revalidations = self.fetches = self.evictions = 0
+        self._entries: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def generation(self, endpoint: str) -> int:
+        """Take before sending a GET and pass to store(), so a write in between discards the reply."""
+        with self._lock:
+            return self._generations.get(endpoint, 0)
+
+    def lookup(self, key: CacheKey) -> Tuple[Optional[CachedResponse], bool]:
+        """``(entry, fresh)``; a stale entry is still returned so it can be revalidated."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+            self._entries.move_to_end(key)
+            fresh = entry.expires_at > time.monotonic()
+            if fresh:
+                self.hits += 1
+            return entry, fresh
+
+    def store(self, key: CacheKey, generation: int, body: Optional[Dict[str, Any]], size: int,
+              etag: Optional[str] = None, last_modified: Optional[str] = None,
+              error: Optional[Tuple[int, str]] = None) -> None:
+        endpoint = key[0]
+        ttl = self.ttl(endpoint) if error is None else min(self.ttl(endpoint), self.error_ttl)
+        with self._lock:
+            self.fetches += 1
+            if self._generations.get(endpoint, 0) != generation or size > self.max_bytes:
+                return
+            if ttl <= 0 and not (etag or last_modified):
+                return  # could neither be served nor revalidated
+            self._remove(key)
+            self._entries[key] = CachedResponse(body, error, etag, last_modified, size, time.monotonic() + ttl)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def renew(self, key: CacheKey, entry: CachedResponse) -> None:
+        """The server answered 304: serve ``entry`` for another TTL."""
+        with self._lock:
+            self.revalidations += 1
+            entry.expires_at = time.monotonic() + self.ttl(key[0])
+
+    def invalidate(self, endpoint: str) -> None:
+        """Drop every entry for ``endpoint``, including replies still in flight."""
+        with self._lock:
+            self._generations[endpoint] = self._generations.get(endpoint, 0) + 1
+            for key in [key for key in self._entries if key[0] == endpoint]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for endpoint in {key[0] for key in self._entries}:
+                self._generations[endpoint] = self._generations.get(endpoint, 0) + 1
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "fetches": self.fetches,
+                "evictions": self.evictions,
+            }
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
@@ -0,0 +1,273 @@
+"""Pooled HTTP client for the field-team REST API and other outbound fetches."""
+import streamlit as st
+import requests
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterable, Tuple, Union
+
+from pmu_tracker.api_cache import cache_key, CachedResponse, ResponseCache
+from pmu_tracker.api_metrics import api_metrics, ApiCallRecord, ApiMetrics
+from pmu_tracker.config import API_BASE_URL
+
+# --- HTTP Sessions ---
+# Outbound calls go through a requests.Session whose adapter keeps up to
+# API_POOL_SIZE keep-alive connections per host, so a rerun reuses sockets
+# instead of opening a new connection per request. Connection errors and
+# 429/5xx answers to idempotent methods are retried with exponential backoff
+# (API_BACKOFF_FACTOR * 2 ** retry seconds, honouring Retry-After); POST is
+# never retried, so a timed-out create cannot add the item twice. Every call
+# has a (connect, read) timeout.
+API_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+API_POOL_SIZE = 16
+API_RETRIES = 3
+API_BACKOFF_FACTOR = 0.2
+API_RETRY_STATUSES = (429, 500, 502, 503, 504)
+API_RETRY_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+API_BATCH_WORKERS = 8
+
+def create_http_session(pool_size: int = API_POOL_SIZE, retries: int = API_RETRIES, backoff_factor: float = API_BACKOFF_FACTOR) -> requests.Session:
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=API_RETRY_STATUSES,
+        allowed_methods=API_RETRY_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Shared by the photo and static asset caches. Pooled but never retried: those
+# fetches already fall back to a cached copy, and their (connect, read)
+# timeouts must bound how long a render can wait on an unreachable host.
+http_session = create_http_session(retries=0)
+
+# --- API Client ---
+class ApiError(Exception):
+    """An API call that failed: a transport error, or an error response (``status`` set)."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+def _success_body(method: str, endpoint: str, response: requests.Response) -> Dict[str, Any]:
+    """The decoded body of a successful response; raises ApiError for anything else."""
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+    if not response.ok or not isinstance(body, dict) or body.get("status") != "success":
+        message = body.get("message") if isinstance(body, dict) else None
+        raise ApiError(message or f"HTTP {response.status_code} from {method} /{endpoint}.", response.status_code)
+    return body
+
+class _Call:
+    """What one request() learned on the way, for its ApiCallRecord."""
+
+    __slots__ = ("status", "request_bytes", "response_bytes", "cache")
+
+    def __init__(self):
+        self.status: Optional[int] = None
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.cache: Optional[str] = None
+
+def _cached_result(entry: CachedResponse) -> Dict[str, Any]:
+    if entry.error is not None:
+        raise ApiError(entry.error[1], entry.error[0])
+    return entry.body
+
+class ApiClient:
+    """JSON client for one API base URL over a pooled, retrying session.
+
+    With a ``cache``, GETs are answered from it or revalidated against it (see
+    api_cache), and every other method invalidates the endpoint it wrote to.
+    With ``metrics``, every call is recorded there (see api_metrics).
+    """
+
+    def __init__(self, base_url: str, session: Optional[requests.Session] = None, timeout=API_TIMEOUT,
+                 batch_workers: int = API_BATCH_WORKERS, cache: Optional[ResponseCache] = None,
+                 metrics: Optional[ApiMetrics] = None):
+        self.base_url = base_url.rstrip("/")
+        self.session = session or create_http_session()
+        self.timeout = timeout
+        self.cache = cache
+        self.metrics = metrics
+        self._batch_executor = ThreadPoolExecutor(max_workers=batch_workers, thread_name_prefix="pmu-api")
+
+    def url(self, endpoint: str, item_id=None) -> str:
+        url = f"{self.base_url}/{endpoint}"
+        return url if item_id is None else f"{url}/{item_id}"
+
+    def request(self, method: str, endpoint: str, *, item_id=None, params: Optional[Dict[str, Any]] = None,
+                data: Optional[Dict[str, Any]] = None, timeout=None) -> Dict[str, Any]:
+        """Send one request and return the decoded success body; raises ApiError otherwise."""
+        call = _Call()
+        start = time.perf_counter()
+        try:
+            return self._request(call, method, endpoint, item_id, params, data, timeout)
+        except ApiError as e:
+            call.status = call.status or e.status
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.record(ApiCallRecord(
+                    time.time(), method, endpoint, call.status, (time.perf_counter() - start) * 1e3,
+                    call.request_bytes, call.response_bytes, call.cache,
+                ))
+
+    def _request(self, call: "_Call", method: str, endpoint: str, item_id, params, data, timeout) -> Dict[str, Any]:
+        if self.cache is None:
+            return _success_body(method, endpoint, self._send(call, method, endpoint, item_id, params, data, timeout))
+        if method == "GET":
+            return self._cached_get(call, endpoint, item_id, params, timeout)
+        try:
+            return _success_body(method, endpoint, self._send(call, method, endpoint, item_id, params, data, timeout))
+        finally:
+            # Even a failed or timed-out write may have been applied.
+            self.cache.invalidate(endpoint)
+
+    def _send(self, call: "_Call", method: str, endpoint: str, item_id, params, data, timeout, headers=None) -> requests.Response:
+        try:
+            response = self.session.request(
+                method, self.url(endpoint, item_id), params=params, json=data, headers=headers,
+                timeout=timeout or self.timeout,
+            )
+        except requests.RequestException as e:
+            raise ApiError(f"{method} /{endpoint} failed: {e}") from e
+        call.status = response.status_code
+        call.request_bytes = len(response.request.body or b"")
+        call.response_bytes = len(response.content)
+        return response
+
+    def _cached_get(self, call: "_Call", endpoint: str, item_id, params, timeout) -> Dict[str, Any]:
+        key = cache_key(endpoint, item_id, params)
+        cached, fresh = self.cache.lookup(key)
+        if fresh:
+            call.cache = "hit"
+            call.status = cached.error[0] if cached.error is not None else 200
+            return _cached_result(cached)
+        generation = self.cache.generation(endpoint)
+        try:
+            response = self._send(call, "GET", endpoint, item_id, params, None, timeout,
+                                  cached.conditional_headers() if cached is not None else None)
+        except ApiError:
+            if cached is not None and cached.body is not None:
+                call.cache = "stale"
+                return cached.body  # stale beats nothing while the backend is unreachable
+            raise
+        if response.status_code == 304 and cached is not None:
+            call.cache = "revalidated"
+            self.cache.renew(key, cached)
+            return _cached_result(cached)
+        call.cache = "miss"
+        try:
+            body = _success_body("GET", endpoint, response)
+        except ApiError as e:
+            if e.status == 404:
+                self.cache.store(key, generation, None, len(response.content), error=(e.status, str(e)))
+            raise
+        self.cache.store(
+            key, generation, body, len(response.content),
+            response.headers.get("ETag"), response.headers.get("Last-Modified"),
+        )
+        return body
+
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, timeout=None) -> Dict[str, Any]:
+        return self.request("GET", endpoint, params=params, timeout=timeout)
+
+    def post(self, endpoint: str, data: Dict[str, Any], timeout=None) -> Dict[str, Any]:
+        return self.request("POST", endpoint, data=data, timeout=timeout)
+
+    def put(self, endpoint: str, data: Dict[str, Any], timeout=None) -> Dict[str, Any]:
+        return self.request("PUT", endpoint, data=data, timeout=timeout)
+
+    def delete(self, endpoint: str, item_id, timeout=None) -> Dict[str, Any]:
+        return self.request("DELETE", endpoint, item_id=item_id, timeout=timeout)
+
+    def get_many(self, calls: Iterable[Tuple[str, Optional[Dict[str, Any]]]], timeout=None) -> List[Union[Dict[str, Any], ApiError]]:
+        """GET each ``(endpoint, params)`` concurrently; bodies (or the ApiError) in call order."""
+        futures = [self._batch_executor.submit(self.get, endpoint, params, timeout) for endpoint, params in calls]
+        results: List[Union[Dict[str, Any], ApiError]] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except ApiError as e:
+                results.append(e)
+        return results
+
+    def close(self):
+        self._batch_executor.shutdown(wait=False)
+        self.session.close()
+
+@st.cache_resource(show_spinner=False)
+def api_client() -> ApiClient:
+    """The process-wide client. Without PMU_API_BASE_URL it starts the local stand-in server."""
+    base_url = API_BASE_URL
+    if not base_url:
+        from pmu_tracker.api_server import start_api_server
+        base_url = start_api_server().base_url
+    return ApiClient(base_url, cache=ResponseCache(), metrics=api_metrics)
+
+# --- Page Helpers ---
+# What the pages call: the response body on success, or None after showing the
+# error. Calls are not announced on the page; see api_metrics for what was sent.
+def api_get(endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    try:
+        return api_client().get(endpoint, params)
+    except ApiError as e:
+        st.error(f"API GET Error on '{endpoint}': {e}")
+        return None
+
+def api_get_many(endpoints: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """GET several endpoints in one concurrent batch; endpoint -> body, or None on error."""
+    endpoints = list(endpoints)
+    bodies = {}
+    for endpoint, result in zip(endpoints, api_client().get_many((endpoint, None) for endpoint in endpoints)):
+        if isinstance(result, ApiError):
+            st.error(f"API GET Error on '{endpoint}': {result}")
+            result = None
+        bodies[endpoint] = result
+    return bodies
+
+def api_list(endpoint: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """An endpoint's items for filling a selector, without banners; empty on any error."""
+    try:
+        return api_client().get(endpoint, params)["data"]
+    except ApiError:
+        return []
+
+def api_post(endpoint: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    try:
+        body = api_client().post(endpoint, data)
+    except ApiError as e:
+        st.error(f"API POST Error on '{endpoint}': {e}")
+        return None
+    st.success(f"API: {body['message']}")
+    return body
+
+def api_put(endpoint: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if "id" not in data:
+        st.error("API Error: PUT request requires 'id' in data.")
+        return None
+    try:
+        body = api_client().put(endpoint, data)
+    except ApiError as e:
+        st.error(f"API PUT Error on '{endpoint}': {e}")
+        return None
+    st.success(f"API: {body['message']}")
+    return body
+
+def api_delete(endpoint: str, item_id: int) -> Optional[Dict[str, Any]]:
+    try:
+        body = api_client().delete(endpoint, item_id)
+    except ApiError as e:
+        st.error(f"API DELETE Error on '{endpoint}': {e}")
+        return None
+    st.success(f"API: {body['message']}")
+    return body
@@ -0,0 +1,147 @@
+"""In-process API call metrics: a ring buffer, latency percentiles and a JSONL sink."""
+import atexit
+import json
+import math
+import threading
+from collections import deque
+from typing import Optional, List, Dict, Any, NamedTuple
+
+from pmu_tracker.config import API_METRICS_LOG
+
+# --- API Call Metrics ---
+# ApiClient records every call, cache hits included, as an ApiCallRecord in a
+# process-wide ring buffer holding the last API_METRICS_CAPACITY calls. The
+# stats panel on the API Test Ground page summarises it per endpoint (p50, p95
+# and p99 latency, errors, bytes) and as a latency histogram. Recording is a
+# deque append under a lock, so calls pay no UI cost. With PMU_API_METRICS_LOG
+# set, records are also appended to that file as JSON lines, in batches, like
+# the SAKSHAM survey writer.
+API_METRICS_CAPACITY = 2048
+API_LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+API_METRICS_SINK_BATCH = 100
+API_METRICS_SINK_FLUSH_SECONDS = 2.0
+
+class ApiCallRecord(NamedTuple):
+    timestamp: float  # time.time() when the call finished
+    method: str
+    endpoint: str
+    status: Optional[int]  # None when no response arrived (connection error, timeout)
+    latency_ms: float
+    request_bytes: int
+    response_bytes: int  # body bytes received; 0 for cache hits and 304s
+    cache: Optional[str]  # "hit", "revalidated", "stale" or "miss"; None for uncached calls
+
+    @property
+    def is_error(self) -> bool:
+        return self.status is None or self.status >= 400
+
+class EndpointStats(NamedTuple):
+    method: str
+    endpoint: str
+    calls: int
+    errors: int
+    cache_hits: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    response_bytes: int
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a sorted, non-empty list."""
+    return sorted_values[max(1, math.ceil(pct / 100 * len(sorted_values))) - 1]
+
+class JsonlSink:
+    """Thread-safe buffer that appends records to a JSON-lines file in batches."""
+
+    def __init__(self, path: str, batch_size: int = API_METRICS_SINK_BATCH, flush_seconds: float = API_METRICS_SINK_FLUSH_SECONDS):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self._pending: List[ApiCallRecord] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def write(self, record: ApiCallRecord):
+        with self._lock:
+            self._pending.append(record)
+            full = len(self._pending) >= self.batch_size
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self.flush_seconds, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Append everything pending; return the number of lines written."""
+        with self._lock:
+            records, self._pending = self._pending, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not records:
+            return 0
+        lines = "".join(json.dumps(record._asdict()) + "\n" for record in records)
+        try:
+            with self._write_lock, open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+        except OSError:
+            return 0  # metrics are best-effort; never hold records for an unwritable file
+        return len(records)
+
+class ApiMetrics:
+    """The last ``capacity`` API calls, shared by every session in the process."""
+
+    def __init__(self, capacity: int = API_METRICS_CAPACITY, sink: Optional[JsonlSink] = None):
+        self.sink = sink
+        self._records: "deque[ApiCallRecord]" = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def record(self, record: ApiCallRecord):
+        with self._lock:
+            self._records.append(record)
+        if self.sink is not None:
+            self.sink.write(record)
+
+    def records(self) -> List[ApiCallRecord]:
+        with self._lock:
+            return list(self._records)
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+
+    def summary(self) -> List[EndpointStats]:
+        """Per (method, endpoint) stats over the buffer, slowest p95 first."""
+        groups: Dict[Any, List[ApiCallRecord]] = {}
+        for record in self.records():
+            groups.setdefault((record.method, record.endpoint), []).append(record)
+        stats = []
+        for (method, endpoint), records in groups.items():
+            latencies = sorted(record.latency_ms for record in records)
+            stats.append(EndpointStats(
+                method, endpoint, len(records),
+                sum(record.is_error for record in records),
+                sum(record.cache == "hit" for record in records),
+                percentile(latencies, 50), percentile(latencies, 95), percentile(latencies, 99), latencies[-1],
+                sum(record.response_bytes for record in records),
+            ))
+        return sorted(stats, key=lambda s: s.p95_ms, reverse=True)
+
+    def latency_histogram(self) -> Dict[str, int]:
+        """Call counts per latency bucket, from "≤ 1 ms" up to "> 1000 ms"."""
+        labels = [f"≤ {bound} ms" for bound in API_LATENCY_BUCKETS_MS] + [f"> {API_LATENCY_BUCKETS_MS[-1]} ms"]
+        counts = dict.fromkeys(labels, 0)
+        for record in self.records():
+            index = next((i for i, bound in enumerate(API_LATENCY_BUCKETS_MS) if record.latency_ms <= bound), len(API_LATENCY_BUCKETS_MS))
+            counts[labels[index]] += 1
+        return counts
+
+api_metrics = ApiMetrics(sink=JsonlSink(API_METRICS_LOG) if API_METRICS_LOG else None)
+if api_metrics.sink is not None:
+    atexit.register(api_metrics.sink.flush)
@@ -0,0 +1,215 @@
+"""Local HTTP stand-in for the field-team REST API, backed by mock_store."""
+import argparse
+import json
+import secrets
+import threading
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from pmu_tracker.mock_api import MockApiStore, POST_ENDPOINTS, mock_store
+
+# --- Local API Server ---
+# Serves a MockApiStore over HTTP/1.1 with keep-alive, so the pages go through
+# the same client path (pooled connections, timeouts, retries) a real backend
+# would. Routes:
+#   GET    /<endpoint>?field=value   items matching every parameter
+#   GET    /<endpoint>/<id>          one item
+#   POST   /<endpoint>               create an item (POST_ENDPOINTS only)
+#   PUT    /<endpoint>[/<id>]        merge the body into an item ("id" in the body if not in the path)
+#   DELETE /<endpoint>/<id>          delete an item
+# Every response is JSON: {"status": "success", "data"/"message": ...} or
+# {"status": "error", "message": ...}. Successful GETs carry an ETag (server
+# instance + resource version) and Last-Modified, and a GET whose
+# If-None-Match (or, failing that, If-Modified-Since) still matches gets an
+# empty 304 instead of the body.
+API_SERVER_HOST = "127.0.0.1"
+API_SERVER_BACKLOG = 128
+MAX_BODY_BYTES = 1024 * 1024
+
+class BadRequest(Exception):
+    pass
+
+def _parse_id(raw: str):
+    """Path ids are strings; stored ids are ints wherever the string is one."""
+    try:
+        return int(raw)
+    except ValueError:
+        return raw
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as two writes; with Nagle on, the body of a reply
+    # on a kept-alive connection waits for the client's delayed ACK (~40 ms).
+    disable_nagle_algorithm = True
+    server: "MockApiServer"
+
+    def log_message(self, format, *args):
+        pass  # one stderr line per request would drown the Streamlit log
+
+    def _route(self) -> Tuple[str, Optional[Any], Dict[str, str]]:
+        parts = urlsplit(self.path)
+        segments = [segment for segment in parts.path.split("/") if segment]
+        endpoint = segments[0] if segments else ""
+        item_id = _parse_id(segments[1]) if len(segments) > 1 else None
+        return endpoint, item_id, dict(parse_qsl(parts.query))
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True  # the unread body would corrupt the next request
+            raise BadRequest(f"Request body larger than {MAX_BODY_BYTES} bytes.")
+        raw = self.rfile.read(length) if length else b""
+        try:
+            data = json.loads(raw) if raw else {}
+        except ValueError:
+            raise BadRequest("Request body is not valid JSON.")
+        if not isinstance(data, dict):
+            raise BadRequest("Request body must be a JSON object.")
+        return data
+
+    def _send(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        payload = json.dumps(body, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _not_modified(self, etag: str, modified_at: float) -> bool:
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in tags or etag in tags or f"W/{etag}" in tags
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since:
+            try:
+                return int(modified_at) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def _error(self, status: int, message: str):
+        self._send(status, {"status": "error", "message": message})
+
+    def _dispatch(self, handler):
+        try:
+            handler(*self._route())
+        except BadRequest as e:
+            self._error(400, str(e))
+        except Exception as e:
+            self._error(500, f"{type(e).__name__}: {e}")
+
+    def do_GET(self):
+        self._dispatch(self._get)
+
+    def do_POST(self):
+        self._dispatch(self._post)
+
+    def do_PUT(self):
+        self._dispatch(self._put)
+
+    def do_DELETE(self):
+        self._dispatch(self._delete)
+
+    def _get(self, endpoint, item_id, params):
+        resource = self.server.store.resource(endpoint)
+        if resource is None:
+            return self._error(404, f"Endpoint '{endpoint}' not found.")
+        # Read the revision before the data: a write landing in between then
+        # only makes the ETag older than the body, which costs one extra 200.
+        version, modified_at = resource.revision()
+        etag = f'"{self.server.instance_id}-{version}"'
+        validators = {"ETag": etag, "Last-Modified": formatdate(modified_at, usegmt=True)}
+        if self._not_modified(etag, modified_at):
+            self.send_response(304)
+            for name, value in validators.items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+        if item_id is None:
+            return self._send(200, {"status": "success", "data": resource.query(params)}, validators)
+        item = resource.get(item_id)
+        if item is None:
+            return self._error(404, f"Item ID {item_id} not found in '{endpoint}'.")
+        self._send(200, {"status": "success", "data": item}, validators)
+
+    def _post(self, endpoint, item_id, params):
+        data = self._read_json()
+        resource = self.server.store.resource(endpoint)
+        if endpoint not in POST_ENDPOINTS or resource is None or item_id is not None:
+            return self._error(404, f"POST to unknown endpoint '{endpoint}'.")
+        label, name_field = POST_ENDPOINTS[endpoint]
+        new_item = resource.insert(data)
+        message = f"{label} '{new_item.get(name_field)}' added (ID: {new_item['id']})."
+        self._send(201, {"status": "success", "data": new_item, "message": message})
+
+    def _put(self, endpoint, item_id, params):
+        data = self._read_json()
+        if item_id is None:
+            if "id" not in data:
+                raise BadRequest("PUT request requires 'id' in data.")
+            item_id = data["id"]
+        resource = self.server.store.resource(endpoint)
+        if resource is None:
+            return self._error(404, f"Endpoint '{endpoint}' not found for PUT.")
+        try:
+            updated = resource.put(item_id, data)
+        except ValueError as e:
+            raise BadRequest(str(e)) from e
+        if updated is None:
+            return self._error(404, f"Item ID {item_id} not found in '{endpoint}'.")
+        self._send(200, {"status": "success", "data": updated, "message": f"Item ID {item_id} in '{endpoint}' updated."})
+
+    def _delete(self, endpoint, item_id, params):
+        if item_id is None:
+            raise BadRequest("DELETE request requires an item id in the path.")
+        resource = self.server.store.resource(endpoint)
+        if resource is None:
+            return self._error(404, f"Endpoint '{endpoint}' not found for DELETE.")
+        if not resource.delete(item_id):
+            return self._error(404, f"Item ID {item_id} not found in '{endpoint}'.")
+        self._send(200, {"status": "success", "message": f"Item ID {item_id} deleted from '{endpoint}'."})
+
+class MockApiServer(ThreadingHTTPServer):
+    """A threaded HTTP server for one MockApiStore; one thread per connection."""
+
+    daemon_threads = True
+    request_queue_size = API_SERVER_BACKLOG
+
+    def __init__(self, address: Tuple[str, int], store: MockApiStore, handler=MockApiHandler):
+        super().__init__(address, handler)
+        self.store = store
+        # Part of every ETag, so a restarted server never confirms a body it did not send.
+        self.instance_id = secrets.token_hex(4)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+def start_api_server(host: str = API_SERVER_HOST, port: int = 0, store: MockApiStore = mock_store, handler=MockApiHandler) -> MockApiServer:
+    """Serve ``store`` from a daemon thread; ``port=0`` picks a free port (see ``base_url``)."""
+    server = MockApiServer((host, port), store, handler)
+    threading.Thread(target=server.serve_forever, name="pmu-api-server", daemon=True).start()
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the mock field-team API over HTTP.")
+    parser.add_argument("--host", default=API_SERVER_HOST)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    server = MockApiServer((args.host, args.port), mock_store)
+    print(f"Serving the mock API on {server.base_url} (set PMU_API_BASE_URL to this to share it)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+"""On-disk caches for team photos and static images."""
+from datetime import datetime
+import os
+from PIL import Image, features
+from io import BytesIO
+from pathlib import Path
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Tuple
+
+from pmu_tracker.api_client import http_session
+from pmu_tracker.config import CACHE_DIR
+
+# --- Team Photo Cache ---
+# Thumbnails are stored content-addressed under .cache/team_photos/blobs and
+# indexed by a hash of the source URL. A process-wide LRU sits in front of the
+# disk cache so a warm dashboard render never touches the network.
+PHOTO_CACHE_DIR = CACHE_DIR / "team_photos"
+PHOTO_CACHE_TTL_SECONDS = 24 * 60 * 60
+PHOTO_FETCH_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+PHOTO_FETCH_WORKERS = 8
+PHOTO_THUMBNAIL_SIZE = (240, 240)
+PHOTO_LRU_SIZE = 128
+PHOTO_FAILURE_TTL_SECONDS = 5 * 60
+
+
+class PhotoLRU:
+    """Thread-safe LRU of thumbnail bytes shared by every session in the process.
+
+    A ``None`` value records a failed fetch so it is not retried on every rerun.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[Optional[bytes], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Tuple[bool, Optional[bytes]]:
+        """Return ``(hit, data)`` for ``url``."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return False, None
+            data, expires_at = entry
+            if expires_at < datetime.now().timestamp():
+                del self._entries[url]
+                return False, None
+            self._entries.move_to_end(url)
+            return True, data
+
+    def put(self, url: str, data: Optional[bytes], expires_at: float):
+        with self._lock:
+            self._entries[url] = (data, expires_at)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+photo_lru = PhotoLRU(PHOTO_LRU_SIZE)
+
+
+def normalize_photo_url(url: str) -> str:
+    """Turn Google Drive share links into direct download links."""
+    if "drive.google.com" in url and "uc?id=" not in url:
+        photo_id = url.split('/')[-2]
+        return f"https://drive.google.com/uc?id={photo_id}"
+    return url
+
+
+def _photo_index_path(url: str) -> Path:
+    return PHOTO_CACHE_DIR / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+
+def _photo_blob_path(digest: str) -> Path:
+    return PHOTO_CACHE_DIR / "blobs" / f"{digest}.jpg"
+
+
+def _read_photo_entry(url: str) -> Optional[Dict[str, Any]]:
+    index_path = _photo_index_path(url)
+    try:
+        entry = json.loads(index_path.read_text())
+        entry["data"] = _photo_blob_path(entry["digest"]).read_bytes()
+        return entry
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def atomic_write_bytes(path: Path, data: bytes):
+    """Write ``data`` to ``path`` via a temp file so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _write_photo_entry(url: str, data: bytes, etag: Optional[str], last_modified: Optional[str]) -> Dict[str, Any]:
+    digest = hashlib.sha256(data).hexdigest()
+    blob_path = _photo_blob_path(digest)
+    if not blob_path.exists():
+        atomic_write_bytes(blob_path, data)
+
+    entry = {
+        "url": url,
+        "digest": digest,
+        "etag": etag,
+        "last_modified": last_modified,
+        "fetched_at": datetime.now().timestamp(),
+    }
+    atomic_write_bytes(_photo_index_path(url), json.dumps(entry).encode())
+    entry["data"] = data
+    return entry
+
+
+def _make_thumbnail(content: bytes) -> bytes:
+    image = Image.open(BytesIO(content))
+    image.thumbnail(PHOTO_THUMBNAIL_SIZE)
+    buffer = BytesIO()
+    image.convert("RGB").save(buffer, format="JPEG", quality=85, optimize=True)
+    return buffer.getvalue()
+
+
+def _fetch_photo(url: str, cached: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Fetch (or revalidate) one photo. Falls back to a stale copy on network errors."""
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    try:
+        response = http_session.get(normalize_photo_url(url), headers=headers, timeout=PHOTO_FETCH_TIMEOUT)
+        if response.status_code == 304 and cached:
+            return _write_photo_entry(url, cached["data"], cached.get("etag"), cached.get("last_modified"))
+        response.raise_for_status()
+        thumbnail = _make_thumbnail(response.content)
+        return _write_photo_entry(
+            url, thumbnail, response.headers.get("ETag"), response.headers.get("Last-Modified")
+        )
+    except Exception:
+        return cached
+
+
+def load_team_photos(urls: List[str]) -> Dict[str, Optional[bytes]]:
+    """Return thumbnail bytes for each URL (None when unavailable).
+
+    Lookups go memory -> disk -> network; only URLs that are missing or past
+    their TTL are fetched, concurrently and with bounded timeouts.
+    """
+    now = datetime.now().timestamp()
+    photos: Dict[str, Optional[bytes]] = {}
+    to_fetch: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    for url in dict.fromkeys(urls):
+        hit, data = photo_lru.get(url)
+        if hit:
+            photos[url] = data
+            continue
+        cached = _read_photo_entry(url)
+        if cached and cached["fetched_at"] + PHOTO_CACHE_TTL_SECONDS > now:
+            photo_lru.put(url, cached["data"], cached["fetched_at"] + PHOTO_CACHE_TTL_SECONDS)
+            photos[url] = cached["data"]
+        else:
+            to_fetch[url] = cached
+
+    if to_fetch:
+        with ThreadPoolExecutor(max_workers=min(PHOTO_FETCH_WORKERS, len(to_fetch))) as executor:
+            results = executor.map(lambda item: _fetch_photo(*item), to_fetch.items())
+            for url, entry in zip(to_fetch, results):
+                if entry is None:
+                    photo_lru.put(url, None, now + PHOTO_FAILURE_TTL_SECONDS)
+                    photos[url] = None
+                    continue
+                photo_lru.put(url, entry["data"], entry["fetched_at"] + PHOTO_CACHE_TTL_SECONDS)
+                photos[url] = entry["data"]
+
+    return photos
+
+# --- Asset Cache ---
+# Large static images are downloaded once, downscaled and re-encoded, and
+# stored on disk keyed by URL + ETag, with a process-wide LRU in front so every
+# session shares a single copy. A disk copy younger than ASSET_CACHE_TTL_SECONDS
+# is served without touching the network. An older copy, or the bundled
+# fallback image while there is no copy yet, is served straight away and
+# revalidated in the background; the refreshed bytes replace it in memory, and
+# a failed refresh is retried after ASSET_RETRY_SECONDS. A render only waits on
+# the network when there is nothing at all to show.
+ASSET_CACHE_DIR = CACHE_DIR / "assets"
+ASSET_CACHE_TTL_SECONDS = 6 * 60 * 60
+ASSET_RETRY_SECONDS = 5 * 60
+ASSET_FETCH_TIMEOUT = (3.05, 15)
+ASSET_MAX_WIDTH = 1600
+ASSET_LRU_SIZE = 8
+ASSET_REFRESH_WORKERS = 2
+ORG_CHART_URL = "https://raw.githubusercontent.com/LakshmiSomanchi/PMU-/refs/heads/main/Company%20Organizational%20Chart%20(4).jpg"
+ORG_CHART_LOCAL_PATH = Path(__file__).resolve().parent.parent / "Company Organizational Chart (4).jpg"
+
+asset_lru = PhotoLRU(ASSET_LRU_SIZE)
+_asset_refresh_executor = ThreadPoolExecutor(max_workers=ASSET_REFRESH_WORKERS, thread_name_prefix="pmu-assets")
+_assets_refreshing = set()
+_assets_refreshing_lock = threading.Lock()
+
+
+class AssetUnavailable(Exception):
+    """No stored copy, download or bundled fallback of an asset could be loaded."""
+
+
+def encode_display_image(content: bytes, max_width: int = ASSET_MAX_WIDTH) -> bytes:
+    """Decode an image, cap its width and re-encode it as WebP (or progressive JPEG)."""
+    image = Image.open(BytesIO(content))
+    if image.width > max_width:
+        image = image.resize((max_width, round(image.height * max_width / image.width)), Image.LANCZOS)
+    image = image.convert("RGB")
+    buffer = BytesIO()
+    if features.check("webp"):
+        image.save(buffer, format="WEBP", quality=85, method=4)
+    else:
+        image.save(buffer, format="JPEG", quality=85, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def _asset_index_path(url: str) -> Path:
+    return ASSET_CACHE_DIR / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+
+def _asset_blob_path(url: str, etag: Optional[str]) -> Path:
+    key = hashlib.sha256(f"{url}|{etag or ''}".encode()).hexdigest()
+    return ASSET_CACHE_DIR / f"{key}.img"
+
+
+def _read_asset_entry(url: str) -> Optional[Dict[str, Any]]:
+    try:
+        entry = json.loads(_asset_index_path(url).read_text())
+        entry["data"] = _asset_blob_path(url, entry.get("etag")).read_bytes()
+        return entry
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _fetch_asset(url: str, cached: Optional[Dict[str, Any]], max_width: int) -> bytes:
+    """Download (or revalidate by ETag) ``url`` and store it on disk; raises on any failure."""
+    headers = {"If-None-Match": cached["etag"]} if cached and cached.get("etag") else {}
+    response = http_session.get(url, headers=headers, timeout=ASSET_FETCH_TIMEOUT)
+    if response.status_code == 304 and cached is not None:
+        etag, encoded = cached.get("etag"), cached["data"]
+    else:
+        response.raise_for_status()
+        etag = response.headers.get("ETag")
+        encoded = encode_display_image(response.content, max_width)
+        atomic_write_bytes(_asset_blob_path(url, etag), encoded)
+    fetched_at = datetime.now().timestamp()
+    atomic_write_bytes(
+        _asset_index_path(url), json.dumps({"url": url, "etag": etag, "fetched_at": fetched_at}).encode()
+    )
+    asset_lru.put(url, encoded, fetched_at + ASSET_CACHE_TTL_SECONDS)
+    return encoded
+
+
+def _refresh_asset(url: str, cached: Optional[Dict[str, Any]], max_width: int):
+    try:
+        _fetch_asset(url, cached, max_width)
+    except Exception:
+        pass  # keep serving the copy in memory until it is retried
+    finally:
+        with _assets_refreshing_lock:
+            _assets_refreshing.discard(url)
+
+
+def load_cached_asset(url: str, fallback_path: Optional[Path] = None, max_width: int = ASSET_MAX_WIDTH) -> bytes:
+    """Return display-ready bytes for ``url`` from memory, disk, ``fallback_path`` or the network.
+
+    A stale disk copy (or, without one, the bundled ``fallback_path`` file) is
+    returned at once and ``url`` is revalidated in the background. Raises
+    AssetUnavailable when there is no copy, no fallback and the download fails.
+    """
+    hit, data = asset_lru.get(url)
+    if hit:
+        return data
+    now = datetime.now().timestamp()
+    cached = _read_asset_entry(url)
+    if cached is not None and cached.get("fetched_at", 0) + ASSET_CACHE_TTL_SECONDS > now:
+        asset_lru.put(url, cached["data"], cached["fetched_at"] + ASSET_CACHE_TTL_SECONDS)
+        return cached["data"]
+
+    if cached is not None:
+        data = cached["data"]
+    elif fallback_path is not None and fallback_path.exists():
+        data = encode_display_image(fallback_path.read_bytes(), max_width)
+    else:
+        try:
+            return _fetch_asset(url, None, max_width)
+        except Exception as e:
+            raise AssetUnavailable(f"Could not load {url}: {e}") from e
+
+    # Held until the refresh replaces it, or for ASSET_RETRY_SECONDS if it fails.
+    asset_lru.put(url, data, now + ASSET_RETRY_SECONDS)
+    with _assets_refreshing_lock:
+        refreshing = url in _assets_refreshing
+        _assets_refreshing.add(url)
+    if not refreshing:
+        _asset_refresh_executor.submit(_refresh_asset, url, cached, max_width)
+    return data
+
+
+def get_org_chart_image() -> Optional[bytes]:
+    """The organizational chart, ready to display; None when no copy can be loaded."""
+    try:
+        return load_cached_asset(ORG_CHART_URL, fallback_path=ORG_CHART_LOCAL_PATH)
+    except AssetUnavailable:
+        return None
@@ -0,0 +1,129 @@
+"""Password hashing, login verification and the login email directory."""
+import streamlit as st
+from sqlalchemy import update
+import bcrypt
+import hmac
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Iterable, List, Optional
+
+from pmu_tracker.db import SessionLocal
+from pmu_tracker.identity import load_principal, UserPrincipal
+from pmu_tracker.models import Employee
+
+# --- Password Hashing ---
+# Passwords are stored as bcrypt hashes. Rows that still hold a plaintext
+# password (the preloaded users, or anything written before hashing) are
+# re-hashed the first time that user logs in successfully. bcrypt is slow on
+# purpose, so every hash and check runs on a small bounded pool: a burst of
+# logins queues there instead of occupying every script thread's CPU. A
+# caller that waits longer than AUTH_TIMEOUT_SECONDS for the pool gets
+# AuthUnavailable rather than a verdict, and a stored hash bcrypt cannot parse
+# never matches.
+BCRYPT_ROUNDS = 12
+BCRYPT_MAX_BYTES = 72  # bcrypt ignores anything past this
+AUTH_WORKERS = 2
+AUTH_TIMEOUT_SECONDS = 30
+
+_auth_executor = ThreadPoolExecutor(max_workers=AUTH_WORKERS, thread_name_prefix="pmu-auth")
+
+class AuthUnavailable(Exception):
+    """The auth pool did not finish a hash or check within AUTH_TIMEOUT_SECONDS."""
+
+def is_password_hash(stored: Optional[str]) -> bool:
+    return bool(stored) and stored.startswith(("$2a$", "$2b$", "$2y$"))
+
+def _password_bytes(password: str) -> bytes:
+    return password.encode("utf-8")[:BCRYPT_MAX_BYTES]
+
+def _hash_password(password: str) -> str:
+    return bcrypt.hashpw(_password_bytes(password), bcrypt.gensalt(BCRYPT_ROUNDS)).decode("ascii")
+
+def _check_password(password: str, stored: Optional[str]) -> bool:
+    if not stored:
+        return False
+    if is_password_hash(stored):
+        try:
+            return bcrypt.checkpw(_password_bytes(password), stored.encode("ascii"))
+        except ValueError:
+            return False  # malformed or truncated hash
+    return hmac.compare_digest(password.encode("utf-8"), stored.encode("utf-8"))
+
+def _on_auth_pool(fn, *args):
+    future = _auth_executor.submit(fn, *args)
+    try:
+        return future.result(timeout=AUTH_TIMEOUT_SECONDS)
+    except FutureTimeoutError:
+        future.cancel()
+        raise AuthUnavailable(f"Password check did not finish within {AUTH_TIMEOUT_SECONDS} seconds.") from None
+
+def hash_password(password: str) -> str:
+    """bcrypt hash of ``password``, computed on the auth pool; raises AuthUnavailable on timeout."""
+    return _on_auth_pool(_hash_password, password)
+
+def verify_password(password: str, stored: Optional[str]) -> bool:
+    """Check ``password`` against a stored bcrypt hash (or legacy plaintext) on the auth pool.
+
+    Raises AuthUnavailable on timeout.
+    """
+    return _on_auth_pool(_check_password, password, stored)
+
+def authenticate(email: str, password: str) -> Optional[UserPrincipal]:
+    """The principal for ``email`` if ``password`` matches, else None.
+
+    A plaintext password that matches is replaced by its hash; the update only
+    applies if the row still holds that plaintext, so a concurrent password
+    change is never overwritten, and if hashing times out the login still
+    succeeds and the re-hash is left for the next one. Raises AuthUnavailable
+    if the password could not be checked in time.
+    """
+    with SessionLocal() as db:
+        employee = db.query(Employee).filter(Employee.email == email).first()
+        if employee is None or not verify_password(password, employee.password):
+            return None
+        if not is_password_hash(employee.password):
+            try:
+                new_hash = hash_password(password)
+            except AuthUnavailable:
+                new_hash = None
+            if new_hash is not None:
+                db.execute(
+                    update(Employee)
+                    .where(Employee.id == employee.id, Employee.password == employee.password)
+                    .values(password=new_hash)
+                )
+                db.commit()
+        return load_principal(db, employee)
+
+# --- Login Email Directory ---
+# The login screen searches a sorted, process-wide copy of the employee emails
+# by prefix (a bisect plus a short scan) and only ever offers
+# EMAIL_SUGGESTION_LIMIT of them, so its cost does not grow with the table.
+EMAIL_DIRECTORY_TTL_SECONDS = 300
+EMAIL_SUGGESTION_LIMIT = 20
+
+class EmailDirectory:
+    """Employee emails sorted case-insensitively, searchable by prefix."""
+
+    def __init__(self, emails: Iterable[str]):
+        entries = sorted((email.lower(), email) for email in emails if email)
+        self._keys = [key for key, _ in entries]
+        self._emails = [email for _, email in entries]
+
+    def __len__(self) -> int:
+        return len(self._emails)
+
+    def search(self, prefix: str = "", limit: int = EMAIL_SUGGESTION_LIMIT) -> List[str]:
+        prefix = prefix.strip().lower()
+        start = bisect_left(self._keys, prefix)
+        matches = []
+        for key, email in zip(self._keys[start:start + limit], self._emails[start:start + limit]):
+            if not key.startswith(prefix):
+                break
+            matches.append(email)
+        return matches
+
+@st.cache_resource(ttl=EMAIL_DIRECTORY_TTL_SECONDS, show_spinner=False)
+def email_directory() -> EmailDirectory:
+    with SessionLocal() as db:
+        return EmailDirectory(email for (email,) in db.query(Employee.email))
@@ -0,0 +1,186 @@
+"""Database creation, seeding and one-off migrations."""
+import streamlit as st
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+import os
+
+from pmu_tracker.config import CHAT_DB, KANBAN_DB
+from pmu_tracker.db import engine, SessionLocal, write_lock, write_transaction
+from pmu_tracker.kpi_store import seed_program_kpis
+from pmu_tracker.models import Base, Employee, FarmerData, Program, SchemaMigration
+
+def create_schema():
+    Base.metadata.create_all(bind=engine)
+    create_missing_indexes()
+
+def create_missing_indexes():
+    """create_all() does not add new indexes to tables that already exist; do that here."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+# --- Preloading Data ---
+preloaded_users = [
+    ("Somanchi", "rsomanchi@tns.org", "password1"),
+    ("Ranu", "rladdha@tns.org", "password2"),
+    ("Pari", "paris@tns.org", "password3"),
+    ("Muskan", "mkaushal@tns.org", "password4"),
+    ("Rupesh", "rmukherjee@tns.org", "password5"),
+    ("Shifali", "shifalis@tns.org", "password6"),
+    ("Aditya", "ayuvaraj@tns.org", "password7"),
+    ("Bhavya Kharoo", "bkharoo@tns.org", "password8"),
+    ("Kriti Suneha", "ksuneha@tns.org", "password9"),
+    ("Sandeep GS", "gssandeep@tns.org", "password10"),
+    ("Nikhitha VK", "vknikhitha@tns.org", "password11"),
+]
+
+initial_programs = ["Water Program", "Education Program", "Ksheersagar 2.0", "SAKSHAM"]
+
+def preload_data():
+    """Insert whichever preloaded users and programs are missing, in one transaction."""
+    first_employee = select(Employee.id).order_by(Employee.id).limit(1).scalar_subquery()
+    with write_transaction(engine) as conn:
+        conn.execute(
+            sqlite_insert(Employee).on_conflict_do_nothing(index_elements=[Employee.email]),
+            [{"name": name, "email": email, "password": password} for name, email, password in preloaded_users],
+        )
+        conn.execute(
+            sqlite_insert(Program).values([
+                {"name": name, "description": f"Description for {name}", "employee_id": first_employee}
+                for name in initial_programs
+            ]).on_conflict_do_nothing(index_elements=[Program.name])
+        )
+
+# Legacy database file -> (table, columns copied into pmu.db)
+LEGACY_SQLITE_TABLES = {
+    KANBAN_DB: ("kanban", "id, status, task"),
+    CHAT_DB: ("chat", "id, user, message, timestamp"),
+}
+
+def migrate_legacy_sqlite_tables():
+    """Copy rows from the old standalone kanban.db / chat.db files into pmu.db.
+
+    Each file is renamed to ``<name>.migrated`` afterwards, so this runs once.
+    """
+    for path, (table, columns) in LEGACY_SQLITE_TABLES.items():
+        if not os.path.exists(path):
+            continue
+        with write_lock(engine), engine.connect() as conn:
+            conn.exec_driver_sql("ATTACH DATABASE ? AS legacy", (path,))
+            try:
+                has_table = conn.exec_driver_sql(
+                    "SELECT 1 FROM legacy.sqlite_master WHERE type = 'table' AND name = ?", (table,)
+                ).first()
+                if has_table:
+                    conn.exec_driver_sql(
+                        f"INSERT OR IGNORE INTO {table} ({columns}) SELECT {columns} FROM legacy.{table}"
+                    )
+                conn.commit()
+            finally:
+                conn.exec_driver_sql("DETACH DATABASE legacy")
+        os.replace(path, f"{path}.migrated")
+
+def purge_blank_farmer_rows():
+    """Delete the empty FarmerData rows saksham_dashboard() used to insert on every rerun.
+
+    Those rows always had zero cows and zero yield; nothing else writes such rows.
+    """
+    blank = (FarmerData.number_of_cows == 0) & (FarmerData.yield_per_cow == 0)
+    with SessionLocal() as db:
+        if db.query(FarmerData.id).filter(blank).first() is None:
+            return
+        db.query(FarmerData).filter(blank).delete(synchronize_session=False)
+        db.commit()
+
+# farmer_daily_rollup is kept in step with farmer_data by these triggers, so
+# every writer (ORM, bulk SQL or an external import) updates it in the same
+# transaction. Rows without a date are not rolled up. The triggers also bump
+# data_versions['farmer_data'], a cheap change token for the live dashboard.
+_ROLLUP_ADD = """
+    INSERT INTO farmer_daily_rollup (date, records, total_cows, total_yield, yield_records)
+    SELECT NEW.date, 1, COALESCE(NEW.number_of_cows, 0), COALESCE(NEW.yield_per_cow, 0), NEW.yield_per_cow IS NOT NULL
+    WHERE NEW.date IS NOT NULL
+    ON CONFLICT (date) DO UPDATE SET
+        records = records + 1,
+        total_cows = total_cows + excluded.total_cows,
+        total_yield = total_yield + excluded.total_yield,
+        yield_records = yield_records + excluded.yield_records;
+"""
+_ROLLUP_REMOVE = """
+    UPDATE farmer_daily_rollup SET
+        records = records - 1,
+        total_cows = total_cows - COALESCE(OLD.number_of_cows, 0),
+        total_yield = total_yield - COALESCE(OLD.yield_per_cow, 0),
+        yield_records = yield_records - (OLD.yield_per_cow IS NOT NULL)
+    WHERE date = OLD.date;
+    DELETE FROM farmer_daily_rollup WHERE date = OLD.date AND records <= 0;
+"""
+_VERSION_BUMP = """
+    INSERT INTO data_versions (name, version) VALUES ('farmer_data', 1)
+    ON CONFLICT (name) DO UPDATE SET version = version + 1;
+"""
+FARMER_ROLLUP_TRIGGERS = {
+    "farmer_data_rollup_insert": f"AFTER INSERT ON farmer_data BEGIN {_ROLLUP_ADD} {_VERSION_BUMP} END",
+    "farmer_data_rollup_delete": f"AFTER DELETE ON farmer_data BEGIN {_ROLLUP_REMOVE} {_VERSION_BUMP} END",
+    "farmer_data_rollup_update": (
+        f"AFTER UPDATE ON farmer_data BEGIN {_ROLLUP_REMOVE} {_ROLLUP_ADD} {_VERSION_BUMP} END"
+    ),
+}
+
+def create_farmer_rollup_triggers():
+    """Install the rollup triggers, rebuilding farmer_daily_rollup whenever their definition changes."""
+    expected = {name: f"CREATE TRIGGER {name} {body}" for name, body in FARMER_ROLLUP_TRIGGERS.items()}
+    with write_transaction(engine) as conn:
+        existing = dict(conn.exec_driver_sql(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'farmer_data'"
+        ).all())
+        if all(existing.get(name) == sql for name, sql in expected.items()):
+            return
+        for name in FARMER_ROLLUP_TRIGGERS:
+            conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name}")
+        conn.exec_driver_sql("DELETE FROM farmer_daily_rollup")
+        conn.exec_driver_sql(
+            "INSERT INTO farmer_daily_rollup (date, records, total_cows, total_yield, yield_records) "
+            "SELECT date, COUNT(*), COALESCE(SUM(number_of_cows), 0), COALESCE(SUM(yield_per_cow), 0), "
+            "COUNT(yield_per_cow) FROM farmer_data WHERE date IS NOT NULL GROUP BY date"
+        )
+        for sql in expected.values():
+            conn.exec_driver_sql(sql)
+        conn.exec_driver_sql(_VERSION_BUMP)
+
+# --- Schema Migrations ---
+# Bootstrap work is a numbered list of idempotent steps. schema_migrations
+# records the ones a database has applied, and create_and_preload_db() runs
+# the missing ones once per process, so a normal rerun issues no bootstrap
+# queries at all. Append a step for every model, index, trigger or seed
+# change; never renumber or edit a step that has shipped.
+MIGRATIONS = [
+    (1, "create_schema", create_schema),
+    (2, "farmer_rollup_triggers", create_farmer_rollup_triggers),
+    (3, "migrate_legacy_sqlite_tables", migrate_legacy_sqlite_tables),
+    (4, "purge_blank_farmer_rows", purge_blank_farmer_rows),
+    (5, "preload_data", preload_data),
+    (6, "seed_program_kpis", seed_program_kpis),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+def apply_migrations() -> int:
+    """Run the steps of MIGRATIONS this database has not recorded yet; returns how many ran."""
+    SchemaMigration.__table__.create(bind=engine, checkfirst=True)
+    with engine.connect() as conn:
+        applied = set(conn.scalars(select(SchemaMigration.version)))
+    pending = [step for step in MIGRATIONS if step[0] not in applied]
+    for version, name, migrate in pending:
+        migrate()
+        with write_transaction(engine) as conn:
+            conn.execute(
+                sqlite_insert(SchemaMigration).values(version=version, name=name)
+                .on_conflict_do_nothing(index_elements=[SchemaMigration.version])
+            )
+    return len(pending)
+
+@st.cache_resource(show_spinner=False)
+def create_and_preload_db() -> int:
+    """Bring the database up to SCHEMA_VERSION; cached, so it runs once per process."""
+    apply_migrations()
+    return SCHEMA_VERSION
@@ -0,0 +1,66 @@
+"""Plotly figure builders with bounded payloads."""
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+
+# --- Charting ---
+# Plotly serialises every point it is given into the page, so long series are
+# cut down to CHART_POINT_BUDGET points with Largest-Triangle-Three-Buckets
+# (which keeps the visual peaks and troughs) and drawn with WebGL traces once
+# they pass WEBGL_POINT_THRESHOLD. Histograms are drawn from pre-binned counts.
+CHART_POINT_BUDGET = 1500
+WEBGL_POINT_THRESHOLD = 1000
+MARKER_POINT_LIMIT = 400
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, budget: int) -> np.ndarray:
+    """Indices of the ``budget`` points kept by LTTB downsampling; ``x`` must be sorted."""
+    n = len(x)
+    if budget >= n or budget < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, budget - 1).astype(int)
+    kept = np.empty(budget, dtype=int)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(budget - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        next_x = x[end:next_end].mean()
+        next_y = y[end:next_end].mean()
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(areas.argmax())
+        kept[bucket + 1] = previous
+    return kept
+
+def downsample_series(frame: pd.DataFrame, x: str, y: str, budget: int = CHART_POINT_BUDGET) -> pd.DataFrame:
+    """Sort ``frame`` by ``x`` and keep at most ``budget`` rows chosen by LTTB."""
+    frame = frame.dropna(subset=[x, y]).sort_values(x)
+    if len(frame) <= budget:
+        return frame
+    x_values = frame[x]
+    if pd.api.types.is_datetime64_any_dtype(x_values):
+        x_values = x_values.astype("int64")
+    return frame.iloc[lttb_indices(x_values.to_numpy(dtype=float), frame[y].to_numpy(dtype=float), budget)]
+
+def time_series_figure(frame: pd.DataFrame, x: str, y: str, title: str,
+                       budget: int = CHART_POINT_BUDGET) -> go.Figure:
+    """Line chart of ``y`` over ``x`` with a bounded number of points."""
+    points = downsample_series(frame, x, y, budget)
+    trace = go.Scattergl if len(points) > WEBGL_POINT_THRESHOLD else go.Scatter
+    fig = go.Figure(trace(
+        x=points[x], y=points[y], name=y,
+        mode="lines+markers" if len(points) <= MARKER_POINT_LIMIT else "lines",
+    ))
+    if len(points) < len(frame):
+        title = f"{title} ({len(points):,} of {len(frame):,} points)"
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title=y)
+    return fig
+
+def histogram_figure(bins: pd.DataFrame, title: str, x_label: str) -> go.Figure:
+    """Bar chart of pre-binned counts with columns Bin Start, Bin End and Count."""
+    widths = bins["Bin End"] - bins["Bin Start"]
+    fig = go.Figure(go.Bar(x=bins["Bin Start"] + widths / 2, y=bins["Count"], width=widths, name="Count"))
+    fig.update_layout(title=title, xaxis_title=x_label, yaxis_title="Count", bargap=0)
+    return fig
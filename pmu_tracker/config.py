@@ -0,0 +1,23 @@
+"""Paths and settings shared by every PMU module."""
+import os
+from pathlib import Path
+
+# --- Configuration and Constants ---
+DATABASE_URL = "sqlite:///pmu.db"
+# Kanban and chat used to live in their own SQLite files; they are now tables
+# in pmu.db and these files are only read once by migrate_legacy_sqlite_tables().
+KANBAN_DB = "kanban.db"
+CHAT_DB = "chat.db"
+CACHE_DIR = Path(".cache")
+# Field-team REST API. When unset, the app serves mock_store on a local port
+# (see api_client.api_client) and talks to that instead.
+API_BASE_URL = os.environ.get("PMU_API_BASE_URL")
+# Optional JSON-lines file that receives one record per API call (see api_metrics).
+API_METRICS_LOG = os.environ.get("PMU_API_METRICS_LOG")
+# Report export formats: label -> (file extension, MIME type).
+REPORT_FORMATS = {
+    "CSV": (".csv", "text/csv"),
+    "Excel": (".xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "JSON": (".json", "application/json"),
+    "Parquet": (".parquet", "application/vnd.apache.parquet"),
+}
@@ -0,0 +1,126 @@
+"""Pooled SQLite engine, session factory and write serialization."""
+from sqlalchemy import and_, create_engine, event, or_
+from sqlalchemy.orm import sessionmaker, Session
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Optional, Tuple
+
+from pmu_tracker.config import DATABASE_URL
+
+# --- Database Setup (SQLAlchemy) ---
+# The database is reached through pooled, long-lived connections. Every new
+# connection is tuned with the PRAGMAs below (WAL lets readers proceed while a
+# write is in progress), and writes are serialized per database in-process so
+# concurrent sessions queue up instead of failing with "database is locked".
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -16000,  # negative means KiB, i.e. ~16 MB per connection
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,
+}
+SQLITE_POOL_SIZE = 10
+SQLITE_MAX_OVERFLOW = 20
+
+_write_locks: Dict[str, threading.RLock] = {}
+_write_locks_guard = threading.Lock()
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {pragma}={value}")
+    cursor.close()
+
+
+def create_sqlite_engine(url: str):
+    """Create a pooled SQLite engine with the tuning PRAGMAs applied on connect."""
+    sqlite_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False, "timeout": 30},
+        pool_size=SQLITE_POOL_SIZE,
+        max_overflow=SQLITE_MAX_OVERFLOW,
+    )
+    event.listen(sqlite_engine, "connect", _apply_sqlite_pragmas)
+    return sqlite_engine
+
+
+def write_lock(bind) -> threading.RLock:
+    """Return the process-wide writer lock for the database behind ``bind``."""
+    key = str(bind.url)
+    with _write_locks_guard:
+        return _write_locks.setdefault(key, threading.RLock())
+
+
+@contextmanager
+def write_transaction(sqlite_engine):
+    """Run a block of raw SQL writes in one transaction, serialized per database."""
+    with write_lock(sqlite_engine), sqlite_engine.begin() as conn:
+        yield conn
+
+
+class SerializedWriteSession(Session):
+    """Session whose commits take the writer lock of its database."""
+
+    def commit(self):
+        with write_lock(self.get_bind()):
+            super().commit()
+
+
+def keyset_order(column, id_column, descending: bool = False) -> tuple:
+    """ORDER BY for keyset paging on a nullable ``column``: NULLs first ascending, last descending."""
+    if descending:
+        return column.desc().nulls_last(), id_column.desc()
+    return column.asc().nulls_first(), id_column.asc()
+
+
+def keyset_after(column, id_column, cursor: Tuple[Optional[Any], int], descending: bool = False):
+    """WHERE clause for the rows that follow ``cursor`` (a ``(value, id)`` pair) in keyset_order().
+
+    Spelled out rather than ``tuple_(column, id) > cursor`` because a row-value
+    comparison is NULL whenever ``column`` or the cursor value is NULL, which
+    would make every row with a NULL ``column`` unreachable.
+    """
+    value, last_id = cursor
+    if value is None:
+        if descending:
+            return and_(column.is_(None), id_column < last_id)
+        return or_(column.isnot(None), and_(column.is_(None), id_column > last_id))
+    if descending:
+        return or_(column < value, and_(column == value, id_column < last_id), column.is_(None))
+    return or_(column > value, and_(column == value, id_column > last_id))
+
+
+class QueryCounter:
+    """Context manager counting the SQL statements sent through an engine.
+
+    Used to check that a code path issues a fixed number of queries no matter
+    how many rows it touches (i.e. that it has no N+1 lazy loads).
+    """
+
+    def __init__(self, bind=None):
+        self.bind = bind if bind is not None else engine
+        self.count = 0
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.bind, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.bind, "before_cursor_execute", self._on_execute)
+
+
+engine = create_sqlite_engine(DATABASE_URL)
+SessionLocal = sessionmaker(class_=SerializedWriteSession, autocommit=False, autoflush=False, bind=engine)
+
+def get_db():
+    """Dependency to get a SQLAlchemy session."""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -0,0 +1,182 @@
+"""The logged-in user principal and cached per-user lookups."""
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+import threading
+import time
+from datetime import date
+from typing import Callable, Dict, FrozenSet, Iterator, Optional, Tuple, NamedTuple
+
+from pmu_tracker.db import SessionLocal
+from pmu_tracker.models import Employee, FieldTeam, Program, Schedule, WorkStream
+
+# --- User Principal ---
+# st.session_state.user holds a UserPrincipal, not an Employee: a detached ORM
+# instance cannot load relationships and goes stale, whereas the principal is a
+# plain immutable value that every page and session can share safely.
+ROLE_EMPLOYEE = "employee"
+ROLE_PROGRAM_OWNER = "program_owner"
+ROLE_FIELD_TEAM_LEAD = "field_team_lead"
+
+class UserPrincipal:
+    """Immutable identity of the logged-in user: id, name, email and roles."""
+
+    __slots__ = ("id", "name", "email", "roles")
+
+    def __init__(self, id: int, name: str, email: str, roles: FrozenSet[str] = frozenset({ROLE_EMPLOYEE})):
+        object.__setattr__(self, "id", id)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "email", email)
+        object.__setattr__(self, "roles", frozenset(roles))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return type(self), (self.id, self.name, self.email, self.roles)
+
+    def __eq__(self, other):
+        if not isinstance(other, UserPrincipal):
+            return NotImplemented
+        return (self.id, self.name, self.email, self.roles) == (other.id, other.name, other.email, other.roles)
+
+    def __hash__(self):
+        return hash((self.id, self.email))
+
+    def __repr__(self):
+        return f"UserPrincipal(id={self.id!r}, name={self.name!r}, email={self.email!r}, roles={sorted(self.roles)!r})"
+
+    def has_role(self, role: str) -> bool:
+        return role in self.roles
+
+def load_principal(db: Session, employee: Employee) -> UserPrincipal:
+    """Build the principal for ``employee``; called once per login."""
+    roles = {ROLE_EMPLOYEE}
+    if db.query(Program.id).filter(Program.employee_id == employee.id).first() is not None:
+        roles.add(ROLE_PROGRAM_OWNER)
+    if db.query(FieldTeam.id).filter(FieldTeam.pmu_id == employee.id).first() is not None:
+        roles.add(ROLE_FIELD_TEAM_LEAD)
+    return UserPrincipal(employee.id, employee.name, employee.email, frozenset(roles))
+
+# --- Per-User Read Model ---
+# A user's workstreams, field teams and schedules are read through one
+# process-wide cache shared by every page and session. Entries expire after
+# USER_LOOKUP_TTL_SECONDS; committed writes to those tables through
+# SessionLocal drop the owner's entries straight away (session hooks below,
+# as for status_counts), so the TTL only bounds staleness for outside writes.
+USER_LOOKUP_TTL_SECONDS = 300
+
+class WorkStreamRef(NamedTuple):
+    id: int
+    title: str
+
+class FieldTeamRef(NamedTuple):
+    id: int
+    name: str
+
+class ScheduleEntry(NamedTuple):
+    id: int
+    date: date
+    start_time: str
+    end_time: str
+    gmeet_link: Optional[str]
+
+def _load_workstreams(db: Session, user_id: int) -> Tuple[WorkStreamRef, ...]:
+    rows = db.query(WorkStream.id, WorkStream.title).filter(WorkStream.employee_id == user_id).order_by(WorkStream.id)
+    return tuple(WorkStreamRef(*row) for row in rows)
+
+def _load_field_teams(db: Session, user_id: int) -> Tuple[FieldTeamRef, ...]:
+    rows = db.query(FieldTeam.id, FieldTeam.name).filter(FieldTeam.pmu_id == user_id).order_by(FieldTeam.id)
+    return tuple(FieldTeamRef(*row) for row in rows)
+
+def _load_schedules(db: Session, user_id: int) -> Tuple[ScheduleEntry, ...]:
+    rows = (
+        db.query(Schedule.id, Schedule.date, Schedule.start_time, Schedule.end_time, Schedule.gmeet_link)
+        .filter(Schedule.employee_id == user_id)
+        .order_by(Schedule.date.desc(), Schedule.id.desc())
+    )
+    return tuple(ScheduleEntry(*row) for row in rows)
+
+# lookup name -> (loader, model, owner column attribute)
+USER_LOOKUPS: Dict[str, Tuple[Callable[[Session, int], tuple], type, str]] = {
+    "workstreams": (_load_workstreams, WorkStream, "employee_id"),
+    "field_teams": (_load_field_teams, FieldTeam, "pmu_id"),
+    "schedules": (_load_schedules, Schedule, "employee_id"),
+}
+
+class UserLookupCache:
+    """Thread-safe TTL cache of ``(lookup, user_id) -> tuple of rows``."""
+
+    def __init__(self, ttl: float = USER_LOOKUP_TTL_SECONDS):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, int], Tuple[float, tuple]] = {}
+        self._generations: Dict[Tuple[str, int], int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, lookup: str, user_id: int) -> tuple:
+        key = (lookup, user_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            generation = self._generations.get(key, 0)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        loader = USER_LOOKUPS[lookup][0]
+        with SessionLocal() as db:
+            rows = loader(db, user_id)
+        with self._lock:
+            # Only keep the result if nothing was invalidated while it was loading.
+            if self._generations.get(key, 0) == generation:
+                self._entries[key] = (now + self.ttl, rows)
+        return rows
+
+    def invalidate(self, keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+                self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            keys = list(self._entries)
+        self.invalidate(keys)
+
+user_lookups = UserLookupCache()
+
+def user_workstreams(user_id: int) -> Tuple[WorkStreamRef, ...]:
+    return user_lookups.get("workstreams", user_id)
+
+def user_field_teams(user_id: int) -> Tuple[FieldTeamRef, ...]:
+    return user_lookups.get("field_teams", user_id)
+
+def user_schedules(user_id: int) -> Tuple[ScheduleEntry, ...]:
+    """The user's schedules, newest first."""
+    return user_lookups.get("schedules", user_id)
+
+def _user_lookup_keys(obj) -> Iterator[Tuple[str, int]]:
+    """Lookup keys a flushed ``obj`` affects: its owner's and, if it was reassigned, the previous owner's."""
+    for lookup, (_, model, owner_attr) in USER_LOOKUPS.items():
+        if isinstance(obj, model):
+            owners = {getattr(obj, owner_attr), *inspect(obj).attrs[owner_attr].history.deleted}
+            yield from ((lookup, owner) for owner in owners if owner is not None)
+            return
+
+def _collect_user_lookup_keys(session, flush_context):
+    keys = session.info.setdefault("user_lookup_keys", set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        keys.update(_user_lookup_keys(obj))
+
+def _invalidate_user_lookups(session):
+    keys = session.info.pop("user_lookup_keys", None)
+    if keys:
+        user_lookups.invalidate(keys)
+
+def _discard_user_lookup_keys(session):
+    session.info.pop("user_lookup_keys", None)
+
+event.listen(SessionLocal, "after_flush", _collect_user_lookup_keys)
+event.listen(SessionLocal, "after_commit", _invalidate_user_lookups)
+event.listen(SessionLocal, "after_rollback", _discard_user_lookup_keys)
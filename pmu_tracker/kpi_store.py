@@ -0,0 +1,166 @@
+"""Program KPI store: seeds, versioning and saving edited KPIs."""
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+import json
+from math import isnan
+from typing import TYPE_CHECKING, List, Dict
+
+from pmu_tracker.db import SessionLocal
+from pmu_tracker.models import DataVersion, Employee, Program, ProgramChart, ProgramDashboard, ProgramMetric, ProgramMetricValue
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# --- Program KPI Store ---
+# Program dashboards are drawn from the program_* tables: one ProgramMetric per
+# KPI row, one ProgramMetricValue per (metric, period) cell, and ProgramChart
+# rows for the breakdown charts. Each program's table, long-form frame and
+# figures are built once per KPI store version and shared by every session;
+# every write through save_program_kpis() bumps data_versions['program_kpis'].
+PROGRAM_KPI_VERSION_KEY = "program_kpis"
+
+# Initial contents of the store; seed_program_kpis() copies a program's entry
+# in once, after which the database is the source of truth.
+PROGRAM_KPI_SEEDS = {
+    "Heritage": {
+        "title": "🏛️ Heritage Dashboard",
+        "map_url": "https://datawrapper.dwcdn.net/jjDlA/1/",
+        "period_label": "Period",
+        "kpis": {
+            "Metric": ["Milk Received (Lt per day)", "#MCCs", "#DFs", "#HPCs (VLCC)", "Total MCCs",
+                       "Routes", "#Heritage Pourers", "# Other farmers(from MCCs)", "Total Active Farmers",
+                       "Productivity (in lts per day per farmer)", "SNF (Baseline)%", "Fat (Baseline)%",
+                       "Compliance % (with Antibiotics and Aflatoxins)"],
+            "Baseline": [33000, 137, 3, 67, 207, 17, 1010, 2268, 3278, 10, 8.1, 4, 50],
+            "Target": [45000, 70, 10, 134, 214, 17, 2546, 1050, 3596, 13, 8.1, 4.3, 70],
+            "Progress": [15000, 67, 10, 67, 5, 4, 1536, -1218, 3596, 13, 8.15, 0.2, 70],
+            "Q1": [5000, 22, 3, 22, 2, 1.0, 512, -406, 1199, 10, 8.15, 4.10, 23],
+            "Q2": [5000, 22, 3, 22, 2, 1.0, 512, -406, 1199, 11, 8.2, 4.15, 23],
+            "Q3": [5000, 22, 3, 22, 2, 2, 512, -406, 1199, 12, 8.25, 4.20, 23],
+            "Q4": [7500, 34, 5, 34, 3, 2, 768, -609, 1798, 13, 8.30, 4.3, 35],
+            "Q5": [7500, 34, 5, 34, 3, 2, 768, -609, 1798, 13, 8.30, 4.3, 35],
+        },
+        "unplotted_kpis": ["# Other farmers(from MCCs)", "SNF (Baseline)%", "Fat (Baseline)%",
+                           "Compliance % (with Antibiotics and Aflatoxins)"],
+        "headlines": [],
+        "breakdown_title": "Farmer Demographics and Impact",
+        "charts": [
+            {"kind": "pie", "data": {"Category": ["Small", "Medium", "Large"], "Farmers": [6000, 4000, 2450]},
+             "args": {"values": "Farmers", "names": "Category", "hole": 0.5, "title": "Farmer Size Distribution"}},
+            {"kind": "line", "data": {"Year": list(range(2015, 2024)), "ImpactScore": [50, 55, 61, 66, 70, 74, 78, 82, 84]},
+             "args": {"x": "Year", "y": "ImpactScore", "title": "Yearly Impact Score"}},
+            {"kind": "bar", "data": {"Gender": ["Female", "Male"], "Participation": [5200, 7250]},
+             "args": {"x": "Participation", "y": "Gender", "orientation": "h", "title": "Gender Participation"}},
+        ],
+    },
+    "Ksheersagar 2.0": {
+        "title": "🐄 Ksheersagar 2.0 Dashboard",
+        "map_url": "https://datawrapper.dwcdn.net/01h0U/1/",
+        "period_label": "Month",
+        "kpis": {
+            "Metric": ["Total Milk Collection (Liters)", "Number of Active Farmers",
+                       "Average Milk Yield per Farmer (Liters)", "AI Coverage (%)",
+                       "Animal Health Checkups"],
+            "Jan": [100000, 500, 200, 60, 150],
+            "Feb": [120000, 550, 210, 62, 160],
+            "Mar": [110000, 520, 211, 63, 155],
+            "Apr": [115000, 530, 217, 65, 165],
+            "May": [125000, 560, 223, 67, 170],
+        },
+        "unplotted_kpis": [],
+        "headlines": [["🧬 Breed Diversity", "21 types"], ["🧮 Avg Daily Milk (L)", "9.3"], ["🔁 AI Coverage (%)", "67.4"]],
+        "breakdown_title": None,
+        "charts": [
+            {"kind": "pie", "data": {"Breed": ["Sahiwal", "Gir", "Jersey", "HF"], "Count": [3400, 2800, 1500, 900]},
+             "args": {"names": "Breed", "values": "Count", "hole": 0.5, "title": "Breed Composition"}},
+            {"kind": "line", "data": {"Year": list(range(2016, 2024)), "AI_Usage": [40, 45, 48, 52, 56, 60, 65, 67]},
+             "args": {"x": "Year", "y": "AI_Usage", "title": "Artificial Insemination Coverage Over Time"}},
+            {"kind": "bar", "data": {"Class": ["<5L", "5-10L", "10-15L", ">15L"], "Farms": [2200, 3800, 2700, 1100]},
+             "args": {"x": "Farms", "y": "Class", "orientation": "h", "title": "Farm Distribution by Milk Output"}},
+        ],
+    },
+}
+
+def bump_data_version(db: Session, name: str):
+    """Advance the data_versions counter ``name`` as part of ``db``'s transaction."""
+    stmt = sqlite_insert(DataVersion).values(name=name, version=1)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=["name"], set_={"version": DataVersion.version + 1}
+    ))
+
+def program_kpi_version(db: Session) -> int:
+    return db.query(DataVersion.version).filter(DataVersion.name == PROGRAM_KPI_VERSION_KEY).scalar() or 0
+
+def add_program_metrics(program_id: int, kpis: Dict[str, list], unplotted: List[str] = ()) -> List[ProgramMetric]:
+    """Build ProgramMetric rows (with values) from a wide {"Metric": [...], period: [...]} mapping."""
+    periods = [column for column in kpis if column != "Metric"]
+    metrics = []
+    for position, name in enumerate(kpis["Metric"]):
+        metric = ProgramMetric(program_id=program_id, name=name, position=position, plotted=name not in unplotted)
+        metric.values = [
+            ProgramMetricValue(period=period, period_order=order, value=kpis[period][position])
+            for order, period in enumerate(periods)
+            if kpis[period][position] is not None and not isnan(kpis[period][position])
+        ]
+        metrics.append(metric)
+    return metrics
+
+def seed_program_kpis():
+    """Copy PROGRAM_KPI_SEEDS into the store for programs that have no dashboard yet."""
+    with SessionLocal() as db:
+        seeded = {
+            name for (name,) in db.query(Program.name).join(ProgramDashboard)
+            .filter(Program.name.in_(list(PROGRAM_KPI_SEEDS)))
+        }
+        pending = [name for name in PROGRAM_KPI_SEEDS if name not in seeded]
+        if not pending:
+            return
+        owner = db.query(Employee.id).order_by(Employee.id).first()
+        for name in pending:
+            seed = PROGRAM_KPI_SEEDS[name]
+            program = db.query(Program).filter_by(name=name).first()
+            if program is None:
+                program = Program(name=name, description=f"Description for {name}", employee_id=owner and owner.id)
+                db.add(program)
+                db.flush()
+            program.dashboard = ProgramDashboard(
+                title=seed["title"],
+                map_url=seed["map_url"],
+                period_label=seed["period_label"],
+                headlines=json.dumps(seed["headlines"]),
+                breakdown_title=seed["breakdown_title"],
+            )
+            program.metrics = add_program_metrics(program.id, seed["kpis"], seed["unplotted_kpis"])
+            program.charts = [
+                ProgramChart(position=position, kind=chart["kind"],
+                             spec=json.dumps({"data": chart["data"], "args": chart["args"]}))
+                for position, chart in enumerate(seed["charts"])
+            ]
+        bump_data_version(db, PROGRAM_KPI_VERSION_KEY)
+        db.commit()
+
+def save_program_kpis(program_id: int, edited: "pd.DataFrame"):
+    """Replace a program's metrics and values with the wide table ``edited`` (a Metric column plus one per period)."""
+    import pandas as pd
+
+    edited = edited.dropna(subset=["Metric"])
+    edited = edited[edited["Metric"].astype(str).str.strip() != ""]
+    if edited["Metric"].duplicated().any():
+        raise ValueError("Each metric name may only appear once.")
+    periods = [column for column in edited.columns if column != "Metric"]
+    values = edited[periods].apply(pd.to_numeric, errors="coerce")
+    kpis = {"Metric": edited["Metric"].astype(str).str.strip().tolist(),
+            **{period: values[period].tolist() for period in periods}}
+
+    with SessionLocal() as db:
+        program = db.get(Program, program_id)
+        if program is None:
+            raise ValueError("Program no longer exists.")
+        unplotted = [metric.name for metric in program.metrics if not metric.plotted]
+        program.metrics = []
+        db.flush()
+        program.metrics = add_program_metrics(program_id, kpis, unplotted)
+        if program.dashboard is None:
+            program.dashboard = ProgramDashboard()
+        bump_data_version(db, PROGRAM_KPI_VERSION_KEY)
+        db.commit()
@@ -0,0 +1,181 @@
+"""In-memory store behind the stand-in field-team REST API."""
+import threading
+import time
+from typing import Optional, List, Dict, Any, Tuple
+
+# --- MOCK API Integration (for demonstration) ---
+# The mock backend is one process-wide MockApiStore, served over HTTP by
+# api_server and reached by the pages through api_client. Each endpoint is a
+# MockResource: items keyed by id (O(1) get, put and delete) plus hash indexes
+# on INDEXED_FIELDS, so a filtered GET reads an index bucket instead of
+# scanning every item. Stored
+# items are read-only ApiItem dicts and are returned as-is, never copied; a PUT
+# swaps in a new item.
+MOCK_API_SEED = {
+    "employees": [
+        {"id": 1, "name": "Somanchi", "email": "rsomanchi@tns.org", "password": "password1"},
+        {"id": 2, "name": "Ranu", "email": "rladdha@tns.org", "password": "password2"},
+    ],
+    "field_teams": [
+        {"id": 101, "name": "Dairy Team North", "pmu_id": 1},
+        {"id": 102, "name": "Cotton Team South", "pmu_id": 2},
+    ],
+    "workplans": [
+        {"id": 1, "title": "Implement new dairy strategy", "details": "Roll out new feed guidelines across all farms.", "deadline": "2025-12-31", "status": "In Progress", "workstream_id": 1, "supervisor_id": 1},
+        {"id": 2, "title": "Train new field agents", "details": "Conduct a 2-day training session for 10 new agents.", "deadline": "2025-07-15", "status": "Not Started", "workstream_id": 2, "supervisor_id": 1},
+    ],
+    "targets": [
+        {"id": 1, "description": "Achieve 10% increase in milk yield", "deadline": "2025-09-30", "status": "Not Started", "employee_id": 1},
+    ]
+}
+INDEXED_FIELDS = ("id", "pmu_id", "supervisor_id", "employee_id", "status")
+# endpoint -> (label, field named in the success message) for endpoints that accept POST
+POST_ENDPOINTS = {
+    "field_teams": ("Field team", "name"),
+    "workplans": ("Workplan", "title"),
+    "targets": ("Target", "description"),
+}
+
+class ApiItem(dict):
+    """A stored mock API record. Read-only, so it can be handed out without copying."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("mock API items are read-only; change them through MockResource.put()")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return ApiItem, (dict(self),)
+
+class MockResource:
+    """The items of one endpoint, by id and by the value of each indexed field.
+
+    Index keys are ``str(value)``, matching how GET parameters were always
+    compared, and each bucket maps id -> insertion sequence so results keep
+    the order the items were added in. ``version`` and ``modified_at`` move
+    on every write; the API server derives ETag and Last-Modified from them.
+    """
+
+    def __init__(self, items: List[Dict[str, Any]], indexed_fields=INDEXED_FIELDS):
+        self._items: Dict[Any, ApiItem] = {}
+        self._sequence: Dict[Any, int] = {}
+        self._indexes: Dict[str, Dict[str, Dict[Any, int]]] = {field: {} for field in indexed_fields}
+        self._next_sequence = 0
+        self._lock = threading.RLock()
+        for item in items:
+            self._store(ApiItem(item))
+        self.next_id = max(self._items, default=0) + 1
+        self.version = 0
+        self.modified_at = time.time()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _store(self, item: ApiItem):
+        item_id = item["id"]
+        if item_id not in self._sequence:
+            self._sequence[item_id] = self._next_sequence
+            self._next_sequence += 1
+        self._items[item_id] = item
+        for field, index in self._indexes.items():
+            if field in item:
+                index.setdefault(str(item[field]), {})[item_id] = self._sequence[item_id]
+
+    def _touch(self):
+        self.version += 1
+        self.modified_at = time.time()
+
+    def _unindex(self, item: ApiItem):
+        for field, index in self._indexes.items():
+            if field in item:
+                key = str(item[field])
+                bucket = index.get(key)
+                if bucket is not None:
+                    bucket.pop(item["id"], None)
+                    if not bucket:
+                        del index[key]
+
+    def get(self, item_id) -> Optional[ApiItem]:
+        return self._items.get(item_id)
+
+    def revision(self) -> Tuple[int, float]:
+        """``(version, modified_at)``, read together."""
+        with self._lock:
+            return self.version, self.modified_at
+
+    def query(self, params: Optional[Dict[str, Any]] = None) -> List[ApiItem]:
+        """Items whose fields all equal ``params`` (compared as strings), in insertion order."""
+        with self._lock:
+            if not params:
+                return list(self._items.values())
+            buckets = [self._indexes[field].get(str(value), {}) for field, value in params.items() if field in self._indexes]
+            scanned = {field: str(value) for field, value in params.items() if field not in self._indexes}
+            if buckets:
+                smallest = min(buckets, key=len)
+                matches = [item_id for item_id in smallest if all(item_id in bucket for bucket in buckets)]
+                matches.sort(key=smallest.__getitem__)
+                candidates = (self._items[item_id] for item_id in matches)
+            else:
+                candidates = self._items.values()
+            return [
+                item for item in candidates
+                if all(str(item.get(field)) == value for field, value in scanned.items())
+            ]
+
+    def insert(self, data: Dict[str, Any]) -> ApiItem:
+        with self._lock:
+            item = ApiItem({"id": self.next_id, **data})
+            self.next_id += 1
+            self._store(item)
+            self._touch()
+            return item
+
+    def put(self, item_id, data: Dict[str, Any]) -> Optional[ApiItem]:
+        """Merge ``data`` into an item, as dict.update() did; None if there is no such item.
+
+        Ids cannot change: an ``id`` in ``data`` other than ``item_id`` raises ValueError.
+        """
+        if "id" in data and str(data["id"]) != str(item_id):
+            raise ValueError(f"Item ID {item_id} cannot be changed to {data['id']!r}.")
+        with self._lock:
+            current = self._items.get(item_id)
+            if current is None:
+                return None
+            item = ApiItem({**current, **data, "id": item_id})
+            self._unindex(current)
+            self._store(item)
+            self._touch()
+            return item
+
+    def delete(self, item_id) -> bool:
+        with self._lock:
+            item = self._items.pop(item_id, None)
+            if item is None:
+                return False
+            self._unindex(item)
+            del self._sequence[item_id]
+            self._touch()
+            return True
+
+class MockApiStore:
+    """Every mock endpoint's resource, shared process-wide."""
+
+    def __init__(self, seed: Dict[str, List[Dict[str, Any]]]):
+        self._resources = {endpoint: MockResource(items) for endpoint, items in seed.items()}
+
+    def resource(self, endpoint: str) -> Optional[MockResource]:
+        return self._resources.get(endpoint)
+
+    def query(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> List[ApiItem]:
+        """An endpoint's items (optionally filtered); empty for unknown endpoints."""
+        resource = self._resources.get(endpoint)
+        return resource.query(params) if resource is not None else []
+
+    def get(self, endpoint: str, item_id) -> Optional[ApiItem]:
+        resource = self._resources.get(endpoint)
+        return resource.get(item_id) if resource is not None else None
+
+mock_store = MockApiStore(MOCK_API_SEED)
@@ -0,0 +1,224 @@
+"""SQLAlchemy models for pmu.db."""
+from sqlalchemy import Boolean, Column, Integer, String, Text, Float, ForeignKey, Index, UniqueConstraint, Date, DateTime, func
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+
+# --- SQLAlchemy Models ---
+Base = declarative_base()
+
+class Employee(Base):
+    __tablename__ = "employees"
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    email = Column(String, unique=True)
+    password = Column(String)
+    workstreams = relationship("WorkStream", back_populates="employee")
+    targets = relationship("Target", back_populates="employee")
+    programs = relationship("Program", back_populates="employee")
+    schedules = relationship("Schedule", back_populates="employee")
+    workplans = relationship("WorkPlan", back_populates="supervisor")
+    field_teams = relationship("FieldTeam", back_populates="pmu")
+    meetings = relationship("Meeting", back_populates="employee")
+    calendar_tasks = relationship("CalendarTask", back_populates="employee")
+
+class WorkStream(Base):
+    __tablename__ = "workstreams"
+    id = Column(Integer, primary_key=True)
+    title = Column(String)
+    description = Column(Text)
+    category = Column(String)
+    employee_id = Column(Integer, ForeignKey("employees.id"))
+    employee = relationship("Employee", back_populates="workstreams")
+    workplans = relationship("WorkPlan", back_populates="workstream")
+
+class WorkPlan(Base):
+    __tablename__ = "workplans"
+    id = Column(Integer, primary_key=True)
+    title = Column(String)
+    details = Column(Text)
+    deadline = Column(Date)
+    status = Column(String, default="Not Started")
+    workstream_id = Column(Integer, ForeignKey("workstreams.id"))
+    workstream = relationship("WorkStream", back_populates="workplans")
+    supervisor_id = Column(Integer, ForeignKey("employees.id"))
+    supervisor = relationship("Employee", back_populates="workplans")
+    __table_args__ = (Index("ix_workplans_supervisor_deadline", "supervisor_id", "deadline", "id"),)
+
+class Target(Base):
+    __tablename__ = "targets"
+    id = Column(Integer, primary_key=True)
+    description = Column(String)
+    deadline = Column(Date)
+    status = Column(String, default="Not Started")
+    employee_id = Column(Integer, ForeignKey("employees.id"))
+    employee = relationship("Employee", back_populates="targets")
+    __table_args__ = (Index("ix_targets_employee_deadline", "employee_id", "deadline", "id"),)
+
+class Program(Base):
+    __tablename__ = "programs"
+    id = Column(Integer, primary_key=True)
+    name = Column(String, unique=True)
+    description = Column(Text)
+    status = Column(String, default="Active")
+    employee_id = Column(Integer, ForeignKey("employees.id"))
+    employee = relationship("Employee", back_populates="programs")
+    dashboard = relationship("ProgramDashboard", back_populates="program", uselist=False, cascade="all, delete-orphan")
+    metrics = relationship("ProgramMetric", back_populates="program", cascade="all, delete-orphan")
+    charts = relationship("ProgramChart", back_populates="program", cascade="all, delete-orphan")
+
+class ProgramDashboard(Base):
+    """How a program's KPI dashboard is presented; its numbers live in ProgramMetric."""
+    __tablename__ = "program_dashboards"
+    program_id = Column(Integer, ForeignKey("programs.id"), primary_key=True)
+    title = Column(String)
+    map_url = Column(String)
+    period_label = Column(String, default="Period")
+    headlines = Column(Text, default="[]")  # JSON list of [label, value] pairs
+    breakdown_title = Column(String)
+    program = relationship("Program", back_populates="dashboard")
+
+class ProgramMetric(Base):
+    __tablename__ = "program_metrics"
+    id = Column(Integer, primary_key=True)
+    program_id = Column(Integer, ForeignKey("programs.id"), nullable=False)
+    name = Column(String, nullable=False)
+    position = Column(Integer, default=0)
+    plotted = Column(Boolean, default=True)
+    program = relationship("Program", back_populates="metrics")
+    values = relationship("ProgramMetricValue", back_populates="metric", cascade="all, delete-orphan")
+    __table_args__ = (UniqueConstraint("program_id", "name", name="uq_program_metrics_program_name"),)
+
+class ProgramMetricValue(Base):
+    __tablename__ = "program_metric_values"
+    id = Column(Integer, primary_key=True)
+    metric_id = Column(Integer, ForeignKey("program_metrics.id"), nullable=False)
+    period = Column(String, nullable=False)
+    period_order = Column(Integer, default=0)
+    value = Column(Float)
+    metric = relationship("ProgramMetric", back_populates="values")
+    __table_args__ = (UniqueConstraint("metric_id", "period", name="uq_program_metric_values_metric_period"),)
+
+class ProgramChart(Base):
+    """A breakdown chart on a program dashboard: a Plotly Express kind plus a JSON spec."""
+    __tablename__ = "program_charts"
+    id = Column(Integer, primary_key=True)
+    program_id = Column(Integer, ForeignKey("programs.id"), nullable=False, index=True)
+    position = Column(Integer, default=0)
+    kind = Column(String, nullable=False)
+    spec = Column(Text, nullable=False)  # JSON {"data": {column: values}, "args": {px keyword: value}}
+    program = relationship("Program", back_populates="charts")
+
+class Schedule(Base):
+    __tablename__ = "schedules"
+    id = Column(Integer, primary_key=True)
+    employee_id = Column(Integer, ForeignKey("employees.id"))
+    date = Column(Date)
+    start_time = Column(String)
+    end_time = Column(String)
+    employee = relationship("Employee", back_populates="schedules")
+    gmeet_link = Column(String, nullable=True)
+
+class FieldTeam(Base):
+    __tablename__ = "field_teams"
+    id = Column(Integer, primary_key=True)
+    name = Column(String, unique=True)
+    pmu_id = Column(Integer, ForeignKey("employees.id"))
+    pmu = relationship("Employee", back_populates="field_teams")
+    tasks = relationship("Task", back_populates="field_team")
+
+class Task(Base):
+    __tablename__ = "tasks"
+    id = Column(Integer, primary_key=True)
+    description = Column(String)
+    deadline = Column(Date)
+    status = Column(String, default="Not Started")
+    field_team_id = Column(Integer, ForeignKey("field_teams.id"))
+    field_team = relationship("FieldTeam", back_populates="tasks")
+
+class FarmerData(Base):
+    __tablename__ = "farmer_data"
+    id = Column(Integer, primary_key=True)
+    farmer_name = Column(String)
+    number_of_cows = Column(Integer)
+    yield_per_cow = Column(Float)
+    date = Column(Date)
+    __table_args__ = (
+        Index("ix_farmer_data_date_id", "date", "id"),
+        Index("ix_farmer_data_farmer_name", "farmer_name"),
+    )
+
+class FarmerDailyRollup(Base):
+    """Per-day totals of farmer_data, maintained by triggers (see FARMER_ROLLUP_TRIGGERS)."""
+    __tablename__ = "farmer_daily_rollup"
+    date = Column(Date, primary_key=True)
+    records = Column(Integer, nullable=False, default=0)
+    total_cows = Column(Integer, nullable=False, default=0)
+    total_yield = Column(Float, nullable=False, default=0.0)
+    yield_records = Column(Integer, nullable=False, default=0)
+
+class DataVersion(Base):
+    """Change counter per table, bumped by triggers on every write to that table."""
+    __tablename__ = "data_versions"
+    name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+class SchemaMigration(Base):
+    """A bootstrap migration step that has been applied to this database."""
+    __tablename__ = "schema_migrations"
+    version = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    applied_at = Column(DateTime, server_default=func.current_timestamp())
+
+class SakshamSurvey(Base):
+    """One SAKSHAM seed survey per farmer per day, with its calculated requirements."""
+    __tablename__ = "saksham_surveys"
+    id = Column(Integer, primary_key=True)
+    farmer_id = Column(String, nullable=False)
+    farmer_name = Column(String)
+    survey_date = Column(Date, nullable=False)
+    state = Column(String)
+    spacing_unit = Column(String)
+    row_spacing = Column(Float)
+    plant_spacing = Column(Float)
+    acres = Column(Float)
+    mortality = Column(Float)
+    total_plants = Column(Float)
+    target_plants = Column(Float)
+    required_seeds = Column(Float)
+    required_packets = Column(Integer)
+    gaps = Column(Float)
+    gap_seeds = Column(Float)
+    gap_packets = Column(Integer)
+    updated_at = Column(DateTime, server_default=func.current_timestamp())
+    __table_args__ = (UniqueConstraint("farmer_id", "survey_date", name="uq_saksham_surveys_farmer_date"),)
+
+class Meeting(Base):
+    __tablename__ = "meetings"
+    id = Column(Integer, primary_key=True)
+    employee_id = Column(Integer, ForeignKey("employees.id"))
+    date = Column(Date)
+    start_time = Column(String)
+    end_time = Column(String)
+    description = Column(String)
+    employee = relationship("Employee", back_populates="meetings")
+
+class CalendarTask(Base):
+    __tablename__ = "calendar_tasks"
+    id = Column(Integer, primary_key=True)
+    employee_id = Column(Integer, ForeignKey("employees.id"))
+    date = Column(Date)
+    task = Column(Text)
+    employee = relationship("Employee", back_populates="calendar_tasks")
+
+class KanbanTask(Base):
+    __tablename__ = "kanban"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    status = Column(String, nullable=False, index=True)
+    task = Column(String, nullable=False)
+
+class ChatMessage(Base):
+    __tablename__ = "chat"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user = Column(String, nullable=False)
+    message = Column(Text, nullable=False)
+    timestamp = Column(DateTime, server_default=func.current_timestamp(), index=True)
@@ -0,0 +1,40 @@
+"""Page registry: sidebar key -> the module and function that render it.
+
+Page modules are imported on first use, so opening one page never pays for
+the imports of the others. Python caches the module after that, and so does
+every later rerun.
+"""
+from importlib import import_module
+from typing import Callable, Dict, NamedTuple
+
+
+class PageRef(NamedTuple):
+    module: str
+    function: str
+    takes_user: bool = False
+
+
+PAGES: Dict[str, PageRef] = {
+    "dashboard": PageRef("dashboard", "dashboard", takes_user=True),
+    "manage_programs": PageRef("programs", "manage_programs"),
+    "scheduling": PageRef("scheduling", "scheduling", takes_user=True),
+    "field_team_management": PageRef("field_teams", "field_team_management"),
+    "live_dashboard": PageRef("live", "live_dashboard"),
+    "reports": PageRef("reports", "reports"),
+    "settings": PageRef("settings", "settings", takes_user=True),
+    "saksham_dashboard": PageRef("saksham", "saksham_dashboard"),
+    "farmer_management_tracer": PageRef("tracer", "farmer_management_tracer"),
+    "training": PageRef("training", "training"),
+    "google_drive": PageRef("training", "google_drive"),
+    "team_chat": PageRef("chat", "team_chat", takes_user=True),
+    "email": PageRef("mail", "email"),
+    "calendar_view": PageRef("calendar_view", "calendar_view", takes_user=True),
+    "monthly_meeting": PageRef("monthly_meeting", "monthly_meeting", takes_user=True),
+    "api_test_ground": PageRef("api_test", "api_test_ground"),
+}
+
+
+def load_page(key: str) -> Callable:
+    """Import (once) and return the render function for sidebar page ``key``."""
+    ref = PAGES[key]
+    return getattr(import_module(f"{__name__}.{ref.module}"), ref.function)
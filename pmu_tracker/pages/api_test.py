@@ -0,0 +1,202 @@
+"""API test ground page."""
+import streamlit as st
+from datetime import date, datetime
+
+from pmu_tracker.api_client import api_client, api_delete, api_get, api_get_many, api_list, api_post, api_put
+from pmu_tracker.api_metrics import api_metrics
+
+API_STATS_POLL_SECONDS = 5
+
+def render_api_stats():
+    """Per-endpoint latency and error stats from the in-process API call buffer."""
+    stats = api_metrics.summary()
+    if not stats:
+        st.info("No API calls recorded yet.")
+        return
+    rows = [
+        "| Method | Endpoint | Calls | Errors | Cache hits | p50 ms | p95 ms | p99 ms | Max ms | KiB received |",
+        "|---|---|--:|--:|--:|--:|--:|--:|--:|--:|",
+    ]
+    for s in stats:
+        rows.append(
+            f"| {s.method} | /{s.endpoint} | {s.calls} | {s.errors} | {s.cache_hits} | {s.p50_ms:.1f} | {s.p95_ms:.1f}"
+            f" | {s.p99_ms:.1f} | {s.max_ms:.1f} | {s.response_bytes / 1024:.1f} |"
+        )
+    st.markdown("\n".join(rows))
+
+    histogram = api_metrics.latency_histogram()
+    st.markdown("**Latency histogram (calls)**")
+    st.markdown("\n".join([
+        "| " + " | ".join(histogram) + " |",
+        "|" + "--:|" * len(histogram),
+        "| " + " | ".join(str(count) for count in histogram.values()) + " |",
+    ]))
+    cache = api_client().cache
+    if cache is not None:
+        c = cache.stats()
+        st.caption(
+            f"Response cache: {c['entries']} entries, {c['bytes'] / 1024:.1f} KiB, {c['hits']} hits,"
+            f" {c['revalidations']} revalidations, {c['fetches']} fetches, {c['evictions']} evictions"
+        )
+    st.caption(f"Last {len(api_metrics)} calls in this process · checked at {datetime.now():%H:%M:%S}")
+
+# --- NEW: API Test Ground ---
+def api_test_ground():
+    st.subheader("🧪 API Test Ground")
+    st.write("Use this section to interact directly with the mock API and observe its behavior.")
+
+    st.markdown("### Get All Employees (GET)")
+    if st.button("Get All Employees"):
+        employees = api_get("employees")
+        if employees and employees["status"] == "success":
+            st.json(employees["data"])
+        else:
+            st.error("Failed to fetch employees.")
+
+    st.markdown("### Get Field Teams (GET)")
+    if st.button("Get All Field Teams"):
+        field_teams = api_get("field_teams")
+        if field_teams and field_teams["status"] == "success":
+            st.json(field_teams["data"])
+        else:
+            st.error("Failed to fetch field teams.")
+            
+    st.markdown("### Get Work Plans (GET)")
+    if st.button("Get All Work Plans"):
+        workplans = api_get("workplans")
+        if workplans and workplans["status"] == "success":
+            st.json(workplans["data"])
+        else:
+            st.error("Failed to fetch work plans.")
+            
+    st.markdown("### Get Targets (GET)")
+    if st.button("Get All Targets"):
+        targets = api_get("targets")
+        if targets and targets["status"] == "success":
+            st.json(targets["data"])
+        else:
+            st.error("Failed to fetch targets.")
+
+    st.markdown("### Get Every Endpoint (batched GET)")
+    if st.button("Get All Endpoints"):
+        for endpoint, body in api_get_many(["employees", "field_teams", "workplans", "targets"]).items():
+            if body:
+                st.markdown(f"**/{endpoint}** ({len(body['data'])} items)")
+                st.json(body["data"])
+
+    st.markdown("---")
+    st.markdown("### Add New Field Team (POST)")
+    with st.form("add_team_api_test"):
+        new_team_name = st.text_input("New Field Team Name")
+        if st.form_submit_button("Add Team via API"):
+            if new_team_name:
+                data_to_send = {"name": new_team_name, "pmu_id": st.session_state.user.id} # Assuming pmu_id from logged-in user
+                response = api_post("field_teams", data_to_send)
+                if response:
+                    st.success("Team added successfully via API (mock)! Check 'Get Field Teams' above.")
+                else:
+                    st.error("Failed to add team via API (mock).")
+                st.rerun()
+            else:
+                st.warning("Please enter a team name.")
+                
+    st.markdown("### Add New Work Plan (POST)")
+    with st.form("add_workplan_api_test"):
+        new_workplan_title = st.text_input("New Work Plan Title")
+        new_workplan_details = st.text_area("Work Plan Details")
+        new_workplan_deadline = st.date_input("Work Plan Deadline", date.today())
+        new_workplan_status = st.selectbox("Work Plan Status", ["Not Started", "In Progress", "Completed"], key="test_workplan_status")
+        
+        # Get existing workstreams for selection
+        existing_workstreams = api_list("workstreams")
+        ws_options = {f"{ws['title']} (ID: {ws['id']})": ws['id'] for ws in existing_workstreams}
+        selected_ws_id = st.selectbox("Select Workstream", options=list(ws_options.keys()), format_func=lambda x: x, index=0 if ws_options else None, key="test_workplan_ws_select")
+        
+        if st.form_submit_button("Add Work Plan via API"):
+            if new_workplan_title and new_workplan_details and selected_ws_id:
+                workstream_id_val = ws_options[selected_ws_id]
+                data_to_send = {
+                    "title": new_workplan_title,
+                    "details": new_workplan_details,
+                    "deadline": str(new_workplan_deadline),
+                    "status": new_workplan_status,
+                    "workstream_id": workstream_id_val,
+                    "supervisor_id": st.session_state.user.id
+                }
+                response = api_post("workplans", data_to_send)
+                if response:
+                    st.success("Work Plan added successfully via API (mock)! Check 'Get Work Plans' above.")
+                else:
+                    st.error("Failed to add work plan via API (mock).")
+                st.rerun()
+            else:
+                st.warning("Please fill all required fields for the work plan.")
+
+    st.markdown("---")
+    st.markdown("### Update Work Plan Status (PUT)")
+    mock_workplans = api_list("workplans")
+    mock_workplans_by_id = {wp["id"]: wp for wp in mock_workplans}
+    if mock_workplans:
+        wp_options = {f"{wp['title']} (ID: {wp['id']})": wp['id'] for wp in mock_workplans}
+        selected_wp_id = st.selectbox(
+            "Select Work Plan to Update",
+            options=list(wp_options.keys()),
+            format_func=lambda x: x,
+            index=0 if wp_options else None,
+            key="selected_wp_update_id"
+        )
+        if selected_wp_id:
+            wp_id_to_update = wp_options[selected_wp_id]
+            current_wp = mock_workplans_by_id.get(wp_id_to_update)
+            if current_wp:
+                updated_status = st.selectbox(
+                    f"New Status for Work Plan ID {wp_id_to_update}",
+                    ["Not Started", "In Progress", "Completed"],
+                    index=["Not Started", "In Progress", "Completed"].index(current_wp['status']),
+                    key=f"update_wp_status_{wp_id_to_update}"
+                )
+                if st.button("Update Work Plan Status via API"):
+                    data_to_put = {"id": wp_id_to_update, "status": updated_status}
+                    response = api_put("workplans", data_to_put)
+                    if response:
+                        st.success("Work Plan status updated successfully via API (mock)!")
+                    else:
+                        st.error("Failed to update work plan status via API (mock).")
+                    st.rerun()
+            else:
+                st.warning("Work plan not found.")
+    else:
+        st.info("No mock work plans to update.")
+
+    st.markdown("---")
+    st.markdown("### Delete Work Plan (DELETE)")
+    if mock_workplans:
+        wp_delete_options = {f"{wp['title']} (ID: {wp['id']})": wp['id'] for wp in mock_workplans}
+        selected_wp_delete_id = st.selectbox(
+            "Select Work Plan to Delete",
+            options=list(wp_delete_options.keys()),
+            format_func=lambda x: x,
+            index=0 if wp_delete_options else None,
+            key="selected_wp_delete_id"
+        )
+        if selected_wp_delete_id:
+            wp_id_to_delete = wp_delete_options[selected_wp_delete_id]
+            if st.button("Delete Work Plan via API"):
+                response = api_delete("workplans", wp_id_to_delete)
+                if response:
+                    st.success("Work Plan deleted successfully via API (mock)!")
+                else:
+                    st.error("Failed to delete work plan via API (mock).")
+                st.rerun()
+    else:
+        st.info("No mock work plans to delete.")
+
+    st.markdown("---")
+    st.markdown("### API Call Stats (Admin)")
+    live = st.toggle(
+        "Live stats", key="api_stats_live",
+        help=f"Refresh the stats every {API_STATS_POLL_SECONDS} seconds.",
+    )
+    if st.button("Clear API Stats"):
+        api_metrics.clear()
+    st.fragment(render_api_stats, run_every=API_STATS_POLL_SECONDS if live else None)()
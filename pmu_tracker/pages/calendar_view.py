@@ -0,0 +1,137 @@
+"""Calendar page."""
+import streamlit as st
+import streamlit.components.v1 as components
+from datetime import date, time
+
+from pmu_tracker.db import SessionLocal
+from pmu_tracker.identity import UserPrincipal
+from pmu_tracker.models import CalendarTask, Meeting
+
+def calendar_view(user: UserPrincipal):
+    with SessionLocal() as db:
+        st.subheader("📆 Calendar Task Manager & Meetings")
+
+        selected_date_for_tasks = st.date_input("Select a date for tasks", date.today(), key="task_date_picker")
+
+        with st.form("add_calendar_task"):
+            task_text = st.text_input("Task for selected date", max_chars=500)
+            if st.form_submit_button("Add Task"):
+                if task_text:
+                    new_task = CalendarTask(employee_id=user.id, date=selected_date_for_tasks, task=task_text)
+                    db.add(new_task)
+                    db.commit()
+                    st.success("Task added!")
+                    st.rerun()
+                else:
+                    st.error("Task description cannot be empty.")
+
+        st.markdown(f"### 📝 Tasks on {selected_date_for_tasks.strftime('%b %d, %Y')}")
+        tasks = db.query(CalendarTask).filter_by(employee_id=user.id, date=selected_date_for_tasks).all()
+
+        if not tasks:
+            st.info("No tasks for this day.")
+        else:
+            for t in tasks:
+                col1, col2 = st.columns([0.8, 0.2])
+                with col1:
+                    st.write(f"- {t.task}")
+                with col2:
+                    if st.button("❌", key=f"del_task_{t.id}"):
+                        db.delete(t)
+                        db.commit()
+                        st.rerun()
+
+        st.markdown("---")
+
+        st.subheader("Create New Meeting")
+        with st.form("add_meeting"):
+            meeting_date = st.date_input("Meeting Date", date.today(), key="meeting_date_picker")
+            meeting_start_time = st.time_input("Meeting Start Time", time(9, 0))
+            meeting_end_time = st.time_input("Meeting End Time", time(10, 0))
+            meeting_description = st.text_input("Meeting Description", max_chars=500)
+
+            if st.form_submit_button("Add Meeting"):
+                if meeting_start_time < meeting_end_time and meeting_description:
+                    new_meeting = Meeting(
+                        employee_id=user.id,
+                        date=meeting_date,
+                        start_time=str(meeting_start_time),
+                        end_time=str(meeting_end_time),
+                        description=meeting_description,
+                    )
+                    db.add(new_meeting)
+                    db.commit()
+                    st.success("Meeting added successfully!")
+                    st.rerun()
+                elif not meeting_description:
+                    st.error("Meeting description cannot be empty.")
+                else:
+                    st.error("Meeting end time must be after start time.")
+
+        st.subheader("Your Upcoming Meetings")
+        meetings = db.query(Meeting).filter_by(employee_id=user.id).order_by(Meeting.date, Meeting.start_time).all()
+
+        if not meetings:
+            st.info("No upcoming meetings.")
+        else:
+            for meeting in meetings:
+                with st.container(border=True):
+                    st.markdown(f"**Date**: {meeting.date.strftime('%Y-%m-%d')}")
+                    st.markdown(f"**Time**: {meeting.start_time} - {meeting.end_time}")
+                    st.markdown(f"**Description**: {meeting.description}")
+                    if st.button("Delete Meeting", key=f"del_meeting_{meeting.id}"):
+                        db.delete(meeting)
+                        db.commit()
+                        st.rerun()
+
+        st.markdown("---")
+        st.markdown("### 📅 Availability Calendar")
+        components.html("""
+        <head>
+            <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/flatpickr/dist/flatpickr.min.css">
+            <style>
+                .flatpickr-calendar {
+                    font-family: 'Segoe UI', sans-serif;
+                    border-radius: 12px;
+                    box-shadow: 0 10px 25px rgba(0,0,0,0.15);
+                }
+                .flatpickr-day.available {
+                    background-color: #2b2d42;
+                    color: white;
+                    border-radius: 50%;
+                }
+                .flatpickr-day.unavailable {
+                    background-color: #e0e0e0;
+                    color: #aaa;
+                    pointer-events: none;
+                }
+                .flatpickr-day.selected {
+                    background-color: #00b4d8 !important;
+                    color: white;
+                    border-radius: 50%;
+                }
+            </style>
+        </head>
+        <body>
+            <input type="text" id="calendar" placeholder="Select a date" style="padding: 10px; font-size: 16px; width: 200px; border-radius: 8px; border: 1px solid #ccc;">
+            <script src="https://cdn.jsdelivr.net/npm/flatpickr"></script>
+            <script>
+                flatpickr("#calendar", {
+                    inline: true,
+                    defaultDate: "today",
+                    onDayCreate: function(dObj, dStr, fp, dayElem) {
+                        let date = dayElem.dateObj.toISOString().split('T')[0];
+                        if(["2023-07-26", "2023-08-10", "2023-08-23"].includes(date)) {
+                            dayElem.classList.add("available");
+                        }
+                        if(["2023-07-27", "2023-08-11"].includes(date)) {
+                            dayElem.classList.add("unavailable");
+                        }
+                    },
+                    onChange: function(selectedDates, dateStr, instance) {
+                        window.parent.postMessage({ type: 'SELECTED_DATE_JS', value: dateStr }, '*');
+                    }
+                });
+            </script>
+        </body>
+        """, height=400)
@@ -0,0 +1,97 @@
+"""Team chat page."""
+import streamlit as st
+from sqlalchemy import insert, select
+from datetime import datetime
+import threading
+from typing import Optional, List
+
+from pmu_tracker.db import engine, write_transaction
+from pmu_tracker.identity import UserPrincipal
+from pmu_tracker.models import ChatMessage
+
+# --- Team Chat ---
+# Each session keeps the rendered feed and the id of the newest message it has
+# seen, so a refresh only fetches messages with a larger id. In live mode the
+# feed fragment long-polls the in-process notifier, which add_chat_message()
+# wakes after every commit. The feed is read on every poll, so reads and
+# writes are Core statements on pooled connections rather than ORM Sessions,
+# whose per-call setup cost about 3x the query itself.
+CHAT_HISTORY_LIMIT = 50
+CHAT_LONG_POLL_SECONDS = 2
+CHAT_FEED_QUERY = select(ChatMessage.id, ChatMessage.user, ChatMessage.message, ChatMessage.timestamp).order_by(ChatMessage.id.desc())
+
+class ChatNotifier:
+    """Lets chat readers block until a message newer than theirs is committed."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._latest_id = 0
+
+    def publish(self, message_id: int):
+        with self._condition:
+            self._latest_id = max(self._latest_id, message_id)
+            self._condition.notify_all()
+
+    def wait_for_newer(self, last_seen_id: int, timeout: float) -> bool:
+        """Return True as soon as a message with id > ``last_seen_id`` is published."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._latest_id > last_seen_id, timeout)
+
+chat_notifier = ChatNotifier()
+
+def get_team_chat(after_id: Optional[int] = None, limit: int = CHAT_HISTORY_LIMIT) -> List[tuple[int, str, str, datetime]]:
+    """Return the newest ``limit`` messages (optionally only those after ``after_id``), oldest first."""
+    query = CHAT_FEED_QUERY.limit(limit)
+    if after_id is not None:
+        query = query.where(ChatMessage.id > after_id)
+    with engine.connect() as conn:
+        return conn.execute(query).all()[::-1]
+
+def add_chat_message(user: str, message: str) -> int:
+    with write_transaction(engine) as conn:
+        message_id = conn.execute(insert(ChatMessage).values(user=user, message=message)).inserted_primary_key[0]
+    chat_notifier.publish(message_id)
+    return message_id
+
+def sync_chat_history() -> List[tuple[str, str]]:
+    """Append messages newer than this session's high-water mark to its cached feed."""
+    if "chat_history" not in st.session_state:
+        st.session_state.chat_history = []
+        st.session_state.chat_last_seen_id = None
+
+    new_messages = get_team_chat(after_id=st.session_state.chat_last_seen_id)
+    if new_messages:
+        history = st.session_state.chat_history
+        history.extend(
+            (chat_user, f"[{timestamp.strftime('%H:%M')}] {message}")
+            for _, chat_user, message, timestamp in new_messages
+        )
+        del history[:-CHAT_HISTORY_LIMIT]
+        st.session_state.chat_last_seen_id = new_messages[-1][0]
+    return st.session_state.chat_history
+
+def render_chat_feed(live: bool):
+    # A full script run sets this flag; only fragment-only reruns long-poll,
+    # so typing or sending a message never waits on the notifier.
+    full_run = st.session_state.pop("chat_feed_full_run", False)
+    if live and not full_run:
+        chat_notifier.wait_for_newer(st.session_state.get("chat_last_seen_id") or 0, CHAT_LONG_POLL_SECONDS)
+
+    chat_container = st.container(height=400, border=True)
+    for chat_user, text in sync_chat_history():
+        chat_container.chat_message(chat_user).write(text)
+
+def team_chat(user: UserPrincipal):
+    st.subheader("💬 Team Chat")
+    live = st.toggle("Live updates", key="chat_live_updates")
+    st.session_state.chat_feed_full_run = True
+    st.fragment(render_chat_feed, run_every=CHAT_LONG_POLL_SECONDS if live else None)(live)
+
+    with st.form("Send Chat Message"):
+        message = st.text_input("Message", key="chat_message_input")
+        if st.form_submit_button("Send"):
+            if message:
+                add_chat_message(user.name, message)
+                st.rerun()
+            else:
+                st.warning("Please enter a message to send.")
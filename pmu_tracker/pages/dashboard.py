@@ -0,0 +1,352 @@
+"""Home dashboard: org chart, kanban board, to-do list and PMU status lists."""
+import streamlit as st
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+import pandas as pd
+from typing import Optional, List, Dict
+
+from pmu_tracker.assets import get_org_chart_image, load_team_photos
+from pmu_tracker.db import engine, SessionLocal, write_transaction
+from pmu_tracker.identity import user_schedules, user_workstreams, UserPrincipal
+from pmu_tracker.kpi_store import program_kpi_version
+from pmu_tracker.models import KanbanTask, Program, ProgramDashboard, Target, WorkPlan, WorkStream
+from pmu_tracker.program_dashboards import program_dashboard
+from pmu_tracker.status import apply_status_changes, KANBAN_STATUSES, status_counts, STATUS_OPTIONS, StatusChange
+from pmu_tracker.status_lists import status_list_editor
+
+# --- Pop-up for Organizational Chart ---
+def show_org_chart_popup():
+    # Using st.dialog (Streamlit 1.28+) for a more native pop-up
+    if 'show_org_chart' not in st.session_state:
+        st.session_state.show_org_chart = False
+
+    if st.button("View Organizational Chart 🏢"):
+        st.session_state.show_org_chart = True
+
+    if st.session_state.show_org_chart:
+        with st.container(border=True): # Use a container to simulate a modal
+            st.subheader("Organizational Chart")
+            img = get_org_chart_image()
+            if img is not None:
+                st.image(img, use_container_width=True)
+            else:
+                st.error("Failed to load organizational chart image. Please check the URL or your internet connection.")
+            if st.button("Close Chart"):
+                st.session_state.show_org_chart = False
+                st.rerun() # Rerun to close the pop-up
+            st.markdown("---") # Add a separator inside the container for better visual
+
+# --- Dashboard UI ---
+def dashboard(user: UserPrincipal):
+    st.markdown(
+        "<h1 style='text-align:center; color:#020431;'>Project Management Dashboard</h1>",
+        unsafe_allow_html=True,
+    )
+    st.sidebar.markdown("### Logged in as")
+    st.sidebar.success(user.name)
+    if st.sidebar.button("🔓 Logout", key="logout_button_sidebar"):
+        st.session_state.user = None
+        st.rerun()
+
+    # Place the "Meet the Team" section directly on the Dashboard
+    st.markdown("---")
+    st.title("🤝 Meet the Team")
+    st.write("Get to know the individuals driving our success.")
+
+    team_members = [
+        {"name": "Rupesh Mukherjee", "role": "Associate Practice Leader", "photo": "https://drive.google.com/file/d/1HDqOqs5rnFDcPXr0dy0p2NBpw7jgxt-I/view?usp=drive_link"},
+        {"name": "Kuntal Dutta", "role": "Sr. Manager - Field", "photo": "https://drive.google.com/file/d/1msWObOwQjuZfa-LBV9cCfI9Y096Y7RWQ/view?usp=drive_link"},
+        {"name": "Shifali Sharma", "role": "Manager - Field", "photo": "https://drive.google.com/file/d/1oV23e3yA3J9AYWd-_hLqZaDi8iMczzzV/view?usp=drive_link"},
+        {"name": "Jhelum Chowdhury", "role": "Consultant", "photo": "https://drive.google.com/file/d/1s-KHiHPDRTGhg8k17KK1dBo2cOsUe-v1/view?usp=drive_link"},
+        {"name": "Dr. Ramakrishna", "role": "Advisor", "photo": "https://via.placeholder.com/80?text=DR"},
+        {"name": "Sachin Wadpalliwar", "role": "Manager - Field", "photo": "https://drive.google.com/uc?id=1JcxGANNNz-cuNiDe5CUKh9rTWZSiPhMM"},
+        {"name": "Aditya Yuvaraj", "role": "Associate - Field", "photo": "https://drive.google.com/file/d/1Kv0GjnUbx9PKw8g9hUZAccXA6RTadDAG/view?usp=drive_link"},
+        {"name": "Aniket Govekar", "role": "Assistant Manager - Field", "photo": "https://via.placeholder.com/80?text=AG"},
+        {"name": "Bhushan Sananse", "role": "Assistant Manager - Field", "photo": "https://drive.google.com/uc?id=1ofRfjXogxGL5hzK79ZBbx_AuUuZl8Iuu"},
+        {"name": "Nilesh Dhanwate", "role": "Senior Executive - Field", "photo": "https://drive.google.com/uc?id=1XH1iEJKsbcay5dugj2Eub_fOsqXHQhfW"},
+        {"name": "Subrat Ghoshal", "role": "Senior Executive - Field", "photo": "https://via.placeholder.com/80?text=SG"},
+        {"name": "K Balaji", "role": "Senior Associate - Field", "photo": "https://drive.google.com/file/d/1pxOvDZQk4gY2hO-kfuwIEfGMg0iQzMFK/view?usp=drive_link"},
+        {"name": "Guru Mohan Kakanuru Reddy", "role": "Assistant Manager - Field", "photo": "https://drive.google.com/uc?id=1E1-m1V6xnIhTTn69ZB9Xy4hiJmsTUTwX"},
+        {"name": "Ajay Vaghela", "role": "Senior Associate - Field", "photo": "https://via.placeholder.com/80?text=AV"},
+        {"name": "Happy Vaishnavi", "role": "Senior Associate - Field", "photo": "https://via.placeholder.com/80?text=HV"},
+        {"name": "Nikhita VK", "role": "Senior Associate - Field", "photo": "https://drive.google.com/file/d/1_hR07Cd45EifHIUcCoE_cuIUbJVuCa81/view?usp=drive_link"},
+        {"name": "Bhavya Kharoo", "role": "Senior Associate - Field", "photo": "https://drive.google.com/uc?id=19gP4zdJMW6SMnrt0IZRcXw2LwUMeaxEn"},
+        {"name": "Kriti Suneha", "role": "Senior Associate - Field", "photo": "https://drive.google.com/file/d/12Jz53BLp0H2LmdDGYwAdnqoS55m68x3p/view?usp=drive_link"},
+        {"name": "Ranu Laddha", "role": "Associate - Field", "photo": "https://via.placeholder.com/80?text=RL"},
+        {"name": "Pari Sharma", "role": "Associate - Field", "photo": "https://via.placeholder.com/80?text=PS"},
+        {"name": "Muskan Kaushal", "role": "Associate - Field", "photo": "https://via.placeholder.com/80?text=MK"},
+        {"name": "Ramalakshmi Somanchi", "role": "Associate - Field", "photo": "https://drive.google.com/file/d/1kwsZSKYcHdwonnZpoBI1gMCRCMjqaFbO/view?usp=drive_link"},
+        {"name": "Sandeep GS", "role": "Senior Associate - Field", "photo": "https://drive.google.com/file/d/1-9boy9pSfz2hwLIxKncJ_g4hYo8raMuD/view?usp=drive_link"},
+        {"name": "Hrushikesh Tilekar", "role": "Associate", "photo": "https://via.placeholder.com/80?text=HT"},
+    ]
+
+    # Display team members in a responsive grid
+    photos = load_team_photos([member["photo"] for member in team_members])
+    cols_per_row = 3 # Adjust as needed for screen size
+    for i in range(0, len(team_members), cols_per_row):
+        cols = st.columns(cols_per_row)
+        for j in range(cols_per_row):
+            if i + j < len(team_members):
+                member = team_members[i + j]
+                with cols[j]:
+                    with st.container(border=True):
+                        st.markdown(f"**{member['name']}**")
+                        st.markdown(f"*{member['role']}*")
+                        photo = photos.get(member["photo"])
+                        if photo is not None:
+                            st.image(photo, width=120, caption=member['name'])
+                        else:
+                            st.warning(f"Could not load image for {member['name']}. Using placeholder.")
+                            st.image("https://via.placeholder.com/120?text=No+Photo", width=120)
+    st.markdown("---") # Separator between rows of team members
+
+    # Call the pop-up function for the organizational chart
+    show_org_chart_popup()
+
+    st.markdown("---") # Separator before the dashboard tabs
+
+    # Tabs for different dashboards: two fixed ones, then one per active program
+    with SessionLocal() as db:
+        kpi_version = program_kpi_version(db)
+        programs = db.query(Program.id, Program.name).outerjoin(ProgramDashboard).filter(
+            Program.status == "Active"
+        ).order_by(ProgramDashboard.program_id.is_(None), Program.id).all()
+    tab1, tab2, *program_tabs = st.tabs(
+        ["Field Team Dashboard", "PMU Dashboard", *[f"{name} Dashboard" for _, name in programs]]
+    )
+
+    with tab1:
+        st.subheader("📊 Field Team Progress")
+        st.write("This is where you can display field team progress and metrics.")
+        display_todo()
+
+    with tab2:
+        pmu_dashboard(user)
+        display_kanban()
+
+    for tab, (program_id, program_name) in zip(program_tabs, programs):
+        with tab:
+            program_dashboard(program_id, program_name, kpi_version)
+
+# --- Kanban Board Functions (SQLite for simplicity) ---
+# The board is read on every dashboard rerun, so it is a Core statement on a
+# pooled connection: an ORM Session per call cost about 3x the query itself.
+KANBAN_TASKS_QUERY = select(KanbanTask.id, KanbanTask.status, KanbanTask.task).order_by(KanbanTask.id)
+
+def get_kanban_tasks() -> List[tuple[int, str, str]]:
+    with engine.connect() as conn:
+        return [tuple(row) for row in conn.execute(KANBAN_TASKS_QUERY)]
+
+def get_kanban_board(tasks: Optional[List[tuple[int, str, str]]] = None) -> Dict[str, List[str]]:
+    board = {status: [] for status in KANBAN_STATUSES}
+    for _, status, task in (get_kanban_tasks() if tasks is None else tasks):
+        if status in board:
+            board[status].append(task)
+    return board
+
+def add_kanban_task(status: str, task: str):
+    with write_transaction(engine) as conn:
+        conn.execute(insert(KanbanTask).values(status=status, task=task))
+
+def display_kanban():
+    st.subheader("🗂️ Kanban Board")
+    kanban_tasks = get_kanban_tasks()
+    board = get_kanban_board(kanban_tasks)
+    cols = st.columns(len(board))
+    for i, (col_name, tasks) in enumerate(board.items()):
+        with cols[i]:
+            st.markdown(f"### {col_name}")
+            if tasks:
+                for task in tasks:
+                    st.success(f"✅ {task}")
+            else:
+                st.info("No tasks here.")
+
+    if kanban_tasks:
+        with st.expander("🔀 Move Tasks"):
+            with st.form("Move Kanban Tasks"):
+                frame = pd.DataFrame(kanban_tasks, columns=["ID", "Status", "Task"])
+                edited = st.data_editor(
+                    frame,
+                    key="kanban_move_editor",
+                    hide_index=True,
+                    use_container_width=True,
+                    disabled=["ID", "Task"],
+                    column_config={
+                        "Status": st.column_config.SelectboxColumn("Status", options=KANBAN_STATUSES, required=True),
+                    },
+                )
+                if st.form_submit_button("Save Moves"):
+                    moved = edited[edited["Status"] != frame["Status"]]
+                    try:
+                        apply_status_changes(
+                            [StatusChange("kanban", task_id, status) for task_id, status in zip(moved["ID"], moved["Status"])]
+                        )
+                        st.rerun()
+                    except ValueError as e:
+                        st.error(str(e))
+
+    with st.form("Add Kanban Task"):
+        task = st.text_input("Task Description", max_chars=255)
+        status = st.selectbox("Status", KANBAN_STATUSES)
+        if st.form_submit_button("Add Task"):
+            if task:
+                add_kanban_task(status, task)
+                st.rerun()
+            else:
+                st.error("Task description cannot be empty.")
+
+# --- To-Do List Functions (Session State for simplicity) ---
+def display_todo():
+    st.subheader("📝 To-Do List")
+    if "todo_list" not in st.session_state:
+        st.session_state.todo_list = []
+
+    with st.form("Add To-Do Item"):
+        todo_item = st.text_input("Enter a to-do item:", max_chars=255)
+        if st.form_submit_button("Add"):
+            if todo_item:
+                st.session_state.todo_list.append(todo_item)
+                st.rerun()
+            else:
+                st.error("To-do item cannot be empty.")
+
+    if st.session_state.todo_list:
+        for i, item in enumerate(st.session_state.todo_list):
+            st.write(f"{i+1}. {item}")
+        if st.button("Clear All To-Dos"):
+            st.session_state.todo_list = []
+            st.rerun()
+    else:
+        st.info("Your to-do list is empty!")
+
+def pmu_dashboard(user: UserPrincipal):
+    with SessionLocal() as db:
+        st.subheader("📋 PMU Work Plans and Targets")
+
+        schedules = user_schedules(user.id)
+
+        with st.expander("📌 Summary View"):
+            st.markdown("### 🧾 Progress Overview")
+
+            counts = status_counts.get(user.id)
+            for kind, heading, empty_message in (
+                ("workplans", "#### Workplans", "No work plans available for summary."),
+                ("targets", "#### Targets", "No targets available for summary."),
+            ):
+                if counts[kind]:
+                    st.write(heading)
+                    st.dataframe(
+                        pd.DataFrame(
+                            {"Status": STATUS_OPTIONS, "Count": [counts[kind].get(status, 0) for status in STATUS_OPTIONS]}
+                        ),
+                        use_container_width=True,
+                    )
+                else:
+                    st.info(empty_message)
+
+            st.write("#### Schedules")
+            if schedules:
+                schedule_df = pd.DataFrame(
+                    [
+                        {
+                            "Date": s.date,
+                            "Start Time": s.start_time,
+                            "End Time": s.end_time,
+                            "GMeet Link": s.gmeet_link if s.gmeet_link else "N/A",
+                        }
+                        for s in schedules
+                    ]
+                )
+                st.dataframe(schedule_df, use_container_width=True)
+            else:
+                st.info("No schedules available.")
+
+        with st.expander("➕ Add New Work Plan"):
+            with st.form("work_plan_form_pmu"):
+                title = st.text_input("Work Plan Title", max_chars=255)
+                details = st.text_area("Details")
+                deadline = st.date_input("Deadline")
+                status = st.selectbox("Status", ["Not Started", "In Progress", "Completed"])
+                workstream_titles = [ws.title for ws in user_workstreams(user.id)]
+                workstream_option = st.selectbox(
+                    "Workstream", ["Select...", "Add New Workstream..."] + workstream_titles, index=0
+                )
+
+                new_workstream_title = None
+                if workstream_option == "Add New Workstream...":
+                    new_workstream_title = st.text_input("New Workstream Title", key="new_workstream_title_input")
+
+                submitted = st.form_submit_button("Save Work Plan")
+
+                if submitted:
+                    if workstream_option == "Select...":
+                        st.error("Please select an existing workstream or add a new one.")
+                    elif workstream_option == "Add New Workstream..." and not new_workstream_title:
+                        st.error("Please enter a title for the new workstream.")
+                    else:
+                        workstream_obj = None
+                        if workstream_option == "Add New Workstream...":
+                            try:
+                                new_ws = WorkStream(title=new_workstream_title, description="", category="General", employee_id=user.id)
+                                db.add(new_ws)
+                                db.commit()
+                                workstream_obj = new_ws
+                                st.success(f"New workstream '{new_workstream_title}' created!")
+                            except IntegrityError:
+                                db.rollback()
+                                st.error(f"Workstream '{new_workstream_title}' already exists. Please choose a different name.")
+                                workstream_obj = db.query(WorkStream).filter_by(title=new_workstream_title, employee_id=user.id).first()
+                        else:
+                            workstream_obj = db.query(WorkStream).filter_by(title=workstream_option, employee_id=user.id).first()
+
+                        if workstream_obj:
+                            new_workplan = WorkPlan(
+                                title=title,
+                                details=details,
+                                deadline=deadline,
+                                status=status,
+                                supervisor_id=user.id,
+                                workstream_id=workstream_obj.id,
+                            )
+                            db.add(new_workplan)
+                            db.commit()
+                            st.success("✅ Work Plan saved successfully!")
+                            st.rerun()
+                        else:
+                            st.error("Failed to link work plan to a workstream. Please try again.")
+
+        with st.expander("➕ Add New Target"):
+            with st.form("target_form_pmu"):
+                description = st.text_area("Target Description")
+                deadline = st.date_input("Target Deadline")
+                status = st.selectbox("Target Status", ["Not Started", "In Progress", "Completed"])
+
+                if st.form_submit_button("Save Target"):
+                    if description and deadline:
+                        new_target = Target(
+                            description=description,
+                            deadline=deadline,
+                            status=status,
+                            employee_id=user.id,
+                        )
+                        db.add(new_target)
+                        db.commit()
+                        st.success("✅ Target saved.")
+                        st.rerun()
+                    else:
+                        st.error("Please fill in all target fields.")
+
+        st.subheader("📌 Your Work Plans and Targets")
+
+        st.write("### Work Plans")
+        status_list_editor(
+            db, "pmu_workplans", "workplan", user.id,
+            {"title": "Title", "details": "Details"}, allow_delete=True,
+        )
+
+        st.write("### Targets")
+        status_list_editor(
+            db, "pmu_targets", "target", user.id,
+            {"description": "Target"}, allow_delete=True,
+        )
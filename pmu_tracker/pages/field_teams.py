@@ -0,0 +1,180 @@
+"""Field team management page."""
+import streamlit as st
+from sqlalchemy.exc import IntegrityError
+import pandas as pd
+
+from pmu_tracker.db import SessionLocal
+from pmu_tracker.identity import user_field_teams
+from pmu_tracker.api_client import api_delete, api_get, api_list, api_post, api_put
+from pmu_tracker.models import FieldTeam, Task
+
+def field_team_management():
+    with SessionLocal() as db:
+        st.subheader("👥 Field Team Management")
+
+        with st.form("add_field_team"):
+            team_name = st.text_input("Field Team Name", max_chars=100)
+            if st.form_submit_button("Add Field Team"):
+                if team_name:
+                    try:
+                        new_team = FieldTeam(name=team_name, pmu_id=st.session_state.user.id)
+                        db.add(new_team)
+                        db.commit()
+                        st.success(f"Field Team '{team_name}' added successfully!")
+                        st.rerun()
+                    except IntegrityError:
+                        db.rollback()
+                        st.error(f"Field Team '{team_name}' already exists.")
+                    except Exception as e:
+                        db.rollback()
+                        st.error(f"An error occurred while adding the team: {e}")
+                else:
+                    st.error("Field Team Name cannot be empty.")
+
+        st.subheader("Existing Field Teams")
+        field_teams = user_field_teams(st.session_state.user.id)
+        if field_teams:
+            for team in field_teams:
+                col1, col2 = st.columns([3, 1])
+                col1.markdown(f"**Team Name**: {team.name}")
+                if col2.button(f"Delete {team.name}", key=f"delete_team_{team.id}"):
+                    try:
+                        db.delete(db.get(FieldTeam, team.id))
+                        db.commit()
+                        st.success(f"Field Team '{team.name}' deleted successfully!")
+                        st.rerun()
+                    except Exception as e:
+                        db.rollback()
+                        st.error(f"Error deleting team: {e}")
+            st.markdown("---")
+            st.subheader("Add Tasks to Field Teams")
+            with st.form("add_team_task"):
+                selected_team_id = st.selectbox(
+                    "Select Team",
+                    options=[t.id for t in field_teams],
+                    format_func=dict(field_teams).get,
+                    index=None,
+                    placeholder="Select a team..."
+                )
+                task_description = st.text_area("Task Description", max_chars=500)
+                task_deadline = st.date_input("Task Deadline")
+                task_status = st.selectbox("Task Status", ["Not Started", "In Progress", "Completed"])
+
+                if st.form_submit_button("Add Task to Team"):
+                    if selected_team_id and task_description and task_deadline:
+                        try:
+                            new_task = Task(
+                                description=task_description,
+                                deadline=task_deadline,
+                                status=task_status,
+                                field_team_id=selected_team_id
+                            )
+                            db.add(new_task)
+                            db.commit()
+                            st.success("Task added to team successfully!")
+                            st.rerun()
+                        except Exception as e:
+                            db.rollback()
+                            st.error(f"Error adding task: {e}")
+                    else:
+                        st.error("Please fill in all task details and select a team.")
+
+            st.markdown("---")
+            st.subheader("Team Tasks Overview")
+            for team in field_teams:
+                st.markdown(f"#### Tasks for {team.name}")
+                tasks = db.query(Task).filter_by(field_team_id=team.id).all()
+                if tasks:
+                    task_data = []
+                    for task in tasks:
+                        task_data.append({
+                            "Description": task.description,
+                            "Deadline": task.deadline.strftime('%Y-%m-%d'),
+                            "Status": task.status
+                        })
+                    task_df = pd.DataFrame(task_data)
+                    st.dataframe(task_df, use_container_width=True)
+                else:
+                    st.info(f"No tasks for {team.name}.")
+        else:
+            st.info("No field teams available. Please add a team first.")
+
+    st.subheader("🌐 Field Team API Integration (Demonstration)")
+    st.write("This section demonstrates interactions with the Field Team Management API (a local stand-in serving mock data unless `PMU_API_BASE_URL` is set).")
+    
+    # Simulate API Call to Fetch Field Teams
+    if st.button("Simulate GET Field Teams (via API)"):
+        fetched_data = api_get("field_teams")
+        if fetched_data and fetched_data["status"] == "success":
+            st.success("Data fetched successfully:")
+            st.json(fetched_data["data"])
+        else:
+            st.warning("No data returned from API or API error occurred.")
+
+    # Simulate API Call to Add a Field Team
+    st.markdown("#### Simulate Adding a Field Team")
+    with st.form("simulate_add_field_team_api"):
+        new_team_name_api = st.text_input("New Field Team Name (for API)", key="new_team_name_api")
+        if st.form_submit_button("Simulate POST Field Team (via API)"):
+            if new_team_name_api:
+                data_to_post = {"name": new_team_name_api, "pmu_id": st.session_state.user.id}
+                post_result = api_post("field_teams", data_to_post)
+                if post_result and post_result["status"] == "success":
+                    st.success(f"MOCK API: Successfully added team: {post_result['data']['name']}")
+                else:
+                    st.error("MOCK API: Failed to add team.")
+                st.rerun()
+            else:
+                st.warning("Please enter a name for the new team.")
+
+    # Simulate API Call to Update a Field Team
+    st.markdown("#### Simulate Updating a Field Team")
+    mock_teams = api_list("field_teams")
+    mock_teams_by_id = {team["id"]: team for team in mock_teams}
+    if mock_teams:
+        team_options = {f"{team['name']} (ID: {team['id']})": team['id'] for team in mock_teams}
+        selected_team_update_id = st.selectbox(
+            "Select Team to Update",
+            options=list(team_options.keys()),
+            format_func=lambda x: x,
+            index=0 if team_options else None,
+            key="selected_team_update_id"
+        )
+        if selected_team_update_id:
+            team_id_to_update = team_options[selected_team_update_id]
+            current_team = mock_teams_by_id.get(team_id_to_update)
+            current_team_name = current_team["name"] if current_team else ""
+            updated_team_name_api = st.text_input(f"New Name for Team ID {team_id_to_update}", value=current_team_name, key="updated_team_name_api")
+            if st.button("Simulate PUT Field Team (via API)"):
+                data_to_put = {"id": team_id_to_update, "name": updated_team_name_api, "pmu_id": st.session_state.user.id}
+                put_result = api_put("field_teams", data_to_put)
+                if put_result and put_result["status"] == "success":
+                    st.success(f"MOCK API: Successfully updated team ID {team_id_to_update} to {put_result['data']['name']}.")
+                else:
+                    st.error("MOCK API: Failed to update team.")
+                st.rerun()
+    else:
+        st.info("No mock field teams to update.")
+
+    # Simulate API Call to Delete a Field Team
+    st.markdown("#### Simulate Deleting a Field Team")
+    if mock_teams:
+        team_options_delete = {f"{team['name']} (ID: {team['id']})": team['id'] for team in mock_teams}
+        selected_team_delete_id = st.selectbox(
+            "Select Team to Delete",
+            options=list(team_options_delete.keys()),
+            format_func=lambda x: x,
+            index=0 if team_options_delete else None,
+            key="selected_team_delete_id"
+        )
+        if selected_team_delete_id:
+            team_id_to_delete = team_options_delete[selected_team_delete_id]
+            if st.button("Simulate DELETE Field Team (via API)"):
+                delete_result = api_delete("field_teams", team_id_to_delete)
+                if delete_result and delete_result["status"] == "success":
+                    st.success(f"MOCK API: Successfully deleted team ID {team_id_to_delete}.")
+                else:
+                    st.error("MOCK API: Failed to delete team.")
+                st.rerun()
+    else:
+        st.info("No mock field teams to delete.")
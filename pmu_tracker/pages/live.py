@@ -0,0 +1,175 @@
+"""Live farmer analytics dashboard."""
+import streamlit as st
+from sqlalchemy import Integer, func
+from sqlalchemy.orm import Session
+import pandas as pd
+import plotly.io as pio
+from datetime import date, datetime
+from typing import Optional, Dict, Any, Tuple
+
+from pmu_tracker.charts import histogram_figure, time_series_figure
+from pmu_tracker.db import keyset_after, keyset_order, SessionLocal
+from pmu_tracker.models import DataVersion, FarmerDailyRollup, FarmerData
+
+# --- Live Analytics ---
+# live_dashboard() never loads the whole farmer_data table: the headline
+# metrics and the daily trend come from farmer_daily_rollup (one row per day),
+# the yield histogram is binned in SQL, and raw rows are paged with a keyset
+# on (date, id). The snapshot and the chart figures are cached per
+# data_versions change token. In live mode a small fragment re-reads that token
+# every LIVE_DASHBOARD_POLL_SECONDS and reruns the page only when it differs
+# from the version last rendered, so an idle dashboard re-sends nothing but
+# its "checked at" caption.
+FARMER_PAGE_SIZE = 50
+YIELD_HISTOGRAM_BINS = 10
+LIVE_DASHBOARD_POLL_SECONDS = 5
+
+def farmer_data_version(db: Session) -> int:
+    """Change token for farmer_data; it increases with every committed write."""
+    return db.query(DataVersion.version).filter(DataVersion.name == "farmer_data").scalar() or 0
+
+def live_metrics(db: Session) -> Dict[str, float]:
+    """Headline totals for the live dashboard, from the daily rollup."""
+    records, total_cows, total_yield, yield_records = db.query(
+        func.coalesce(func.sum(FarmerDailyRollup.records), 0),
+        func.coalesce(func.sum(FarmerDailyRollup.total_cows), 0),
+        func.coalesce(func.sum(FarmerDailyRollup.total_yield), 0.0),
+        func.coalesce(func.sum(FarmerDailyRollup.yield_records), 0),
+    ).one()
+    total_farmers = db.query(func.count(func.distinct(FarmerData.farmer_name))).scalar()
+    return {
+        "records": records,
+        "total_farmers": total_farmers,
+        "total_cows": total_cows,
+        "total_yield": total_yield,
+        "average_yield_per_cow": total_yield / yield_records if yield_records else 0.0,
+    }
+
+def daily_rollup_frame(db: Session) -> pd.DataFrame:
+    """Per-day record count, cows and total yield, oldest day first."""
+    rows = db.query(
+        FarmerDailyRollup.date, FarmerDailyRollup.records,
+        FarmerDailyRollup.total_cows, FarmerDailyRollup.total_yield,
+    ).order_by(FarmerDailyRollup.date).all()
+    frame = pd.DataFrame(rows, columns=["Date", "Records", "Number of Cows", "Yield per Cow (L)"])
+    frame["Date"] = pd.to_datetime(frame["Date"])
+    return frame
+
+def yield_histogram(db: Session, bins: int = YIELD_HISTOGRAM_BINS) -> pd.DataFrame:
+    """Equal-width bins of yield_per_cow counted by a GROUP BY, as (Bin Start, Bin End, Count)."""
+    low, high = db.query(func.min(FarmerData.yield_per_cow), func.max(FarmerData.yield_per_cow)).one()
+    if low is None:
+        return pd.DataFrame(columns=["Bin Start", "Bin End", "Count"])
+    width = (high - low) / bins or 1.0
+    bin_index = func.min(func.cast((FarmerData.yield_per_cow - low) / width, Integer), bins - 1)
+    counts = dict(
+        db.query(bin_index, func.count())
+        .filter(FarmerData.yield_per_cow.isnot(None))
+        .group_by(bin_index)
+        .all()
+    )
+    return pd.DataFrame({
+        "Bin Start": [low + i * width for i in range(bins)],
+        "Bin End": [low + (i + 1) * width for i in range(bins)],
+        "Count": [counts.get(i, 0) for i in range(bins)],
+    })
+
+def fetch_farmer_rows(db: Session, before: Optional[Tuple[date, int]],
+                      page_size: int = FARMER_PAGE_SIZE) -> list:
+    """Return up to ``page_size + 1`` farmer_data rows, newest first, strictly before ``before``.
+
+    Rows without a date come last.
+    """
+    query = db.query(
+        FarmerData.id, FarmerData.farmer_name, FarmerData.number_of_cows,
+        FarmerData.yield_per_cow, FarmerData.date,
+    )
+    if before is not None:
+        query = query.filter(keyset_after(FarmerData.date, FarmerData.id, before, descending=True))
+    return query.order_by(*keyset_order(FarmerData.date, FarmerData.id, descending=True)).limit(page_size + 1).all()
+
+def farmer_data_browser(db: Session):
+    """Newest-first view of farmer_data, FARMER_PAGE_SIZE rows at a time."""
+    cursors = st.session_state.setdefault("farmer_rows_cursors", [None])
+    rows = fetch_farmer_rows(db, cursors[-1])
+    has_next = len(rows) > FARMER_PAGE_SIZE
+    rows = rows[:FARMER_PAGE_SIZE]
+    frame = pd.DataFrame(
+        [row[1:] for row in rows],
+        columns=["Farmer Name", "Number of Cows", "Yield per Cow (L)", "Date"],
+    )
+    st.dataframe(frame, use_container_width=True, hide_index=True)
+
+    col_prev, col_page, col_next = st.columns([1, 2, 1])
+    if col_prev.button("◀ Newer", key="farmer_rows_prev", disabled=len(cursors) == 1):
+        cursors.pop()
+        st.rerun()
+    col_page.caption(f"Page {len(cursors)}")
+    if col_next.button("Older ▶", key="farmer_rows_next", disabled=not has_next):
+        cursors.append((rows[-1].date, rows[-1].id))
+        st.rerun()
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def load_live_snapshot(version: int) -> Dict[str, Any]:
+    """Metrics, daily rollup and yield histogram; ``version`` is only the cache key."""
+    with SessionLocal() as db:
+        return {
+            "metrics": live_metrics(db),
+            "daily_yield": daily_rollup_frame(db),
+            "histogram": yield_histogram(db),
+        }
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def live_figure_json(version: int) -> Tuple[str, str]:
+    """The daily trend and yield histogram figures for ``version``, as Plotly JSON."""
+    snapshot = load_live_snapshot(version)
+    fig_daily_yield = time_series_figure(
+        snapshot["daily_yield"], "Date", "Yield per Cow (L)", "Daily Total Yield Trend"
+    )
+    fig_yield_dist = histogram_figure(
+        snapshot["histogram"], "Distribution of Yield per Cow", "Yield per Cow (L)"
+    )
+    return fig_daily_yield.to_json(), fig_yield_dist.to_json()
+
+def render_live_analytics(version: int):
+    metrics = load_live_snapshot(version)["metrics"]
+    if not metrics["records"]:
+        st.warning("No farmer data available.")
+        return
+
+    st.metric("🧮 Total Farmers Recorded", metrics["total_farmers"])
+    st.metric("🐄 Total Cows Recorded", metrics["total_cows"])
+    st.metric("🍼 Total Yield Recorded (L)", f"{metrics['total_yield']:,.2f}")
+    st.metric("📊 Average Yield per Cow (L)", f"{metrics['average_yield_per_cow']:,.2f}")
+
+    st.subheader("📈 Data Analytics")
+
+    daily_yield_json, yield_dist_json = live_figure_json(version)
+    st.plotly_chart(pio.from_json(daily_yield_json), use_container_width=True)
+    st.plotly_chart(pio.from_json(yield_dist_json), use_container_width=True)
+    st.caption(f"Data version {version}")
+
+def poll_live_version():
+    """Rerun the page once farmer_data has moved past the version on screen."""
+    with SessionLocal() as db:
+        version = farmer_data_version(db)
+    if version != st.session_state.get("live_dashboard_version"):
+        st.rerun()
+    st.caption(f"Checked for new data at {datetime.now():%H:%M:%S}")
+
+def live_dashboard():
+    st.subheader("📈 Live Monitoring Dashboard")
+    live = st.toggle(
+        "Live updates", key="live_dashboard_live",
+        help=f"Check for new farmer data every {LIVE_DASHBOARD_POLL_SECONDS} seconds.",
+    )
+    with SessionLocal() as db:
+        version = farmer_data_version(db)
+    st.session_state.live_dashboard_version = version
+    render_live_analytics(version)
+    if live:
+        st.fragment(poll_live_version, run_every=LIVE_DASHBOARD_POLL_SECONDS)()
+
+    st.subheader("📊 Farmer Data Overview")
+    with SessionLocal() as db:
+        farmer_data_browser(db)
@@ -0,0 +1,19 @@
+"""Email page."""
+import streamlit as st
+
+def email():
+    st.subheader("📧 Email Integration (Placeholder)")
+    st.write("This section will eventually integrate with an email service (e.g., Gmail API).")
+
+    with st.form("send_email_form"):
+        recipient = st.text_input("Recipient Email", placeholder="recipient@example.com")
+        subject = st.text_input("Subject", max_chars=255)
+        body = st.text_area("Body")
+        submitted = st.form_submit_button("Send Email (Placeholder)")
+
+        if submitted:
+            if recipient and subject and body:
+                st.info(f"Simulating sending email to **{recipient}** with subject **'{subject}'**.")
+                st.success("Email sent (simulated)!")
+            else:
+                st.error("Please fill in all email fields.")
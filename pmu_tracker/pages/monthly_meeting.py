@@ -0,0 +1,144 @@
+"""Monthly meeting page."""
+import streamlit as st
+from sqlalchemy import literal, null, select, union_all
+from datetime import datetime
+import calendar
+
+from pmu_tracker.db import engine, keyset_order, SessionLocal
+from pmu_tracker.identity import UserPrincipal
+from pmu_tracker.models import Target, WorkPlan
+from pmu_tracker.status_lists import status_list_editor
+
+# --- Meeting Summary ---
+# The summary reads a user's work plans and targets as one UNION ALL ordered by
+# deadline (no deadline first, as in the paged lists) and streams it
+# MEETING_SUMMARY_CHUNK_ROWS rows at a time, so a supervisor with hundreds of
+# items never has both full lists loaded as ORM objects.
+MEETING_SUMMARY_CHUNK_ROWS = 500
+WORKPLAN_ITEM, TARGET_ITEM = 0, 1
+
+def meeting_items_query(user_id: int):
+    """``(kind, id, item, details, deadline, status)`` rows: work plans, then targets."""
+    workplans = select(
+        literal(WORKPLAN_ITEM).label("kind"),
+        WorkPlan.id.label("id"),
+        WorkPlan.title.label("item"),
+        WorkPlan.details.label("details"),
+        WorkPlan.deadline.label("deadline"),
+        WorkPlan.status.label("status"),
+    ).where(WorkPlan.supervisor_id == user_id)
+    targets = select(
+        literal(TARGET_ITEM), Target.id, Target.description, null(), Target.deadline, Target.status,
+    ).where(Target.employee_id == user_id)
+    items = union_all(workplans, targets).subquery()
+    return select(items).order_by(items.c.kind, *keyset_order(items.c.deadline, items.c.id))
+
+def monthly_meeting(user: UserPrincipal):
+    with SessionLocal() as db:
+        st.subheader("📅 Monthly Meeting Preparation")
+
+        now = datetime.now()
+        current_month = now.month
+        current_year = now.year
+
+        st.write(f"### Preparing for: {calendar.month_name[current_month]}, {current_year}")
+
+        st.write("### Your Work Plans and Progress")
+        status_list_editor(
+            db, "monthly_workplans", "workplan", user.id,
+            {"title": "Title", "details": "Details"}, notes_prefix="wp_notes_",
+        )
+        st.markdown("---")
+
+        st.write("### Your Targets and Progress")
+        status_list_editor(
+            db, "monthly_targets", "target", user.id,
+            {"description": "Description"}, notes_prefix="target_notes_",
+        )
+        st.markdown("---")
+
+
+        st.write("### Meeting Agenda Items")
+        agenda_items = [
+            "Review of last month's goals",
+            "Progress on current work plans",
+            "Discussion of any roadblocks",
+            "Setting goals for the next month",
+        ]
+        for item in agenda_items:
+            st.write(f"- {item}")
+
+        st.write("### Additional Notes for Meeting")
+        additional_notes = st.text_area(
+            "Enter any additional notes for the meeting (e.g., points to discuss, questions for supervisor)",
+            value=st.session_state.get("monthly_meeting_additional_notes", "")
+        )
+        if st.button("Save Additional Notes"):
+            st.session_state["monthly_meeting_additional_notes"] = additional_notes
+            st.success("Additional notes saved!")
+
+
+        if st.button("Generate Meeting Summary"):
+            sections = {WORKPLAN_ITEM: [], TARGET_ITEM: []}
+            with engine.connect() as conn:
+                rows = conn.execution_options(yield_per=MEETING_SUMMARY_CHUNK_ROWS).execute(meeting_items_query(user.id))
+                for kind, item_id, item, details, deadline, status in rows:
+                    deadline = deadline.strftime('%Y-%m-%d') if deadline else 'No deadline'
+                    if kind == WORKPLAN_ITEM:
+                        sections[kind].append(f"""
+                    - **Work Plan**: {item}
+                      - **Details**: {details}
+                      - **Deadline**: {deadline}
+                      - **Status**: {status}
+                      - **Notes**: {st.session_state.get(f"wp_notes_{item_id}", "No notes provided.")}
+                    """)
+                    else:
+                        sections[kind].append(f"""
+                    - **Target**: {item}
+                      - **Deadline**: {deadline}
+                      - **Status**: {status}
+                      - **Notes**: {st.session_state.get(f"target_notes_{item_id}", "No notes provided.")}
+                    """)
+            summary = f"""
+            ## Monthly Meeting Summary: {calendar.month_name[current_month]}, {current_year}
+
+            ### Employee: {user.name}
+
+            ---
+
+            ### Work Plans and Progress:
+            """
+            summary += "".join(sections[WORKPLAN_ITEM]) or "No work plans found for this period."
+
+            summary += f"""
+            ---
+
+            ### Targets and Progress:
+            """
+            summary += "".join(sections[TARGET_ITEM]) or "No targets found for this period."
+
+            summary += f"""
+            ---
+
+            ### General Meeting Agenda Items:
+            """
+            for item in agenda_items:
+                summary += f"- {item}\n"
+
+            summary += f"""
+            ---
+
+            ### Additional Notes for Discussion:
+            {additional_notes if additional_notes else "No additional notes."}
+
+            ---
+            """
+            st.markdown("### Generated Meeting Summary")
+            st.markdown(summary)
+
+            st.download_button(
+                label="Download Meeting Summary (Markdown)",
+                data=summary,
+                file_name=f"monthly_meeting_summary_{user.name.replace(' ', '_')}_{current_month}_{current_year}.md",
+                mime="text/markdown"
+            )
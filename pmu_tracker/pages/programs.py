@@ -0,0 +1,58 @@
+"""Program management page."""
+import streamlit as st
+from sqlalchemy.exc import IntegrityError
+
+from pmu_tracker.db import SessionLocal
+from pmu_tracker.kpi_store import bump_data_version, PROGRAM_KPI_VERSION_KEY
+from pmu_tracker.models import Program
+
+def manage_programs():
+    with SessionLocal() as db:
+        st.subheader("Manage Programs")
+
+        with st.form("add_program_form"):
+            name = st.text_input("Program Name", max_chars=255)
+            description = st.text_area("Program Description")
+            status = st.selectbox("Program Status", ["Active", "Inactive"])
+
+            if st.form_submit_button("Add Program"):
+                if name:
+                    try:
+                        new_program = Program(
+                            name=name,
+                            description=description,
+                            status=status,
+                            employee_id=st.session_state.user.id,
+                        )
+                        db.add(new_program)
+                        db.commit()
+                        st.success(f"Program '{name}' added successfully!")
+                        st.rerun()
+                    except IntegrityError:
+                        db.rollback()
+                        st.error(f"Program '{name}' already exists.")
+                    except Exception as e:
+                        db.rollback()
+                        st.error(f"An error occurred while adding the program: {e}")
+                else:
+                    st.error("Program name cannot be empty.")
+
+        st.subheader("Existing Programs")
+        programs = db.query(Program).all()
+        if programs:
+            for program in programs:
+                st.markdown(
+                    f"**Name**: {program.name} | **Description**: {program.description} | **Status**: {program.status}"
+                )
+                if st.button(f"Delete {program.name}", key=f"delete_program_{program.id}"):
+                    try:
+                        db.delete(program)
+                        bump_data_version(db, PROGRAM_KPI_VERSION_KEY)
+                        db.commit()
+                        st.success(f"Program '{program.name}' deleted.")
+                        st.rerun()
+                    except Exception as e:
+                        db.rollback()
+                        st.error(f"Error deleting program: {e}")
+        else:
+            st.info("No programs found.")
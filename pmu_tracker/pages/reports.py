@@ -0,0 +1,194 @@
+"""Report exports and the reports page."""
+import streamlit as st
+from sqlalchemy import func, literal, select, union_all
+import pandas as pd
+from datetime import date
+from tempfile import SpooledTemporaryFile
+from typing import Tuple, Iterator
+
+from pmu_tracker.config import REPORT_FORMATS
+from pmu_tracker.db import engine
+from pmu_tracker.models import Employee, Target, WorkPlan
+
+# --- Report Export ---
+# Reports are streamed from the database in chunks and written straight into a
+# SpooledTemporaryFile (in memory until it grows past REPORT_SPOOL_MAX_BYTES),
+# so generating one never needs the whole result set in memory or on disk.
+REPORT_CHUNK_ROWS = 10_000
+REPORT_PREVIEW_ROWS = 500
+REPORT_SPOOL_MAX_BYTES = 16 * 1024 * 1024
+EXCEL_MAX_DATA_ROWS = 1_048_575  # sheet row limit minus the header row
+
+def iter_report_chunks(stmt, chunk_rows: int = REPORT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """Yield the rows of ``stmt`` as DataFrames of at most ``chunk_rows`` rows."""
+    with engine.connect() as conn:
+        yield from pd.read_sql(stmt, conn, chunksize=chunk_rows)
+
+def _write_csv(chunks: Iterator[pd.DataFrame], buffer) -> int:
+    rows = 0
+    for i, chunk in enumerate(chunks):
+        buffer.write(chunk.to_csv(index=False, header=(i == 0)).encode())
+        rows += len(chunk)
+    return rows
+
+def _write_json(chunks: Iterator[pd.DataFrame], buffer) -> int:
+    rows = 0
+    buffer.write(b"[")
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        if rows:
+            buffer.write(b",")
+        buffer.write(chunk.to_json(orient="records", date_format="iso")[1:-1].encode())
+        rows += len(chunk)
+    buffer.write(b"]")
+    return rows
+
+def _write_parquet(chunks: Iterator[pd.DataFrame], buffer) -> int:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rows = 0
+    schema = None
+    writer = None
+    try:
+        for chunk in chunks:
+            if schema is None:
+                # A column that is entirely empty in the first chunk would be typed
+                # as null and reject later chunks; treat it as text instead.
+                inferred = pa.Schema.from_pandas(chunk, preserve_index=False)
+                schema = pa.schema(
+                    [field.with_type(pa.string()) if pa.types.is_null(field.type) else field for field in inferred]
+                )
+                writer = pq.ParquetWriter(buffer, schema)
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+def _write_excel(chunks: Iterator[pd.DataFrame], buffer) -> int:
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    rows = 0
+    sheet = None
+    sheet_rows = 0
+    columns = None
+    for chunk in chunks:
+        columns = list(chunk.columns)
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+        for row in chunk.itertuples(index=False, name=None):
+            if sheet is None or sheet_rows == EXCEL_MAX_DATA_ROWS:
+                sheet = workbook.create_sheet(f"Summary {len(workbook.sheetnames) + 1}")
+                sheet.append(columns)
+                sheet_rows = 0
+            sheet.append(row)
+            sheet_rows += 1
+            rows += 1
+    if sheet is None:
+        workbook.create_sheet("Summary 1").append(columns or [])
+    workbook.save(buffer)
+    return rows
+
+REPORT_WRITERS = {
+    "CSV": _write_csv,
+    "Excel": _write_excel,
+    "JSON": _write_json,
+    "Parquet": _write_parquet,
+}
+
+def export_report(stmt, report_format: str) -> Tuple[SpooledTemporaryFile, pd.DataFrame, int]:
+    """Stream ``stmt`` into a spooled buffer in ``report_format``.
+
+    Returns the buffer (rewound), a preview of the first rows and the row count.
+    """
+    preview = []
+
+    def chunks_with_preview():
+        for chunk in iter_report_chunks(stmt):
+            if not preview:
+                preview.append(chunk.head(REPORT_PREVIEW_ROWS))
+            yield chunk
+
+    buffer = SpooledTemporaryFile(max_size=REPORT_SPOOL_MAX_BYTES)
+    try:
+        row_count = REPORT_WRITERS[report_format](chunks_with_preview(), buffer)
+    except Exception:
+        buffer.close()
+        raise
+    buffer.seek(0)
+    return buffer, (preview[0] if preview else pd.DataFrame()), row_count
+
+def weekly_summary_query():
+    """One UNION ALL projection of work plans and targets joined to their assignee."""
+    workplans = (
+        select(
+            literal("Work Plan").label("Type"),
+            WorkPlan.title.label("Item"),
+            WorkPlan.details.label("Description"),
+            func.strftime("%Y-%m-%d", WorkPlan.deadline).label("Deadline"),
+            WorkPlan.status.label("Status"),
+            func.coalesce(Employee.name, "N/A").label("Assigned To"),
+        )
+        .outerjoin(Employee, WorkPlan.supervisor_id == Employee.id)
+    )
+    targets = (
+        select(
+            literal("Target"),
+            Target.description,
+            literal(""),
+            func.strftime("%Y-%m-%d", Target.deadline),
+            Target.status,
+            func.coalesce(Employee.name, "N/A"),
+        )
+        .outerjoin(Employee, Target.employee_id == Employee.id)
+    )
+    return union_all(workplans, targets)
+
+def reports():
+    st.subheader("📊 Reports")
+    st.markdown("### Weekly Document Summary")
+
+    report_format = st.session_state.get("settings", {}).get("report_format", "CSV")
+    extension, mime = REPORT_FORMATS[report_format]
+    summary_filename = f"weekly_summary_{date.today().strftime('%Y%m%d')}{extension}"
+
+    if st.button("Generate Weekly Summary"):
+        try:
+            export, preview, row_count = export_report(weekly_summary_query(), report_format)
+        except Exception as e:
+            st.error(f"Error generating {report_format} summary: {e}")
+        else:
+            # Read the export once here: reruns hand the same bytes to the
+            # download button instead of re-reading a spooled file kept in
+            # session state.
+            with export:
+                data = export.read()
+            if row_count:
+                st.session_state.weekly_summary = {
+                    "data": data,
+                    "file_name": summary_filename,
+                    "format": report_format,
+                    "mime": mime,
+                    "preview": preview,
+                    "row_count": row_count,
+                }
+                st.success(f"Weekly summary generated: **{summary_filename}**")
+            else:
+                st.info("No data available to generate a summary.")
+
+    summary = st.session_state.get("weekly_summary")
+    if summary:
+        st.dataframe(summary["preview"], use_container_width=True)
+        if summary["row_count"] > len(summary["preview"]):
+            st.caption(f"Showing the first {len(summary['preview']):,} of {summary['row_count']:,} rows.")
+        st.download_button(
+            label=f"Download Summary {summary['format']}",
+            data=summary["data"],
+            file_name=summary["file_name"],
+            mime=summary["mime"],
+        )
+    else:
+        st.info("No summary file generated yet.")
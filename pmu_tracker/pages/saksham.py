@@ -0,0 +1,293 @@
+"""SAKSHAM seed requirement calculator and survey store."""
+import streamlit as st
+from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+import pandas as pd
+import numpy as np
+from datetime import date
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+
+from pmu_tracker.db import engine, write_transaction
+from pmu_tracker.models import SakshamSurvey
+
+# --- Seed Requirement Calculator ---
+# Plant population and seed packet requirements for SAKSHAM surveys. The maths
+# works on whole columns at once so a village's worth of surveys (or a single
+# form entry, as a one-row frame) is computed in one pass.
+GERMINATION_RATE_PER_ACRE = {"Maharashtra": 14000, "Gujarat": 7400}
+SEED_CONFIDENCE_INTERVAL = 0.70
+SEEDS_PER_PACKET = 5625
+ACRE_TO_M2 = 4046.86
+SPACING_UNITS = {"cm": 0.01, "m": 1.0}
+SURVEY_COLUMNS = ["farmer_id", "state", "spacing_unit", "row_spacing", "plant_spacing", "acres", "mortality"]
+SEED_RESULT_COLUMNS = [
+    "total_plants", "target_plants", "required_seeds", "required_packets",
+    "gaps", "gap_seeds", "gap_packets",
+]
+
+def read_survey_upload(uploaded_file) -> pd.DataFrame:
+    """Read an uploaded CSV/XLSX of surveys, normalising headers to snake_case.
+
+    Every cell is read as text, so farmer IDs keep the exact form they are
+    typed in (``101``, not ``101.0``); calculate_seed_requirements() parses
+    the numeric columns.
+    """
+    if Path(uploaded_file.name).suffix.lower() in (".xlsx", ".xls"):
+        surveys = pd.read_excel(uploaded_file, dtype=str)
+    else:
+        surveys = pd.read_csv(uploaded_file, dtype=str)
+    surveys.columns = [str(c).strip().lower().replace(" ", "_") for c in surveys.columns]
+    missing = [c for c in SURVEY_COLUMNS if c not in surveys.columns]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}")
+    return surveys
+
+def calculate_seed_requirements(surveys: pd.DataFrame) -> pd.DataFrame:
+    """Return ``surveys`` with seed requirement columns added for every row.
+
+    Expects the SURVEY_COLUMNS. Rows that cannot be calculated (missing farmer
+    ID, unknown state or unit, non-positive spacing or area, mortality outside
+    0-100) get NaN results and a reason in the ``issue`` column.
+    """
+    result = surveys.copy()
+    for column in ("row_spacing", "plant_spacing", "acres", "mortality"):
+        result[column] = pd.to_numeric(result[column], errors="coerce").astype(float)
+    row_spacing = result["row_spacing"].to_numpy()
+    plant_spacing = result["plant_spacing"].to_numpy()
+    acres = result["acres"].to_numpy()
+    mortality = result["mortality"].to_numpy() / 100
+    unit_scale = result["spacing_unit"].astype(str).str.strip().str.lower().map(SPACING_UNITS).to_numpy(dtype=float)
+
+    issue = np.full(len(result), "", dtype=object)
+    checks = [
+        (result["farmer_id"].fillna("").astype(str).str.strip().eq("").to_numpy(), "missing farmer id"),
+        (~result["state"].isin(list(GERMINATION_RATE_PER_ACRE)).to_numpy(), "unknown state"),
+        (np.isnan(unit_scale), "unknown spacing unit"),
+        (~(row_spacing > 0) | ~(plant_spacing > 0), "spacing must be positive"),
+        (~(acres > 0), "area must be positive"),
+        (~((mortality >= 0) & (mortality < 1)), "mortality must be at least 0 and below 100"),
+    ]
+    for failed, reason in checks:
+        issue = np.where(failed & (issue == ""), reason, issue)
+    valid = issue == ""
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total_plants = acres * ACRE_TO_M2 / (row_spacing * unit_scale * plant_spacing * unit_scale)
+        target_plants = total_plants * SEED_CONFIDENCE_INTERVAL
+        effective_germination = SEED_CONFIDENCE_INTERVAL * (1 - mortality)
+        gaps = total_plants - total_plants * (effective_germination + mortality)
+        gap_seeds = gaps / effective_germination
+
+    computed = {
+        "total_plants": total_plants,
+        "target_plants": target_plants,
+        "required_seeds": target_plants,
+        "required_packets": np.floor(target_plants / SEEDS_PER_PACKET),
+        "gaps": gaps,
+        "gap_seeds": gap_seeds,
+        "gap_packets": np.floor(gap_seeds / SEEDS_PER_PACKET),
+    }
+    for column, values in computed.items():
+        result[column] = np.where(valid, values, np.nan)
+    result["issue"] = issue
+    return result
+
+def summarize_seed_requirements(results: pd.DataFrame) -> pd.DataFrame:
+    """Total seeds and packets per state over the rows that could be calculated."""
+    valid = results[results["issue"] == ""]
+    return (
+        valid.groupby("state")
+        .agg(
+            farmers=("farmer_id", "nunique"),
+            acres=("acres", "sum"),
+            required_seeds=("required_seeds", "sum"),
+            required_packets=("required_packets", "sum"),
+            gap_seeds=("gap_seeds", "sum"),
+            gap_packets=("gap_packets", "sum"),
+        )
+        .reset_index()
+    )
+
+def show_seed_batch_results(results: pd.DataFrame):
+    """Render totals, the per-state summary and per-farmer rows of a batch calculation."""
+    invalid = results[results["issue"] != ""]
+    summary = summarize_seed_requirements(results)
+    col1, col2, col3 = st.columns(3)
+    col1.metric("👥 Surveys Calculated", f"{len(results) - len(invalid):,}")
+    col2.metric("📦 Seed Packets Needed", f"{int(summary['required_packets'].sum()):,} packets")
+    col3.metric("📦 Packets for Gap Filling", f"{int(summary['gap_packets'].sum()):,} packets")
+    if not invalid.empty:
+        st.warning(f"⚠️ {len(invalid)} row(s) could not be calculated; see the `issue` column.")
+
+    st.subheader("By State")
+    st.dataframe(summary, hide_index=True, use_container_width=True)
+    st.subheader("Per Farmer")
+    st.dataframe(results, hide_index=True, use_container_width=True)
+    st.download_button(
+        "⬇️ Download Results (CSV)",
+        results.to_csv(index=False).encode("utf-8"),
+        file_name="seed_requirements.csv",
+        mime="text/csv",
+    )
+
+# --- SAKSHAM Survey Store ---
+# Calculated surveys are kept in saksham_surveys, one row per farmer per day.
+# save_surveys() upserts a submission in one transaction, SURVEY_BATCH_SIZE
+# rows per statement, and re-submitting a survey for the same farmer and day
+# replaces the earlier one instead of adding a row. Page views write nothing.
+SURVEY_BATCH_SIZE = 500
+SURVEY_INPUT_COLUMNS = ["state", "spacing_unit", "row_spacing", "plant_spacing", "acres", "mortality"]
+
+def survey_records(results: pd.DataFrame, survey_date: Optional[date] = None) -> List[Dict[str, Any]]:
+    """Turn the calculable rows of ``results`` into saksham_surveys rows.
+
+    The date comes from a ``survey_date`` column when present, else ``survey_date``
+    (default today).
+    """
+    valid = results[results["issue"] == ""]
+    if "survey_date" in valid.columns:
+        dates = pd.to_datetime(valid["survey_date"], errors="coerce").dt.date
+        dates = dates.where(dates.notna(), survey_date or date.today())
+    else:
+        dates = pd.Series(survey_date or date.today(), index=valid.index)
+    names = valid["farmer_name"] if "farmer_name" in valid.columns else pd.Series(None, index=valid.index)
+    records = pd.DataFrame({
+        "farmer_id": valid["farmer_id"].astype(str).str.strip(),
+        "farmer_name": names.where(names.notna(), None),
+        "survey_date": dates,
+        **{column: valid[column] for column in SURVEY_INPUT_COLUMNS + SEED_RESULT_COLUMNS},
+    })
+    records["required_packets"] = records["required_packets"].astype(int)
+    records["gap_packets"] = records["gap_packets"].astype(int)
+    return records.astype(object).to_dict("records")
+
+def save_surveys(records: List[Dict[str, Any]], bind=engine, batch_size: int = SURVEY_BATCH_SIZE) -> int:
+    """Upsert ``records`` keyed on (farmer_id, survey_date); return the number of surveys saved.
+
+    A later record for the same farmer and day replaces an earlier one.
+    """
+    rows = list({(record["farmer_id"], record["survey_date"]): record for record in records}.values())
+    if not rows:
+        return 0
+    stmt = sqlite_insert(SakshamSurvey)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["farmer_id", "survey_date"],
+        set_={
+            **{column: stmt.excluded[column] for column in ["farmer_name"] + SURVEY_INPUT_COLUMNS + SEED_RESULT_COLUMNS},
+            "updated_at": func.current_timestamp(),
+        },
+    )
+    with write_transaction(bind) as conn:
+        for start in range(0, len(rows), batch_size):
+            conn.execute(stmt, rows[start:start + batch_size])
+    return len(rows)
+
+def saksham_dashboard():
+    st.title("🌿 Plant Population & Seed Requirement Tool")
+    st.markdown(
+        """<hr style='margin-top: -15px; margin-bottom: 25px;'>""",
+        unsafe_allow_html=True,
+    )
+
+    with st.container():
+        st.header("🗕️ Farmer Survey Entry")
+        st.markdown(
+            "Fill in the details below to calculate how many seed packets are required for optimal plant population."
+        )
+
+        with st.form("survey_form"):
+            col0, col1, col2 = st.columns(3)
+            farmer_name = col0.text_input("👤 Farmer Name")
+            farmer_id = col1.text_input("🆔 Farmer ID")
+            state = col2.selectbox("🏝 State", list(GERMINATION_RATE_PER_ACRE))
+
+            spacing_unit = st.selectbox("📏 Spacing Unit", list(SPACING_UNITS))
+            col3, col4, col5 = st.columns(3)
+            row_spacing = col3.number_input(
+                "↔️ Row Spacing (between rows)", min_value=0.01, step=0.1
+            )
+            plant_spacing = col4.number_input(
+                "↕️ Plant Spacing (between plants)", min_value=0.01, step=0.1
+            )
+            land_acres = col5.number_input(
+                "🎾 Farm Area (acres)", min_value=0.01, step=0.1
+            )
+
+            mortality = st.slider("Mortality %", min_value=0.0, max_value=100.0, value=5.0)
+
+            submitted = st.form_submit_button("🔍 Calculate")
+
+        if submitted and farmer_name and farmer_id:
+            st.markdown("---")
+
+            results = calculate_seed_requirements(pd.DataFrame([{
+                "farmer_id": farmer_id,
+                "farmer_name": farmer_name,
+                "state": state,
+                "spacing_unit": spacing_unit,
+                "row_spacing": row_spacing,
+                "plant_spacing": plant_spacing,
+                "acres": land_acres,
+                "mortality": mortality,
+            }]))
+            result = results.iloc[0]
+            if result["issue"]:
+                st.error(f"⚠️ Cannot calculate: {result['issue']}.")
+            else:
+                st.markdown(
+                    "### <span style='font-size: 1.8rem;'>📊 Output Summary</span>",
+                    unsafe_allow_html=True,
+                )
+                col6, col7, col8, col9 = st.columns(4)
+                col6.metric("🧬 Calculated Capacity", f"{int(result['total_plants']):,} plants")
+                col7.metric("🎯 Target Plants", f"{int(result['target_plants']):,} plants")
+                col8.metric("🌱 Required Seeds", f"{int(result['required_seeds']):,} seeds")
+                col9.metric("📦 Seed Packets Needed", f"{int(result['required_packets'])} packets")
+
+                st.markdown(
+                    """<hr style='margin-top: 25px;'>""", unsafe_allow_html=True
+                )
+                st.markdown(
+                    "### <span style='font-size: 1.8rem;'>📊 Gap Filling Summary</span>",
+                    unsafe_allow_html=True,
+                )
+                col10, col11, col12 = st.columns(3)
+                col10.metric("❓ Gaps (missing plants)", f"{int(result['gaps']):,}")
+                col11.metric("💼 Seeds for Gaps", f"{int(result['gap_seeds']):,} seeds")
+                col12.metric("📦 Packets for Gap Filling", f"{int(result['gap_packets'])} packets")
+
+                st.caption(
+                    "ℹ️ Based on 5625 seeds per 450g packet. Rounded down for field practicality. Gap seeds adjusted for mortality & germination."
+                )
+
+                try:
+                    save_surveys(survey_records(results))
+                    st.success(f"Survey for farmer {farmer_id} saved for {date.today():%d %b %Y}.")
+                except Exception as e:
+                    st.error(f"Error saving survey: {e}")
+
+        elif submitted:
+            st.error("⚠️ Please enter both Farmer Name and Farmer ID to proceed.")
+
+    with st.container():
+        st.header("📥 Batch Survey Upload")
+        st.markdown(
+            "Upload a CSV or Excel file with one survey per row and the columns "
+            f"`{'`, `'.join(SURVEY_COLUMNS)}`. Optional `farmer_name` and `survey_date` columns "
+            "are saved with each survey (the date defaults to today). Mortality is a percentage."
+        )
+        survey_file = st.file_uploader("Choose a survey file", type=["csv", "xlsx"], key="saksham_survey_upload")
+        if survey_file:
+            try:
+                results = calculate_seed_requirements(read_survey_upload(survey_file))
+            except ValueError as e:
+                st.error(f"❌ Could not read survey file: {e}")
+            else:
+                show_seed_batch_results(results)
+                if st.button("💾 Save Surveys", key="saksham_save_batch"):
+                    try:
+                        saved = save_surveys(survey_records(results))
+                        st.success(f"Saved {saved:,} survey(s).")
+                    except Exception as e:
+                        st.error(f"Error saving surveys: {e}")
@@ -0,0 +1,73 @@
+"""Scheduling page."""
+import streamlit as st
+import pandas as pd
+from datetime import date, time
+
+from pmu_tracker.db import SessionLocal
+from pmu_tracker.identity import user_schedules, UserPrincipal
+from pmu_tracker.models import Schedule
+
+def scheduling(user: UserPrincipal):
+    with SessionLocal() as db:
+        st.subheader("🗓️ Employee Scheduling")
+
+        with st.form("add_schedule"):
+            schedule_date = st.date_input("Schedule Date", date.today())
+            start_time = st.time_input("Start Time", time(9, 0))
+            end_time = st.time_input("End Time", time(17, 0))
+            generate_gmeet = st.checkbox("Generate GMeet Link?")
+            gmeet_link = None
+            if generate_gmeet:
+                gmeet_link = st.text_input("GMeet Link (optional, will override auto-generated)", "https://meet.google.com/new")
+
+            if st.form_submit_button("Add Schedule"):
+                if start_time < end_time:
+                    new_schedule = Schedule(
+                        employee_id=user.id,
+                        date=schedule_date,
+                        start_time=str(start_time),
+                        end_time=str(end_time),
+                        gmeet_link=gmeet_link,
+                    )
+                    db.add(new_schedule)
+                    db.commit()
+                    st.success("Schedule added successfully!")
+                    st.rerun()
+                else:
+                    st.error("End time must be after start time.")
+
+        st.subheader("Your Schedules")
+        schedules = user_schedules(user.id)
+        if schedules:
+            schedule_data = []
+            for schedule in schedules:
+                schedule_data.append({
+                    "Date": schedule.date.strftime('%Y-%m-%d'),
+                    "Start Time": schedule.start_time,
+                    "End Time": schedule.end_time,
+                    "GMeet Link": schedule.gmeet_link if schedule.gmeet_link else "N/A"
+                })
+            schedule_df = pd.DataFrame(schedule_data)
+            st.dataframe(schedule_df, use_container_width=True)
+
+            st.markdown("---")
+            st.subheader("Manage Existing Schedules")
+            schedule_labels = {s.id: f"{s.date} {s.start_time}" for s in schedules}
+            schedule_to_delete_id = st.selectbox(
+                "Select a schedule to delete",
+                options=list(schedule_labels),
+                format_func=schedule_labels.get,
+                index=None,
+                placeholder="Select a schedule..."
+            )
+            if st.button("Delete Selected Schedule") and schedule_to_delete_id:
+                schedule_to_delete = db.get(Schedule, schedule_to_delete_id)
+                if schedule_to_delete:
+                    db.delete(schedule_to_delete)
+                    db.commit()
+                    st.success("Schedule deleted successfully!")
+                    st.rerun()
+                else:
+                    st.error("Schedule not found.")
+        else:
+            st.info("No schedules found.")
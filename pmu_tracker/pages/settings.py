@@ -0,0 +1,126 @@
+"""Settings page."""
+import streamlit as st
+
+from pmu_tracker.auth import AuthUnavailable, hash_password
+from pmu_tracker.config import REPORT_FORMATS
+from pmu_tracker.db import SessionLocal
+from pmu_tracker.identity import UserPrincipal
+from pmu_tracker.models import Employee
+
+def settings(user: UserPrincipal):
+    with SessionLocal() as db:
+        st.subheader("⚙️ Settings")
+
+        if "settings" not in st.session_state:
+            st.session_state.settings = {
+                "theme": "Light",
+                "notification": "Email",
+                "language": "English",
+                "project_timeline": "Weekly",
+                "units": "Hours",
+                "progress_metric": "% Complete",
+                "report_frequency": "Weekly",
+                "report_format": "CSV",
+                "auto_email_summary": False,
+            }
+
+        st.markdown("### User Preferences")
+        theme = st.selectbox(
+            "Theme",
+            ["Light", "Dark"],
+            index=["Light", "Dark"].index(st.session_state.settings["theme"]),
+            key="theme_select"
+        )
+        notification = st.selectbox(
+            "Notification Settings",
+            ["Email", "In-app", "None"],
+            index=["Email", "In-app", "None"].index(st.session_state.settings["notification"]),
+            key="notification_select"
+        )
+        language = st.selectbox(
+            "Language Preferences",
+            ["English", "Spanish", "French"],
+            index=["English", "Spanish", "French"].index(st.session_state.settings["language"]),
+            key="language_select"
+        )
+
+        st.markdown("### Project Preferences")
+        project_timeline = st.selectbox(
+            "Default Project Timeline",
+            ["Daily", "Weekly", "Monthly"],
+            index=["Daily", "Weekly", "Monthly"].index(st.session_state.settings["project_timeline"]),
+            key="timeline_select"
+        )
+        units = st.selectbox(
+            "Units of Measurement",
+            ["Hours", "Days", "Cost Units"],
+            index=["Hours", "Days", "Cost Units"].index(st.session_state.settings["units"]),
+            key="units_select"
+        )
+        progress_metric = st.selectbox(
+            "Default Progress Tracking Metrics",
+            ["% Complete", "Milestones"],
+            index=["% Complete", "Milestones"].index(st.session_state.settings["progress_metric"]),
+            key="progress_metric_select"
+        )
+
+        st.markdown("### Report Configuration")
+        report_frequency = st.selectbox(
+            "Default Report Frequency",
+            ["Weekly", "Bi-weekly", "Monthly"],
+            index=["Weekly", "Bi-weekly", "Monthly"].index(st.session_state.settings["report_frequency"]),
+            key="report_freq_select"
+        )
+        report_format = st.selectbox(
+            "Report Formats",
+            list(REPORT_FORMATS),
+            index=list(REPORT_FORMATS).index(st.session_state.settings["report_format"]),
+            key="report_format_select"
+        )
+        auto_email_summary = st.checkbox(
+            "Auto-email Summary", value=st.session_state.settings["auto_email_summary"], key="auto_email_checkbox"
+        )
+
+        st.markdown("### Dashboard Charts")
+        if st.button("Rebuild Cached Charts", key="rebuild_program_charts_button"):
+            from pmu_tracker.program_dashboards import clear_program_figure_cache
+            clear_program_figure_cache()
+            st.success("Program dashboard charts will be rebuilt on next view.")
+
+        st.markdown("### Change Password")
+        with st.form("change_password_form", clear_on_submit=True):
+            new_password = st.text_input("New Password", type="password")
+            confirm_password = st.text_input("Confirm New Password", type="password")
+            if st.form_submit_button("Change Password"):
+                if new_password and new_password == confirm_password:
+                    user_to_update = db.query(Employee).filter_by(id=user.id).first()
+                    if user_to_update:
+                        try:
+                            user_to_update.password = hash_password(new_password)
+                        except AuthUnavailable:
+                            st.error("Could not change the password right now. Please try again in a moment.")
+                        else:
+                            db.commit()
+                            st.success("Password changed successfully!")
+                    else:
+                        st.error("User not found.")
+                elif not new_password:
+                    st.error("New password cannot be empty.")
+                else:
+                    st.error("Passwords do not match.")
+
+        if st.button("Save Settings", key="save_settings_button"):
+            st.session_state.settings.update(
+                {
+                    "theme": theme,
+                    "notification": notification,
+                    "language": language,
+                    "project_timeline": project_timeline,
+                    "units": units,
+                    "progress_metric": progress_metric,
+                    "report_frequency": report_frequency,
+                    "report_format": report_format,
+                    "auto_email_summary": auto_email_summary,
+                }
+            )
+            st.success("Settings saved successfully!")
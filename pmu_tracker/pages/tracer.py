@@ -0,0 +1,143 @@
+"""Farmer management tracer page."""
+import streamlit as st
+
+from pmu_tracker.api_client import api_get
+
+# --- NEW: Farmer Management (Tracer) Section ---
+# FIX STARTS HERE
+def farmer_management_tracer():
+    st.title("👨‍🌾 Farmer Management (Tracer) & Activity Monitoring")
+    st.markdown("---")
+
+    st.header("Webpage Application Features")
+    st.write("Overview of data and functionalities available through the web application.")
+
+    tab_web_dashboard, tab_web_geolocation, tab_web_farmer, tab_web_bmc, tab_web_collecting, tab_web_activity = st.tabs(
+        ["Dashboard", "Geolocation", "Farmer Information", "BMC Information", "Collecting Village", "Activity Report"]
+    )
+
+    with tab_web_dashboard:
+        st.subheader("Webpage Application: Dashboard Overview")
+        st.write("This section displays key metrics and progress from the FoodSign Webpage Application Dashboard.")
+        # Simulating data from a potential GET API call for dashboard metrics
+        dashboard_data = api_get("dashboard_metrics")
+        if dashboard_data and dashboard_data["status"] == "success":
+            metrics = dashboard_data["data"]
+            st.markdown(f"**Collecting Village**: {metrics.get('collecting_village', 'N/A')}")
+            st.markdown(f"**BMC**: {metrics.get('bmc_count', 'N/A')}")
+            st.markdown(f"**Farmer**: {metrics.get('farmer_count', 'N/A')}")
+            st.markdown(f"**No. of Crops**: {metrics.get('crop_count', 'N/A')}")
+            st.markdown(f"**No. of Plots**: {metrics.get('plot_count', 'N/A')}")
+            st.markdown(f"**Mapped Plots**: {metrics.get('mapped_plots', 'N/A')}")
+            st.markdown(f"**Conventional**: {metrics.get('conventional_area', 'N/A')} ac")
+        else:
+            st.info("Could not fetch dashboard metrics from API. Displaying dummy data.")
+            st.markdown(f"**Collecting Village**: 16")
+            st.markdown(f"**BMC**: 20")
+            st.markdown(f"**Farmer**: 4083")
+            st.markdown(f"**No. of Crops**: 0")
+            st.markdown(f"**No. of Plots**: 972")
+            st.markdown(f"**Mapped Plots**: 972")
+            st.markdown(f"**Conventional**: 34.10 ac")
+
+        st.markdown("---")
+        st.markdown("#### Activity Progress")
+        activity_progress = api_get("activity_progress")
+        if activity_progress and activity_progress["status"] == "success":
+            st.json(activity_progress["data"]) # Display raw JSON for demonstration
+        else:
+            st.info("Chart data for activity progress would be displayed here (API not providing data).")
+
+        st.markdown("#### Practices Deviation")
+        practices_deviation = api_get("practices_deviation")
+        if practices_deviation and practices_deviation["status"] == "success":
+            st.json(practices_deviation["data"]) # Display raw JSON for demonstration
+        else:
+            st.info("Chart data for practices deviation would be displayed here (API not providing data).")
+
+        st.markdown("#### Total Crops (%)")
+        total_crops = api_get("total_crops_percentage")
+        if total_crops and total_crops["status"] == "success":
+            st.json(total_crops["data"]) # Display raw JSON for demonstration
+        else:
+            st.info("Chart data for total crops percentage would be displayed here (API not providing data).")
+           
+    with tab_web_geolocation:
+        st.subheader("Webpage Application: Geolocation Data")
+        st.write("View geolocation data and maps related to farmer locations and operations.")
+        st.write("Total Dairy Farm Showing: 972 / 972") # Removed
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Webpage%20%20Application%20Geolocation%202.jpg", caption="FoodSign Webpage Application Geolocation Map", use_container_width=True) # Removed
+        st.info("The map above displays locations of dairy farms.") # Removed
+
+    with tab_web_farmer:
+        st.subheader("Webpage Application: Farmer Information")
+        st.write("Access and manage detailed information about individual farmers.")
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Webpage%20%20Application%20Farmer%20Information%201.jpg", caption="Farmer List Overview", use_container_width=True)
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Webpage%20%20Application%20Farmer%20Information%202.jpg", caption="Detailed Farmer Information", use_container_width=True)
+        st.info("The images above show a list of farmers and detailed view of a selected farmer, including dairy farm map, produce, certification, input inventory, and statements.")
+
+    with tab_web_bmc:
+        st.subheader("Webpage Application: BMC Information")
+        st.write("Details regarding Bulk Milk Coolers (BMC) and associated farmers.")
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Webpage%20%20Application%20BMC%20Information%201.jpg", caption="BMC List Overview", use_container_width=True)
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Webpage%20%20Application%20BMC%20Information%202.jpg", caption="Detailed BMC Information", use_container_width=True)
+        st.info("The images above present a list of BMCs and a detailed view of a specific BMC, including total land holdings, plots, and associated farmers.")
+
+    with tab_web_collecting:
+        st.subheader("Webpage Application: Collecting Village Information")
+        st.write("Information on milk collection points and villages, including farmer and BMC counts.")
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Webpage%20%20Application%20Collecting%20Village.jpg", caption="Collecting Village Overview", use_container_width=True)
+        st.info("The image shows a list of collecting villages with details like farmer count, BMC count, and mapped area.")
+
+    with tab_web_activity:
+        st.subheader("Webpage Application: Activity Reports")
+        st.write("Detailed reports on various activities recorded in the system, including a water activity section.")
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Webpage%20%20Application%20Activity%20Report%201.jpg", caption="Activity Report Menu", use_container_width=True)
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Webpage%20%20Application%20Activity%20Report%202.jpg", caption="Daily Activity Report", use_container_width=True)
+        st.info("The images display the activity report menu and a daily activity report, which can filter by date and activity type.")
+        st.subheader("Water Activity Details")
+        st.info("This section would provide specific details and reports related to water activities.")
+
+    st.markdown("---")
+    st.header("Mobile Application: Activity & Data Entry")
+    st.write("Insights into the mobile application's dashboard and activity logging forms.")
+
+    tab_mobile_dashboard, tab_mobile_activities, tab_mobile_profile, tab_mobile_add_activity, tab_mobile_inditex, tab_mobile_water_activity = st.tabs(
+        ["Mobile Dashboard", "Activities List", "Profile", "Add New Activity", "INDITEX Activity Form", "TNS-Water Activity Form"]
+    )
+
+    with tab_mobile_dashboard:
+        st.subheader("Mobile Application: Dashboard")
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Mobile%20Application%201.jpg", caption="Mobile Dashboard", use_container_width=True)
+        st.write("The mobile dashboard shows farmer verification status and activity progress.")
+
+    with tab_mobile_activities:
+        st.subheader("Mobile Application: Activities List")
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Mobile%20Application%202.jpg", caption="Mobile Activities List", use_container_width=True)
+        st.info("This screen lists various activities such as INDITEX_Activity, SS-BMC Activity, and TNS-BMC Activity with their status.")
+
+    with tab_mobile_profile:
+        st.subheader("Mobile Application: Profile/Settings")
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Mobile%20Application%203.jpg", caption="Mobile App Profile Menu", use_container_width=True)
+        st.info("The profile section offers options like Activity Board, My Locations, Notifications, and data download functionalities.")
+
+    with tab_mobile_add_activity:
+        st.subheader("Mobile Application: Add New Activity Options")
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Mobile%20Application%204.jpg", caption="Add New Activity Options", use_container_width=True)
+        st.info("Users can select from various activity types to add, including TNS-BMC, SS-BMC, TNS-WATER, and INDITEX_ACTIVITY.")
+
+    with tab_mobile_inditex:
+        st.subheader("Mobile Application: INDITEX Activity Form")
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/INDITEX%20ACTIVITY.jpg", caption="INDITEX Activity Form 1", use_container_width=True)
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Mobile%20Application%206.jpg", caption="INDITEX Activity Form 2", use_container_width=True)
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Mobile%20Application%207.jpg", caption="INDITEX Activity Form 3", use_container_width=True)
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Mobile%20Application%208.jpg", caption="INDITEX Activity Form 4", use_container_width=True)
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Mobile%20Application%209.jpg", caption="INDITEX Activity Form 5", use_container_width=True)
+        st.info("These forms capture detailed information for INDITEX activities, including farmer details, land and crop information, and financial data.")
+
+    with tab_mobile_water_activity:
+        st.subheader("Mobile Application: TNS-Water Activity Form")
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Mobile%20Application%205.jpg", caption="TNS-Water Activity Form 1", use_container_width=True)
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Mobile%20Application%2010.jpg", caption="TNS-Water Activity Form 2", use_container_width=True)
+        st.image("https://raw.githubusercontent.com/multi-modal-gen/TRACEX/main/TRACEX%20(1).pptx/FoodSign%20Mobile%20Application%2011.jpg", caption="TNS-Water Activity Form 3", use_container_width=True)
+        st.info("These forms are used to record data related to water activities, including water quality, usage, and cost at the farm level.")
@@ -0,0 +1,93 @@
+"""Training and Google Drive pages."""
+import streamlit as st
+from pathlib import Path
+
+def training():
+    st.subheader("📚 Training Module")
+    st.write("This section provides training materials and resources.")
+
+    st.header("📤 Upload Training Content")
+    selected_program = st.selectbox(
+        "🌟 Select Program", ["Cotton", "Dairy"], key="program_dropdown"
+    )
+    selected_category = st.selectbox(
+        "📂 Select Category",
+        ["Presentations", "Videos", "Audios", "Quizzes"],
+        key="category_dropdown"
+    )
+    uploaded_file = st.file_uploader(
+        "Choose a file to upload",
+        type=["pdf", "mp4", "mp3", "json", "pptx", "xlsx", "png", "jpg", "jpeg"],
+    )
+
+    if uploaded_file:
+        if selected_program and selected_category:
+            save_dir_path = Path("training_materials") / selected_program.lower() / selected_category.lower()
+            save_dir_path.mkdir(parents=True, exist_ok=True)
+            file_path = save_dir_path / uploaded_file.name
+
+            if not is_valid_file_type(uploaded_file.name, selected_category):
+                st.error(f"❌ Invalid file type for the **{selected_category}** category.")
+            else:
+                if st.button("Upload File"):
+                    try:
+                        with open(file_path, "wb") as f:
+                            f.write(uploaded_file.getbuffer())
+                        st.success(
+                            f"✅ File '{uploaded_file.name}' uploaded successfully to {file_path}!"
+                        )
+                        st.info(f"Simulating upload of '{uploaded_file.name}' to Google Drive...")
+                    except Exception as e:
+                        st.error(f"❌ Error uploading file: {e}")
+        else:
+            st.error("Please select a program and category before uploading.")
+    else:
+        st.info("No file selected for upload.")
+
+    st.header("📂 Uploaded Training Content")
+    for program in ["Cotton", "Dairy"]:
+        for category in ["Presentations", "Videos", "Audios", "Quizzes"]:
+            folder_path = Path(f"training_materials/{program.lower()}/{category.lower()}")
+            if folder_path.exists():
+                files_in_folder = list(folder_path.iterdir())
+                if files_in_folder:
+                    st.subheader(f"{program} - {category}")
+                    for file in files_in_folder:
+                        st.markdown(f"- {file.name}")
+
+def is_valid_file_type(file_name: str, category: str) -> bool:
+    valid_extensions = {
+        "Presentations": [".pptx", ".pdf"],
+        "Videos": [".mp4", ".mov", ".avi"],
+        "Audios": [".mp3", ".wav"],
+        "Quizzes": [".xlsx", ".csv", ".json"],
+    }
+    image_extensions = [".png", ".jpg", ".jpeg", ".gif"]
+
+    file_extension = Path(file_name).suffix.lower()
+
+    if category in valid_extensions and file_extension in valid_extensions[category]:
+        return True
+    if category == "Quizzes" and file_extension in image_extensions:
+        return True
+    return False
+
+def google_drive():
+    st.subheader("Google Drive Integration (Placeholder)")
+    st.write("This section will eventually integrate with Google Drive to manage and display documents.")
+
+    if st.button("List Files (Placeholder)"):
+        st.write("Simulating listing files from Google Drive...")
+        st.markdown("- Project Documents/")
+        st.markdown("  - Report_Q1_2024.pdf")
+        st.markdown("  - Team_Meeting_Notes.docx")
+        st.markdown("- Training Resources/")
+        st.markdown("  - Onboarding_Guide.pdf")
+        st.markdown("  - Video_Tutorial_1.mp4")
+
+    st.markdown("---")
+    st.write("You can also upload files here which would then be synced to Google Drive.")
+    uploaded_file_gd = st.file_uploader("Upload file to Google Drive (Placeholder)", type=None)
+    if uploaded_file_gd:
+        st.info(f"Simulating upload of '{uploaded_file_gd.name}' to Google Drive...")
+        st.success("File uploaded to Google Drive (simulated)!")
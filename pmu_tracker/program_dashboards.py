@@ -0,0 +1,161 @@
+"""Per-program KPI dashboards rendered from the KPI store."""
+import streamlit as st
+import streamlit.components.v1 as components
+import pandas as pd
+import plotly.express as px
+import plotly.io as pio
+import json
+from typing import Dict, Any
+
+from pmu_tracker.db import SessionLocal
+from pmu_tracker.kpi_store import save_program_kpis
+from pmu_tracker.models import ProgramChart, ProgramDashboard, ProgramMetric, ProgramMetricValue
+
+# --- Program Dashboards ---
+# Figures are rebuilt from the KPI store only when its version changes; see
+# pmu_tracker.kpi_store for the tables and seeds.
+CHART_BUILDERS = {"pie": px.pie, "line": px.line, "bar": px.bar}
+
+@st.cache_data(show_spinner=False)
+def load_program_kpis(program_id: int, version: int) -> Dict[str, Any]:
+    """A program's KPI table, long-form frame and breakdown figures; ``version`` is the cache key."""
+    with SessionLocal() as db:
+        dashboard = db.get(ProgramDashboard, program_id) or ProgramDashboard()
+        cells = db.query(
+            ProgramMetric.name, ProgramMetric.position, ProgramMetric.plotted,
+            ProgramMetricValue.period, ProgramMetricValue.period_order, ProgramMetricValue.value,
+        ).outerjoin(ProgramMetricValue).filter(ProgramMetric.program_id == program_id).all()
+        charts = db.query(ProgramChart.kind, ProgramChart.spec).filter(
+            ProgramChart.program_id == program_id
+        ).order_by(ProgramChart.position).all()
+
+    period_label = dashboard.period_label or "Period"
+    cells = pd.DataFrame(cells, columns=["Metric", "position", "plotted", "period", "period_order", "value"])
+    metric_order = cells.sort_values("position")["Metric"].drop_duplicates().tolist()
+    period_order = cells.dropna(subset=["period"]).sort_values("period_order")["period"].drop_duplicates().tolist()
+    kpi_table = (
+        cells.dropna(subset=["period"]).pivot(index="Metric", columns="period", values="value")
+        .reindex(index=metric_order, columns=period_order)
+    )
+    kpi_table.columns.name = None
+    plotted_names = set(cells.loc[cells["plotted"].astype(bool), "Metric"])
+    plotted = [metric for metric in metric_order if metric in plotted_names]
+    kpi_long = (
+        kpi_table.loc[plotted].T.reset_index().rename(columns={"index": period_label})
+        .melt(id_vars=[period_label], var_name="KPI", value_name="Value")
+    )
+    # Whole-number periods display without a trailing ".0"
+    for period in kpi_table.columns:
+        values = kpi_table[period].dropna()
+        if len(values) and (values % 1 == 0).all():
+            kpi_table[period] = kpi_table[period].astype("Int64")
+    chart_json = []
+    for kind, spec in charts:
+        spec = json.loads(spec)
+        chart_json.append(CHART_BUILDERS[kind](pd.DataFrame(spec["data"]), **spec["args"]).to_json())
+
+    return {
+        "title": dashboard.title,
+        "map_url": dashboard.map_url,
+        "period_label": period_label,
+        "headlines": json.loads(dashboard.headlines or "[]"),
+        "breakdown_title": dashboard.breakdown_title,
+        "kpi_table": kpi_table,
+        "kpi_long": kpi_long,
+        "chart_json": chart_json,
+    }
+
+@st.cache_data(show_spinner=False)
+def program_kpi_figure_json(program_id: int, version: int, kpi: str) -> str:
+    data = load_program_kpis(program_id, version)
+    kpi_long = data["kpi_long"]
+    fig = px.line(
+        kpi_long[kpi_long["KPI"] == kpi],
+        x=data["period_label"],
+        y="Value",
+        title=f"{kpi} Over Time",
+        markers=True
+    )
+    return fig.to_json()
+
+def clear_program_figure_cache():
+    """Drop every cached program frame and figure so they are rebuilt on next view."""
+    for cached in (load_program_kpis, program_kpi_figure_json):
+        cached.clear()
+
+def show_kpi_editor(program_id: int, kpi_table: pd.DataFrame):
+    """Grid for editing a program's KPI table; saving replaces the stored metrics."""
+    extra_key = f"program_{program_id}_extra_periods"
+    extra_periods = st.session_state.setdefault(extra_key, [])
+    frame = kpi_table.reset_index()
+    for period in extra_periods:
+        if period not in frame.columns:
+            frame[period] = None
+
+    with st.form(f"program_{program_id}_add_period", clear_on_submit=True):
+        new_period = st.text_input("New period column (e.g. Q6, Jun)")
+        if st.form_submit_button("Add Period") and new_period.strip():
+            extra_periods.append(new_period.strip())
+            st.rerun()
+
+    with st.form(f"program_{program_id}_kpi_form"):
+        edited = st.data_editor(
+            frame,
+            key=f"program_{program_id}_kpi_editor",
+            num_rows="dynamic",
+            hide_index=True,
+            use_container_width=True,
+        )
+        if st.form_submit_button("Save KPIs"):
+            try:
+                save_program_kpis(program_id, edited)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                st.session_state[extra_key] = []
+                st.success("KPIs saved.")
+                st.rerun()
+
+def program_dashboard(program_id: int, program_name: str, version: int):
+    """Render any program's dashboard from the KPI store."""
+    data = load_program_kpis(program_id, version)
+    st.subheader(data["title"] or f"📊 {program_name} Dashboard")
+    if data["map_url"]:
+        st.markdown("### 🌍 Geographic Dashboard")
+        components.iframe(
+            src=data["map_url"],
+            height=600,
+            width=800,
+            scrolling=True,
+        )
+
+    kpi_table, kpi_long = data["kpi_table"], data["kpi_long"]
+    if kpi_table.empty:
+        st.info(f"No KPIs recorded for {program_name} yet. Add periods and metrics below.")
+    else:
+        st.subheader("Key Performance Indicators")
+        st.dataframe(kpi_table, use_container_width=True)
+
+        plotted = kpi_long["KPI"].unique()
+        if len(plotted):
+            selected_kpi = st.selectbox(
+                "Select KPI to visualize",
+                plotted,
+                key=f"program_{program_id}_kpi_select"
+            )
+            fig_json = program_kpi_figure_json(program_id, version, selected_kpi)
+            st.plotly_chart(pio.from_json(fig_json), use_container_width=True)
+
+    if data["headlines"]:
+        for column, (label, value) in zip(st.columns(len(data["headlines"])), data["headlines"]):
+            column.metric(label, value)
+
+    if data["chart_json"]:
+        st.markdown("---")
+        if data["breakdown_title"]:
+            st.subheader(data["breakdown_title"])
+        for fig_json in data["chart_json"]:
+            st.plotly_chart(pio.from_json(fig_json), use_container_width=True)
+
+    with st.expander("✏️ Edit KPIs"):
+        show_kpi_editor(program_id, kpi_table)
@@ -0,0 +1,164 @@
+"""Cached status counts and bulk status updates."""
+from sqlalchemy import event, func, inspect
+from sqlalchemy.orm import Session
+import threading
+from typing import Optional, Set, List, Dict, NamedTuple
+
+from pmu_tracker.db import SessionLocal
+from pmu_tracker.models import KanbanTask, Target, Task, WorkPlan
+
+# --- Status Count Aggregates ---
+# Per-employee work plan / target status counts come from a GROUP BY and are
+# cached in-process. Any committed insert, update or delete of a WorkPlan or
+# Target invalidates the owner's entry (see the session hooks below).
+STATUS_OPTIONS = ["Not Started", "In Progress", "Completed"]
+
+class StatusCountCache:
+    """Thread-safe cache of ``{"workplans": {status: n}, "targets": {status: n}}`` per employee."""
+
+    def __init__(self):
+        self._counts: Dict[int, Dict[str, Dict[str, int]]] = {}
+        self._generations: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, employee_id: int) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            counts = self._counts.get(employee_id)
+            generation = self._generations.get(employee_id, 0)
+        if counts is not None:
+            return counts
+
+        counts = self._load(employee_id)
+        with self._lock:
+            # Only keep the result if nothing was invalidated while it was loading.
+            if self._generations.get(employee_id, 0) == generation:
+                self._counts[employee_id] = counts
+        return counts
+
+    def invalidate(self, employee_ids):
+        with self._lock:
+            for employee_id in employee_ids:
+                self._counts.pop(employee_id, None)
+                self._generations[employee_id] = self._generations.get(employee_id, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            employee_ids = list(self._counts)
+        self.invalidate(employee_ids)
+
+    @staticmethod
+    def _load(employee_id: int) -> Dict[str, Dict[str, int]]:
+        with SessionLocal() as db:
+            workplan_rows = (
+                db.query(WorkPlan.status, func.count())
+                .filter(WorkPlan.supervisor_id == employee_id)
+                .group_by(WorkPlan.status)
+                .all()
+            )
+            target_rows = (
+                db.query(Target.status, func.count())
+                .filter(Target.employee_id == employee_id)
+                .group_by(Target.status)
+                .all()
+            )
+        return {"workplans": dict(workplan_rows), "targets": dict(target_rows)}
+
+status_counts = StatusCountCache()
+
+def _status_count_owners(obj) -> Set[int]:
+    """Employees whose counts a flushed ``obj`` affects, including its previous owner if reassigned."""
+    if isinstance(obj, WorkPlan):
+        owner_attr = "supervisor_id"
+    elif isinstance(obj, Target):
+        owner_attr = "employee_id"
+    else:
+        return set()
+    owners = {getattr(obj, owner_attr), *inspect(obj).attrs[owner_attr].history.deleted}
+    owners.discard(None)
+    return owners
+
+def _collect_status_count_owners(session, flush_context):
+    owners = session.info.setdefault("status_count_owners", set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        owners.update(_status_count_owners(obj))
+
+def _invalidate_status_counts(session):
+    owners = session.info.pop("status_count_owners", None)
+    if owners:
+        status_counts.invalidate(owners)
+
+def _discard_status_count_owners(session):
+    session.info.pop("status_count_owners", None)
+
+event.listen(SessionLocal, "after_flush", _collect_status_count_owners)
+event.listen(SessionLocal, "after_commit", _invalidate_status_counts)
+event.listen(SessionLocal, "after_rollback", _discard_status_count_owners)
+
+# --- Bulk Status Updates ---
+KANBAN_STATUSES = ["To Do", "In Progress", "Done"]
+
+class StatusChange(NamedTuple):
+    kind: str  # a key of STATUS_CHANGE_MODELS
+    id: int
+    status: str
+
+# kind -> (model, allowed statuses, owner column used for status count invalidation)
+STATUS_CHANGE_MODELS = {
+    "workplan": (WorkPlan, STATUS_OPTIONS, WorkPlan.supervisor_id),
+    "target": (Target, STATUS_OPTIONS, Target.employee_id),
+    "task": (Task, STATUS_OPTIONS, None),
+    "kanban": (KanbanTask, KANBAN_STATUSES, None),
+}
+
+def apply_status_changes(changes: List[StatusChange], db: Optional[Session] = None) -> int:
+    """Validate and apply many status changes with one executemany UPDATE per model.
+
+    Raises ValueError (and changes nothing) if any change has an unknown kind,
+    a status that kind does not allow, or an id that does not exist. When
+    ``db`` is given the updates join its transaction and the caller commits;
+    otherwise they are committed here. Returns the number of rows updated.
+    """
+    latest: Dict[str, Dict[int, str]] = {}
+    for change in changes:
+        if change.kind not in STATUS_CHANGE_MODELS:
+            raise ValueError(f"Unknown status change kind '{change.kind}'.")
+        allowed = STATUS_CHANGE_MODELS[change.kind][1]
+        if change.status not in allowed:
+            raise ValueError(f"Invalid status '{change.status}' for {change.kind} {change.id}.")
+        latest.setdefault(change.kind, {})[int(change.id)] = change.status
+
+    if not latest:
+        return 0
+
+    own_session = db is None
+    if own_session:
+        db = SessionLocal()
+    try:
+        owners = set()
+        for kind, statuses in latest.items():
+            model, _, owner_column = STATUS_CHANGE_MODELS[kind]
+            columns = [model.id] if owner_column is None else [model.id, owner_column]
+            found = db.query(*columns).filter(model.id.in_(list(statuses))).all()
+            missing = set(statuses) - {row[0] for row in found}
+            if missing:
+                raise ValueError(f"No {kind} with id(s) {sorted(missing)}.")
+            if owner_column is not None:
+                owners.update(row[1] for row in found)
+
+        for kind, statuses in latest.items():
+            model = STATUS_CHANGE_MODELS[kind][0]
+            db.bulk_update_mappings(model, [{"id": row_id, "status": status} for row_id, status in statuses.items()])
+        # Bulk updates bypass the flush hooks, so register the owners whose
+        # status counts go stale when this transaction commits.
+        db.info.setdefault("status_count_owners", set()).update(owners)
+
+        if own_session:
+            db.commit()
+    except Exception:
+        if own_session:
+            db.rollback()
+        raise
+    finally:
+        if own_session:
+            db.close()
+    return sum(len(statuses) for statuses in latest.values())
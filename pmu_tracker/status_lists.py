@@ -0,0 +1,115 @@
+"""Keyset-paged, editable status lists."""
+import streamlit as st
+from sqlalchemy.orm import Session
+import pandas as pd
+from datetime import date
+from typing import Optional, List, Dict, Tuple
+
+from pmu_tracker.db import keyset_after, keyset_order
+from pmu_tracker.status import apply_status_changes, STATUS_CHANGE_MODELS, STATUS_OPTIONS, StatusChange
+
+# --- Paginated Status Lists ---
+# Work plans and targets are listed a page at a time using keyset pagination on
+# (deadline, id), undated items first, and edited through a single data_editor grid per page, so the
+# number of widgets per rerun does not grow with the number of items. All edits
+# on a page are applied in one transaction (via apply_status_changes) when the
+# form is submitted.
+LIST_PAGE_SIZE = 25
+
+def fetch_keyset_page(db: Session, model, owner_column, owner_id: int, statuses: List[str],
+                      after: Optional[Tuple[date, int]], page_size: int = LIST_PAGE_SIZE) -> list:
+    """Return up to ``page_size + 1`` rows ordered by (deadline, id), starting after ``after``.
+
+    ``deadline`` is nullable; rows without one come first.
+    """
+    query = db.query(model).filter(owner_column == owner_id)
+    if statuses:
+        query = query.filter(model.status.in_(statuses))
+    if after is not None:
+        query = query.filter(keyset_after(model.deadline, model.id, after))
+    return query.order_by(*keyset_order(model.deadline, model.id)).limit(page_size + 1).all()
+
+def render_pager(key: str, cursors: list, next_cursor: Optional[Tuple[date, int]]):
+    """Previous/Next buttons over the ``cursors`` stack; Next is disabled without ``next_cursor``."""
+    col_prev, col_page, col_next = st.columns([1, 2, 1])
+    if col_prev.button("◀ Previous", key=f"{key}_prev", disabled=len(cursors) == 1):
+        cursors.pop()
+        st.rerun()
+    col_page.caption(f"Page {len(cursors)}")
+    if col_next.button("Next ▶", key=f"{key}_next", disabled=next_cursor is None):
+        cursors.append(next_cursor)
+        st.rerun()
+
+def status_list_editor(db: Session, key: str, kind: str, owner_id: int,
+                       columns: Dict[str, str], notes_prefix: Optional[str] = None, allow_delete: bool = False):
+    """Render one page of ``model`` rows as an editable grid with Previous/Next paging.
+
+    ``columns`` maps model attributes to read-only column labels. Status is
+    always editable; ``notes_prefix`` adds a Notes column kept in session state
+    under ``f"{notes_prefix}{id}"`` and ``allow_delete`` adds a Delete column.
+    ``kind`` is a key of STATUS_CHANGE_MODELS with an owner column.
+    """
+    model, _, owner_column = STATUS_CHANGE_MODELS[kind]
+    statuses = st.multiselect("Filter by status", STATUS_OPTIONS, key=f"{key}_status_filter")
+    cursor_key = f"{key}_cursors"
+    if st.session_state.get(f"{key}_filter") != statuses:
+        st.session_state[f"{key}_filter"] = statuses
+        st.session_state[cursor_key] = [None]
+    cursors = st.session_state[cursor_key]
+
+    rows = fetch_keyset_page(db, model, owner_column, owner_id, statuses, cursors[-1])
+    has_next = len(rows) > LIST_PAGE_SIZE
+    rows = rows[:LIST_PAGE_SIZE]
+    if not rows:
+        st.info("No items found.")
+        # Still offer Previous: this page may have emptied after it was reached.
+        render_pager(key, cursors, None)
+        return
+
+    frame = pd.DataFrame({"ID": [row.id for row in rows]})
+    for attribute, label in columns.items():
+        frame[label] = [getattr(row, attribute) for row in rows]
+    frame["Deadline"] = [row.deadline for row in rows]
+    frame["Status"] = [row.status for row in rows]
+    if notes_prefix:
+        frame["Notes"] = [st.session_state.get(f"{notes_prefix}{row.id}", "") for row in rows]
+    if allow_delete:
+        frame["Delete"] = False
+
+    with st.form(f"{key}_form"):
+        edited = st.data_editor(
+            frame,
+            key=f"{key}_editor",
+            hide_index=True,
+            use_container_width=True,
+            disabled=["ID", "Deadline", *columns.values()],
+            column_config={
+                "Status": st.column_config.SelectboxColumn("Status", options=STATUS_OPTIONS, required=True),
+                "Deadline": st.column_config.DateColumn("Deadline", format="YYYY-MM-DD"),
+            },
+        )
+        submitted = st.form_submit_button("Save Changes")
+
+    if submitted:
+        rows_by_id = {row.id: row for row in rows}
+        deleted = set(edited.loc[edited["Delete"], "ID"]) if allow_delete else set()
+        changed = edited[(edited["Status"] != frame["Status"]) & ~edited["ID"].isin(deleted)]
+        try:
+            apply_status_changes(
+                [StatusChange(kind, row_id, status) for row_id, status in zip(changed["ID"], changed["Status"])],
+                db=db,
+            )
+            for row_id in deleted:
+                db.delete(rows_by_id[row_id])
+            db.commit()
+        except ValueError as e:
+            db.rollback()
+            st.error(str(e))
+            return
+        if notes_prefix:
+            for row_id, notes in zip(edited["ID"], edited["Notes"]):
+                st.session_state[f"{notes_prefix}{row_id}"] = notes or ""
+        st.success(f"Saved {len(changed)} status change(s) and {len(deleted)} deletion(s).")
+        st.rerun()
+
+    render_pager(key, cursors, (rows[-1].deadline, rows[-1].id) if has_next else None)
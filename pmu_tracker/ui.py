@@ -0,0 +1,220 @@
+"""Page styling, notices and sidebar navigation."""
+import streamlit as st
+
+# --- Custom CSS ---
+def apply_custom_css():
+    st.markdown(
+        """
+        <style>
+            @import url('https://fonts.googleapis.com/css2?family=Newsreader:ital,wght@0,200;0,300;0,400;0,500;0,600;0,700;0,800;1,200;1,300;1,400;1,500;0,600;1,700;1,800&display=swap');
+
+            body {
+                background-image: url("https://raw.githubusercontent.com/LakshmiSomanchi/PMU-/refs/heads/main/2.png");
+                background-size: cover;
+                background-repeat: no-repeat;
+                background-attachment: fixed;
+                background-position: center;
+                font-family: 'Newsreader', serif;
+            }
+
+            .stApp {
+                background-color: rgba(255, 255, 255, 0.1);
+                font-family: 'Newsreader', serif;
+            }
+
+            section[data-testid="stSidebar"] > div:first-child {
+                position: relative;
+                padding: 20px;
+                border-radius: 0 10px 10px 0;
+                background-image: url("https://raw.githubusercontent.com/LakshmiSomanchi/PMU-/refs/heads/main/Untitled%20design%20(1).png");
+                background-size: cover;
+                background-repeat: no-repeat;
+                background-position: center;
+                color: #FFFFFF;
+                z-index: 1;
+                font-family: 'Newsreader', serif;
+            }
+
+            section[data-testid="stSidebar"] > div:first-child::before {
+                content: "";
+                position: absolute;
+                top: 0;
+                left: 0;
+                right: 0;
+                bottom: 0;
+                background: rgba(255, 255, 255, 0.5);
+                border-radius: 0 10px 10px 0;
+                z-index: -1;
+            }
+
+            h1, h2, h3, h4, h5, h6, .stRadio label {
+                color: #ffffff;
+                font-family: 'Newsreader', serif;
+            }
+
+            .streamlit-expanderHeader {
+                background-color: #dceefb;
+                border: 1px solid #cce0ff;
+                border-radius: 10px;
+                font-family: 'Newsreader', serif;
+            }
+
+            .stButton > button {
+                background-color: #0077b6;
+                color: white;
+                border-radius: 8px;
+                padding: 0.5em 1em;
+                font-family: 'Newsreader', serif;
+            }
+
+            .stButton > button:hover {
+                background-color: #0096c7;
+            }
+
+            .stDataFrame {
+                background-color: #ffffff;
+                border: 5px solid #ccc;
+                font-family: 'Newsreader', serif;
+            }
+
+            .stTabs [role="tab"] {
+                background-color: #edf6ff;
+                padding: 10px;
+                border-radius: 10px 10px 0 0;
+                margin-right: 5px;
+                border: 1px solid #b6d4fe;
+                font-family: 'Newsreader', serif;
+            }
+
+            .stTabs [role="tab"][aria-selected="true"] {
+                background-color: #0077b6;
+                color: white;
+                font-family: 'Newsreader', serif;
+            }
+
+            /* Custom CSS for the pop-up modal */
+            .popup-overlay {
+                position: fixed;
+                top: 0;
+                left: 0;
+                width: 100%;
+                height: 100%;
+                background-color: rgba(0, 0, 0, 0.7);
+                display: flex;
+                justify-content: center;
+                align-items: center;
+                z-index: 1000;
+            }
+
+            .popup-content {
+                background-color: white;
+                padding: 20px;
+                border-radius: 10px;
+                box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
+                max-width: 90%;
+                max-height: 90%;
+                overflow: auto;
+                position: relative;
+            }
+
+            .popup-close-button {
+                position: absolute;
+                top: 10px;
+                right: 10px;
+                background: none;
+                border: none;
+                font-size: 24px;
+                cursor: pointer;
+                color: #333;
+            }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+
+# --- Helper Functions for UI Components ---
+
+def display_notice():
+    st.markdown(
+        """
+        <style>
+            .notice {
+                background-color: rgba(255, 255, 255, 0.3);
+                padding: 20px;
+                border-radius: 15px;
+                font-family: 'Newsreader', serif;
+                margin-bottom: 20px;
+            }
+            .notice h2 {
+                text-align: center;
+                color: #020431;
+                margin-bottom: 15px;
+            }
+            .notice p, .notice ul {
+                color: #333;
+                line-height: 1.6;
+            }
+            .notice ul {
+                padding-left: 20px;
+            }
+            .notice li {
+                margin-bottom: 5px;
+            }
+        </style>
+        <div class="notice">
+            <h2>NOTICE & PROTOCOL FOR WORKSTREAM TRACKING PLATFORM USAGE</h2>
+            <p>Welcome to the PMU Tracker – your central hub for tracking progress, setting targets, and streamlining team alignment.</p>
+            <p>To ensure effective and consistent usage, please review and adhere to the following protocol:</p>
+            <h3>Platform Purpose</h3>
+            <p>This platform serves as a shared space for all team members to:</p>
+            <ul>
+                <li>Submit and monitor their personal and team workplans</li>
+                <li>Record progress updates</li>
+                <li>Set and review short-term targets</li>
+                <li>Access meeting links related to performance check-ins and planning</li>
+            </ul>
+            <h3>Submission Window</h3>
+            <p>Each reporting cycle will open for 5 calendar days.</p>
+            <p>All entries (targets, updates, plans) must be completed within this timeframe.</p>
+            <p>Post-deadline, the platform will be locked for submissions, allowing only view access.</p>
+            <h3>Access Protocol</h3>
+            <p>Accessible to all relevant staff during the open window</p>
+            <p>Platform access will be managed and monitored for compliance and integrity</p>
+            <h3>Meeting Coordination</h3>
+            <p>Supervisors will upload relevant meeting links and schedules directly into the platform</p>
+            <p>Individuals are expected to join these sessions as per the calendar updates</p>
+            <h3>Communication Guidelines</h3>
+            <p>Any technical issues or submission challenges should be reported within the window</p>
+            <p>Use official channels for queries to ensure swift response</p>
+            <p>We appreciate your cooperation in making this system a success. Let’s keep progress transparent, teamwork tight, and targets in sight.</p>
+            <p>For questions or support, please contact rsomanchi@tns.org.</p>
+            <p>Let the tracking begin – elegantly, efficiently, and with a touch of excellence.</p>
+            <p>On behalf of the Coordination Team</p>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+def sidebar_navigation() -> str:
+    st.sidebar.title("Navigation")
+    menu_options = {
+        "Dashboard": "dashboard",
+        "Manage Programs": "manage_programs",
+        "Reports": "reports",
+        "Employee Scheduling": "scheduling",
+        "Field Team Management": "field_team_management",
+        "Live Dashboard": "live_dashboard",
+        "SAKSHAM Dashboard": "saksham_dashboard",
+        "Farmer Management (Tracer)": "farmer_management_tracer", # Renamed tab
+        "Training": "training",
+        "Settings": "settings",
+        "Google Drive (Placeholder)": "google_drive",
+        "Team Chat": "team_chat",
+        "Email (Placeholder)": "email",
+        "Calendar": "calendar_view",
+        "Monthly Meeting": "monthly_meeting",
+        "API Test Ground": "api_test_ground", # Added new page for API testing
+        "Logout": "logout",
+    }
+    selection = st.sidebar.radio("Go to", list(menu_options.keys()))
+    return menu_options[selection]